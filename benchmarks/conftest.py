@@ -0,0 +1,117 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Define fixtures shared by the benchmarks.
+
+The benchmarks use `pytest-benchmark`_ when it is installed. Otherwise, a minimal
+``benchmark`` fixture with the same calling convention times each benchmark and
+prints a summary table at the end of the session.
+
+.. _pytest-benchmark: https://pytest-benchmark.readthedocs.io/
+"""
+
+import statistics
+import time
+
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core import mock
+
+
+@pytest.fixture(scope="session")
+def fdtd():
+    """Start an FDTD session backed by the mock engine."""
+    mock.enable()
+    try:
+        session = lumapi.FDTD(hide=True)
+    finally:
+        mock.disable()
+    yield session
+    session.close()
+
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    _results = []
+
+    class _Benchmark:
+        """Minimal stand-in for the ``benchmark`` fixture of pytest-benchmark."""
+
+        min_time = 0.05
+        max_rounds = 1000
+
+        def __init__(self, name):
+            self.name = name
+            self.extra_info = {}
+            self.times = []
+
+        def _time(self, function, args, kwargs):
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            self.times.append(time.perf_counter() - start)
+            return result
+
+        def __call__(self, function, *args, **kwargs):
+            """Call a function repeatedly for at least ``min_time`` seconds and return its result."""
+            result = function(*args, **kwargs)
+            deadline = time.perf_counter() + self.min_time
+            while len(self.times) < self.max_rounds and (time.perf_counter() < deadline or len(self.times) < 3):
+                result = self._time(function, args, kwargs)
+            return result
+
+        def pedantic(self, function, args=(), kwargs=None, setup=None, rounds=1, iterations=1, warmup_rounds=0):
+            """Call a function a fixed number of times, running ``setup`` before each round."""
+            result = None
+            for round in range(warmup_rounds + rounds):
+                if setup is not None:
+                    args, kwargs = setup() or (args, kwargs)
+                for _ in range(iterations):
+                    if round < warmup_rounds:
+                        result = function(*args, **(kwargs or {}))
+                    else:
+                        result = self._time(function, args, kwargs or {})
+            return result
+
+    @pytest.fixture
+    def benchmark(request):
+        """Time a function call."""
+        timer = _Benchmark(request.node.name)
+        yield timer
+        if timer.times:
+            _results.append(timer)
+
+    def pytest_terminal_summary(terminalreporter):
+        """Print the timings of the benchmarks."""
+        if not _results:
+            return
+        terminalreporter.write_sep("-", "benchmarks (install pytest-benchmark for statistics and comparisons)")
+        width = max(len(timer.name) for timer in _results)
+        terminalreporter.write_line("%-*s %8s %12s %12s %12s" % (width, "Name", "Rounds", "Min (us)", "Median (us)", "MB/s"))
+        for timer in _results:
+            median = statistics.median(timer.times)
+            size = timer.extra_info.get("bytes")
+            throughput = "%12.1f" % (size / median / 1e6) if size and median else "%12s" % "-"
+            terminalreporter.write_line(
+                "%-*s %8d %12.1f %12.1f %s" % (width, timer.name, len(timer.times), min(timer.times) * 1e6, median * 1e6, throughput)
+            )
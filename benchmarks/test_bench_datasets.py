@@ -0,0 +1,146 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark translation of datasets between Python and a session.
+
+- bench 01: Benchmark 'getv' and 'putv' of matrix datasets
+- bench 02: Benchmark 'getv' and 'putv' of rectilinear datasets
+- bench 03: Benchmark 'getv' and 'putv' of unstructured datasets
+- bench 04: Benchmark the per-member translation of 'getv' and 'putv' against the batched translation of 'transfer'
+- bench 05: Benchmark 'getresult' of monitor results
+"""
+
+import numpy as np
+import pytest
+
+from ansys.lumerical.core import transfer
+
+
+def _matrix_dataset(points):
+    frequency = np.linspace(1.8e14, 2.0e14, points)
+    return {
+        "f": frequency,
+        "T": np.random.default_rng(0).random(points),
+        "S": np.random.default_rng(1).random((points, 3)) + 0j,
+        "Lumerical_dataset": {"attributes": ["T", "S"], "parameters": [["f"]]},
+    }
+
+
+def _rectilinear_dataset(points):
+    return {
+        "x": np.linspace(0.0, 1e-6, points),
+        "y": np.linspace(0.0, 1e-6, points),
+        "z": np.linspace(0.0, 1e-6, 4),
+        "f": np.linspace(1.8e14, 2.0e14, 5),
+        "E": np.random.default_rng(0).random((points, points, 4, 5, 3)) + 1j,
+        "Lumerical_dataset": {"geometry": "rectilinear", "attributes": ["E"], "parameters": [["f"]]},
+    }
+
+
+def _unstructured_dataset(points, attributes):
+    rng = np.random.default_rng(0)
+    dataset = {
+        "x": rng.random(points),
+        "y": rng.random(points),
+        "z": rng.random(points),
+        "elements": np.arange(1.0, 4.0 * (points - 3) + 1).reshape(-1, 4) % points + 1,
+        "Lumerical_dataset": {"geometry": "unstructured", "attributes": [], "cell_attributes": ["volume"]},
+    }
+    for index in range(attributes):
+        dataset["attribute%d" % index] = rng.random((points, 3))
+        dataset["Lumerical_dataset"]["attributes"].append("attribute%d" % index)
+    dataset["volume"] = rng.random((points - 3, 1))
+    return dataset
+
+
+@pytest.fixture(scope="module")
+def monitors(fdtd):
+    """Run a simulation with a power monitor and a field profile monitor."""
+    fdtd.deleteall()
+    fdtd.addfdtd()
+    fdtd.addpower(name="bench_power", frequency_points=1000.0)
+    fdtd.addprofile(name="bench_profile")
+    fdtd.run()
+    yield
+    fdtd.switchtolayout()
+    fdtd.deleteall()
+
+
+def _round_trips(benchmark, fdtd, dataset, translator="member"):
+    """Benchmark a 'putv' followed by a 'getv' of a dataset."""
+    benchmark.extra_info["bytes"] = sum(value.nbytes for value in dataset.values() if isinstance(value, np.ndarray))
+
+    def round_trip():
+        if translator == "batched":
+            transfer.putv(fdtd, "bench_dataset", dataset)
+            return transfer.getv(fdtd, "bench_dataset")
+        fdtd.putv("bench_dataset", dataset)
+        return fdtd.getv("bench_dataset")
+
+    return benchmark(round_trip)
+
+
+class TestBenchDatasets:
+    """Benchmark translation of datasets between Python and a session."""
+
+    @pytest.mark.parametrize("points", [100, 100_000])
+    def test_matrix_dataset(self, benchmark, fdtd, points):
+        """Bench 01: Benchmark 'getv' and 'putv' of matrix datasets."""
+        result = _round_trips(benchmark, fdtd, _matrix_dataset(points))
+
+        assert result["S"].shape == (points, 3)
+
+    @pytest.mark.parametrize("points", [10, 100])
+    def test_rectilinear_dataset(self, benchmark, fdtd, points):
+        """Bench 02: Benchmark 'getv' and 'putv' of rectilinear datasets."""
+        result = _round_trips(benchmark, fdtd, _rectilinear_dataset(points))
+
+        assert result["E"].shape == (points, points, 4, 5, 3)
+
+    @pytest.mark.parametrize("attributes", [1, 24])
+    @pytest.mark.parametrize("points", [1_000, 100_000])
+    def test_unstructured_dataset(self, benchmark, fdtd, points, attributes):
+        """Bench 03: Benchmark 'getv' and 'putv' of unstructured datasets."""
+        result = _round_trips(benchmark, fdtd, _unstructured_dataset(points, attributes))
+
+        assert result["attribute0"].shape == (points, 3)
+
+    @pytest.mark.parametrize("translator", ["member", "batched"])
+    @pytest.mark.parametrize("dataset", ["matrix", "rectilinear", "unstructured"])
+    def test_translators(self, benchmark, fdtd, dataset, translator):
+        """Bench 04: Benchmark the per-member translation of 'getv' and 'putv' against the batched translation of 'transfer'."""
+        datasets = {
+            "matrix": lambda: _matrix_dataset(100_000),
+            "rectilinear": lambda: _rectilinear_dataset(100),
+            "unstructured": lambda: _unstructured_dataset(100_000, 24),
+        }
+        result = _round_trips(benchmark, fdtd, datasets[dataset](), translator)
+
+        assert result.keys() == datasets[dataset]().keys()
+
+    @pytest.mark.parametrize(("monitor", "result"), [("bench_power", "T"), ("bench_profile", "E")])
+    def test_getresult(self, benchmark, fdtd, monitors, monitor, result):
+        """Bench 05: Benchmark 'getresult' of monitor results."""
+        dataset = benchmark(fdtd.getresult, monitor, result)
+
+        benchmark.extra_info["bytes"] = sum(value.nbytes for value in dataset.values() if isinstance(value, np.ndarray))
+        assert dataset["Lumerical_dataset"]["attributes"] == [result]
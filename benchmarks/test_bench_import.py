@@ -0,0 +1,59 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark the time to import PyLumerical in a new interpreter.
+
+- bench 01: Benchmark 'import ansys.lumerical.core' without using a session
+- bench 02: Benchmark 'import ansys.lumerical.core' followed by the first access to a session class
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY_MODULES = ("ansys.api.lumerical.lumapi", "numpy", "scipy", "matplotlib", "autograd")
+"""Modules that must not be imported until a session class or a submodule is used."""
+
+
+def _run(code):
+    """Run Python code in a new interpreter and return its standard output."""
+    environment = dict(os.environ, PYLUMERICAL_MOCK_ENGINE="1")
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, env=environment).stdout
+
+
+@pytest.mark.parametrize(
+    "code",
+    ["import ansys.lumerical.core", "import ansys.lumerical.core as lumapi; lumapi.FDTD"],
+    ids=["import", "first_use"],
+)
+def test_import(benchmark, code):
+    """Bench 01-02: Benchmark the import of PyLumerical in a new interpreter."""
+    benchmark.pedantic(_run, args=(code,), rounds=5, warmup_rounds=1)
+
+
+def test_import_is_lazy():
+    """Check that importing PyLumerical does not import lumapi or its dependencies."""
+    loaded = _run("import sys, ansys.lumerical.core; print(' '.join(sys.modules))").split()
+
+    assert [module for module in _HEAVY_MODULES if module in loaded] == []
@@ -0,0 +1,78 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark script commands, object creation, and property access.
+
+- bench 01: Benchmark the round-trip of a script command without arguments
+- bench 02: Benchmark 'eval' of a short script
+- bench 03: Benchmark object creation with properties
+- bench 04: Benchmark 'getObjectById'
+- bench 05: Benchmark reading and writing properties of a 'SimObject'
+- bench 06: Benchmark 'getnamed' and 'setnamed'
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def rect(fdtd):
+    """Add a rectangle to read and write."""
+    fdtd.deleteall()
+    return fdtd.addrect(name="bench_rect", x=0.0, y=0.0, x_span=1e-6)
+
+
+class TestBenchObjects:
+    """Benchmark script commands, object creation, and property access."""
+
+    def test_command(self, benchmark, fdtd):
+        """Bench 01: Benchmark the round-trip of a script command without arguments."""
+        assert benchmark(fdtd.groupscope) == "::model"
+
+    def test_eval(self, benchmark, fdtd):
+        """Bench 02: Benchmark 'eval' of a short script."""
+        benchmark(fdtd.eval, "clear(bench_unused);")
+
+    def test_add_object(self, benchmark, fdtd):
+        """Bench 03: Benchmark object creation with properties."""
+        benchmark.pedantic(fdtd.addrect, kwargs={"name": "bench_added", "x": 1e-6, "y": 2e-6, "z_span": 0.22e-6}, setup=fdtd.deleteall, rounds=200)
+
+    def test_get_object(self, benchmark, fdtd, rect):
+        """Bench 04: Benchmark 'getObjectById'."""
+        assert benchmark(fdtd.getObjectById, "::model::bench_rect").name == "bench_rect"
+
+    def test_sim_object_properties(self, benchmark, rect):
+        """Bench 05: Benchmark reading and writing properties of a 'SimObject'."""
+
+        def update():
+            rect.x_span = rect.x_span * 1.0
+            return rect.x
+
+        assert benchmark(update) == 0.0
+
+    def test_named_properties(self, benchmark, fdtd, rect):
+        """Bench 06: Benchmark 'getnamed' and 'setnamed'."""
+
+        def update():
+            fdtd.setnamed("bench_rect", "y", 1e-6)
+            return fdtd.getnamed("bench_rect", "y")
+
+        assert benchmark(update) == 1e-6
@@ -0,0 +1,100 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark transfers of variables between Python and a session.
+
+- bench 01: Benchmark 'putv' and 'getv' of numbers and strings
+- bench 02: Benchmark 'putv' of arrays across sizes and data types
+- bench 03: Benchmark 'getv' of arrays across sizes and data types
+- bench 04: Benchmark 'transfer.getv' into a preallocated array
+- bench 05: Benchmark 'putv' and 'getv' of cell arrays and structs
+"""
+
+import numpy as np
+import pytest
+
+from ansys.lumerical.core import transfer
+
+SIZES = [1, 1_000, 1_000_000]
+DTYPES = [np.float64, np.complex128, np.int64]
+
+
+def _array(size, dtype):
+    return (np.arange(size) * (1 + 1j if np.dtype(dtype).kind == "c" else 1)).astype(dtype)
+
+
+class TestBenchTransfer:
+    """Benchmark transfers of variables between Python and a session."""
+
+    @pytest.mark.parametrize("value", [1.5, "Si (Silicon) - Palik"], ids=["number", "string"])
+    def test_scalar_round_trip(self, benchmark, fdtd, value):
+        """Bench 01: Benchmark 'putv' and 'getv' of numbers and strings."""
+
+        def round_trip():
+            fdtd.putv("bench_scalar", value)
+            return fdtd.getv("bench_scalar")
+
+        assert benchmark(round_trip) == value
+
+    @pytest.mark.parametrize("dtype", DTYPES, ids=lambda dtype: np.dtype(dtype).name)
+    @pytest.mark.parametrize("size", SIZES)
+    def test_putv_array(self, benchmark, fdtd, size, dtype):
+        """Bench 02: Benchmark 'putv' of arrays across sizes and data types."""
+        value = _array(size, dtype)
+        benchmark.extra_info["bytes"] = value.nbytes
+
+        benchmark(fdtd.putv, "bench_array", value)
+
+    @pytest.mark.parametrize("dtype", DTYPES, ids=lambda dtype: np.dtype(dtype).name)
+    @pytest.mark.parametrize("size", SIZES)
+    def test_getv_array(self, benchmark, fdtd, size, dtype):
+        """Bench 03: Benchmark 'getv' of arrays across sizes and data types."""
+        value = _array(size, dtype)
+        fdtd.putv("bench_array", value)
+        benchmark.extra_info["bytes"] = value.nbytes
+
+        result = benchmark(fdtd.getv, "bench_array")
+
+        np.testing.assert_array_equal(result.ravel(), value)
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_getv_out(self, benchmark, fdtd, size):
+        """Bench 04: Benchmark 'transfer.getv' into a preallocated array."""
+        value = np.arange(float(size)).reshape(-1, 1)
+        fdtd.putv("bench_array", value)
+        out = np.empty_like(value)
+        benchmark.extra_info["bytes"] = value.nbytes
+
+        benchmark(transfer.getv, fdtd, "bench_array", out=out)
+
+        np.testing.assert_array_equal(out, value)
+
+    @pytest.mark.parametrize("size", [10, 1_000])
+    def test_containers(self, benchmark, fdtd, size):
+        """Bench 05: Benchmark 'putv' and 'getv' of cell arrays and structs."""
+        value = {"names": ["object %d" % i for i in range(size)], "values": [float(i) for i in range(size)]}
+
+        def round_trip():
+            fdtd.putv("bench_struct", value)
+            return fdtd.getv("bench_struct")
+
+        assert benchmark(round_trip)["names"][-1] == "object %d" % (size - 1)
@@ -20,28 +20,58 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-"""Set up the imports for PyLumerical."""
+"""Set up the imports for PyLumerical.
 
-import importlib.abc
+Importing the package is cheap: the submodules, the names re-exported from ``lumapi``,
+and the discovery of the Lumerical installation are loaded on first use (:pep:`562`).
+The first access to a session class such as ``FDTD``, to a submodule, or the first
+import of ``lumapi`` or ``lumopt2`` configures the installation for the process.
+"""
+
+import importlib
 import importlib.util
 import os
 from pathlib import Path
 import sys
+import threading
 import warnings
 
-import ansys.api.lumerical
-import ansys.api.lumerical.lumapi as _ansys_lumapi_module
-
-# Make common names from lumapi available in the top-level namespace
-from ansys.api.lumerical.lumapi import DEVICE, FDTD, INTERCONNECT, MODE, InteropPaths, SimObject, SimObjectId, SimObjectResults
-
 from . import autodiscovery
 
+_LUMAPI_MODULE_NAME = "ansys.api.lumerical.lumapi"
+
+_LAZY_ATTRIBUTES = {
+    "DEVICE": (_LUMAPI_MODULE_NAME, "DEVICE"),
+    "FDTD": (_LUMAPI_MODULE_NAME, "FDTD"),
+    "INTERCONNECT": (_LUMAPI_MODULE_NAME, "INTERCONNECT"),
+    "MODE": (_LUMAPI_MODULE_NAME, "MODE"),
+    "InteropPaths": (_LUMAPI_MODULE_NAME, "InteropPaths"),
+    "SimObject": (_LUMAPI_MODULE_NAME, "SimObject"),
+    "SimObjectId": (_LUMAPI_MODULE_NAME, "SimObjectId"),
+    "SimObjectResults": (_LUMAPI_MODULE_NAME, "SimObjectResults"),
+    "SessionPool": (__name__ + ".pool", "SessionPool"),
+    "batch": (__name__ + ".script_batch", "batch"),
+    "map_sessions": (__name__ + ".sweep", "map_sessions"),
+    "map_versions": (__name__ + ".sweep", "map_versions"),
+}
+"""Names of the package that are imported from other modules on first access."""
+
+_LAZY_SUBMODULES = ("aio", "caching", "jobs", "mock", "optimization", "profiling", "result_cache", "results", "transfer", "tree", "workers")
+"""Submodules that are imported on first access as attributes of the package."""
+
+__all__ = ["autodiscovery", *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES]
+
 _INSTALL_NOT_FOUND_MESSAGE = (
     "Lumerical installation not found. Set the LUMERICAL_HOME environment variable "
     "or call InteropPaths.setLumericalInstallPath() to configure the path manually."
 )
 
+_BOOTSTRAP_STATE_VARIABLE = "PYLUMERICAL_WORKER_STATE"
+"""Environment variable through which worker processes inherit the bootstrap state of their parent."""
+
+_PRELOADED_MODULES = ("lumopt2",)
+"""Modules that worker processes import up front when their parent has imported them."""
+
 __version__ = "0.4.dev0"
 """Lumerical API version."""
 
@@ -54,16 +84,21 @@ def _normalize_path(path):
     return normalized_path
 
 
+def _lumapi():
+    """Return the ``ansys.api.lumerical.lumapi`` module, importing it if needed."""
+    return importlib.import_module(_LUMAPI_MODULE_NAME)
+
+
 def _resolve_lumerical_install_dir():
     """Resolve and configure the Lumerical installation directory."""
-    install_dir = _ansys_lumapi_module.InteropPaths.LUMERICALINSTALLDIR
+    install_dir = _lumapi().InteropPaths.LUMERICALINSTALLDIR
     if len(install_dir) == 0:
         install_dir = autodiscovery.locate_lumerical_install()
         if install_dir is not None:
-            _ansys_lumapi_module.InteropPaths.setLumericalInstallPath(install_dir)
+            _lumapi().InteropPaths.setLumericalInstallPath(install_dir)
         else:
-            # stacklevel=3 attributes the warning to the module body that calls
-            # _bootstrap_lumerical_environment() at import time, instead of this helper.
+            # stacklevel=3 attributes the warning to the caller of
+            # _bootstrap_lumerical_environment() instead of this helper.
             warnings.warn(_INSTALL_NOT_FOUND_MESSAGE, stacklevel=3)
     return install_dir
 
@@ -105,14 +140,15 @@ def _validate_lumopt2_origin(bundled_lumopt2_package_dir):
 
 def _bind_lumapi_alias():
     """Ensure top-level ``lumapi`` resolves to ``ansys.api.lumerical.lumapi``."""
+    ansys_lumapi_module = _lumapi()
     existing_lumapi_module = sys.modules.get("lumapi")
     if existing_lumapi_module is None:
-        sys.modules["lumapi"] = _ansys_lumapi_module
+        sys.modules["lumapi"] = ansys_lumapi_module
         return
 
-    if existing_lumapi_module is not _ansys_lumapi_module:
+    if existing_lumapi_module is not ansys_lumapi_module:
         existing_path = getattr(existing_lumapi_module, "__file__", "<unknown>")
-        expected_path = getattr(_ansys_lumapi_module, "__file__", "<unknown>")
+        expected_path = getattr(ansys_lumapi_module, "__file__", "<unknown>")
         raise RuntimeError(
             "A different 'lumapi' module is already loaded "
             f"({existing_path}). PyLumerical requires {expected_path}. "
@@ -120,7 +156,7 @@ def _bind_lumapi_alias():
         )
 
 
-class _BundledLumopt2Finder(importlib.abc.MetaPathFinder):
+class _BundledLumopt2Finder:
     """Resolve the top-level ``lumopt2`` package to the bundled Lumerical location.
 
     Only the top-level ``lumopt2`` package is handled here. The returned spec sets
@@ -167,6 +203,10 @@ def _install_bundled_lumopt2_finder(bundled_lumopt2_package_dir):
 
 def _bootstrap_lumerical_environment():
     """Bootstrap Lumerical interop paths and module aliases."""
+    inherited_state = _inherited_bootstrap_state()
+    if inherited_state is not None:
+        _apply_bootstrap_state(inherited_state)
+        return
     install_dir = _resolve_lumerical_install_dir()
     if install_dir is not None:
         bundled_lumopt2_package_dir = _get_bundled_lumopt2_package_dir(install_dir)
@@ -174,6 +214,175 @@ def _bootstrap_lumerical_environment():
             _validate_lumopt2_origin(bundled_lumopt2_package_dir)
             _install_bundled_lumopt2_finder(bundled_lumopt2_package_dir)
     _bind_lumapi_alias()
+    _install_mock_engine()
+
+
+def _install_mock_engine():
+    """Let sessions use the mock engine if it is requested, without importing it otherwise."""
+    if autodiscovery._is_mock_engine_requested() or _lumapi().InteropPaths.LUMERICALINSTALLDIR == autodiscovery._MOCK_INSTALL_PATH:
+        importlib.import_module(__name__ + ".mock").install()
+
+
+def _capture_bootstrap_state(install_dir=None):
+    """Return the configuration of this process that worker processes apply instead of searching for it.
+
+    The state is a dictionary that can be serialized to JSON. ``install_dir`` replaces the
+    installation configured in this process.
+    """
+    _ensure_bootstrapped()
+    if install_dir is None:
+        install_dir = _lumapi().InteropPaths.LUMERICALINSTALLDIR
+    return {
+        "install_dir": install_dir or None,
+        "lumopt2_dir": _get_bundled_lumopt2_package_dir(install_dir) if install_dir else None,
+        "lumapi_alias": sys.modules.get("lumapi") is _lumapi(),
+        "modules": [name for name in _PRELOADED_MODULES if name in sys.modules],
+    }
+
+
+def _apply_bootstrap_state(state):
+    """Configure this process from the state captured by :func:`_capture_bootstrap_state`, without searching for the installation.
+
+    Sessions opened afterwards start the product of the captured installation. Sessions that
+    are already open keep running on the installation they were started with.
+    """
+    if state["install_dir"] is not None:
+        _lumapi().InteropPaths.setLumericalInstallPath(state["install_dir"])
+    if state["lumopt2_dir"] is not None:
+        _validate_lumopt2_origin(state["lumopt2_dir"])
+        _install_bundled_lumopt2_finder(state["lumopt2_dir"])
+    if state["lumapi_alias"]:
+        _bind_lumapi_alias()
+    _install_mock_engine()
+
+
+def _inherited_bootstrap_state():
+    """Return the bootstrap state that a parent process exported to the environment, if any."""
+    serialized_state = os.environ.get(_BOOTSTRAP_STATE_VARIABLE)
+    if not serialized_state:
+        return None
+    import json
+
+    return json.loads(serialized_state)
+
+
+_bootstrap_lock = threading.RLock()
+_bootstrapped = False
+
+
+def _bootstrap_once():
+    """Bootstrap the Lumerical environment unless it has already been done in this process."""
+    global _bootstrapped
+    with _bootstrap_lock:
+        if _bootstrapped:
+            return
+        # Set the flag first: the bootstrap imports modules that import lumapi again.
+        _bootstrapped = True
+        try:
+            _bootstrap_lumerical_environment()
+        except BaseException:
+            _bootstrapped = False
+            raise
+
+
+def _ensure_bootstrapped():
+    """Import ``lumapi`` and bootstrap the Lumerical environment if needed."""
+    if _bootstrapped:
+        return
+    # Import lumapi before taking the bootstrap lock, which its import takes as well, so
+    # that the import lock of lumapi is always acquired first.
+    _lumapi()
+    _bootstrap_once()
+
+
+class _BootstrappingLoader:
+    """Load ``ansys.api.lumerical.lumapi`` with another loader, then bootstrap the environment."""
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def create_module(self, spec):
+        """Create the module with the wrapped loader."""
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        """Execute the module with the wrapped loader, then bootstrap the environment."""
+        self._loader.exec_module(module)
+        _bootstrap_once()
+
+    def __getattr__(self, name):
+        """Forward other loader methods, such as ``get_resource_reader``, to the wrapped loader."""
+        return getattr(self._loader, name)
+
+
+class _AliasLoader:
+    """Load the top-level ``lumapi`` module as an alias of ``ansys.api.lumerical.lumapi``."""
+
+    def create_module(self, spec):
+        """Bootstrap the environment, which binds the alias, and return the aliased module."""
+        _ensure_bootstrapped()
+        return _lumapi()
+
+    def exec_module(self, module):
+        """Do nothing, since the aliased module is already executed."""
+
+
+class _LazyBootstrapFinder:
+    """Bootstrap the Lumerical environment when ``lumapi`` or ``lumopt2`` is first imported.
+
+    Until the bootstrap has run, importing ``ansys.api.lumerical.lumapi`` runs it right
+    after the module is executed, so code that uses ``lumapi`` directly still finds the
+    installation. The top-level ``lumapi`` and ``lumopt2`` imports that the bootstrap
+    makes available trigger it as well. Afterwards, the finder returns ``None`` for
+    every module.
+    """
+
+    def find_spec(self, fullname, path, target=None):
+        """Return a spec that bootstraps the environment for the modules that need it."""
+        if _bootstrapped:
+            return None
+        if fullname == "lumapi":
+            return importlib.util.spec_from_loader(fullname, _AliasLoader())
+        if fullname == "lumopt2":
+            _ensure_bootstrapped()
+            for finder in sys.meta_path:
+                if isinstance(finder, _BundledLumopt2Finder):
+                    return finder.find_spec(fullname, path, target)
+            return None
+        if fullname == _LUMAPI_MODULE_NAME:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None:
+                        spec.loader = _BootstrappingLoader(spec.loader)
+                    return spec
+        return None
+
+
+def __getattr__(name):
+    """Import the lazily loaded names of the package on first access."""
+    if name in _LAZY_SUBMODULES:
+        _ensure_bootstrapped()
+        return importlib.import_module(__name__ + "." + name)
+    if name in _LAZY_ATTRIBUTES:
+        _ensure_bootstrapped()
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module_name), attribute)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List the names of the package, including the lazily loaded ones."""
+    return sorted(set(globals()) | set(__all__))
 
 
-_bootstrap_lumerical_environment()
+if _LUMAPI_MODULE_NAME in sys.modules:
+    # lumapi was imported before PyLumerical, for example to set the installation path,
+    # so there is nothing left to defer.
+    _ensure_bootstrapped()
+elif not any(isinstance(finder, _LazyBootstrapFinder) for finder in sys.meta_path):
+    sys.meta_path.insert(0, _LazyBootstrapFinder())
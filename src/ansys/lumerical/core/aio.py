@@ -0,0 +1,266 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Drive Lumerical sessions from an asyncio event loop."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+
+from .pool import _get_product_class
+
+
+def _close_late_session(future):
+    """Close the session started by a call to :meth:`AsyncLumerical.start` that was abandoned."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class AsyncLumerical:
+    """Asyncio wrapper around a Lumerical session.
+
+    Every call runs on a worker thread dedicated to the session, so a single event loop
+    can drive many sessions concurrently, for example by running a simulation in one
+    session while getting results from another. Calls on the same session run one at a
+    time, in the order they were made.
+
+    The ``eval``, ``run``, ``getv``, ``putv``, and ``getresult`` methods are documented
+    below. Any other method of the session, including script commands, is available as
+    a coroutine function with the same name and arguments.
+
+    Every method accepts a ``timeout`` keyword argument in seconds. When a call times out
+    or the awaiting task is cancelled, calls that have not started yet are cancelled. A
+    call that is already running in the product cannot be interrupted and keeps the
+    session busy until it finishes. Close the session to abandon it.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to wrap. The session must not be used directly while it is wrapped.
+
+    See Also
+    --------
+    :meth:`start` : Start a new session without blocking the event loop.
+
+    Examples
+    --------
+    Run two simulations concurrently and get their results.
+
+    >>> import asyncio
+    >>> from ansys.lumerical.core import aio
+    >>> async def simulate(filename):
+    ...     async with await aio.AsyncLumerical.start("fdtd", filename=filename) as fdtd:
+    ...         await fdtd.run(timeout=3600)
+    ...         return await fdtd.getresult("monitor", "T")
+    >>> async def main():
+    ...     return await asyncio.gather(simulate("a.fsp"), simulate("b.fsp"))
+    >>> results = asyncio.run(main())
+    """
+
+    def __init__(self, session):
+        self._session = session
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lumerical-session")
+        self._closed = False
+
+    @classmethod
+    async def start(cls, product="fdtd", hide=True, timeout=None, **session_kwargs):
+        """Start a session on a new worker thread and wrap it.
+
+        Parameters
+        ----------
+        product : str, default: "fdtd"
+            Product to start. Options are ``"fdtd"``, ``"mode"``, ``"device"``, and ``"interconnect"``.
+        hide : bool, default: True
+            Whether to hide the product GUI.
+        timeout : float, optional
+            Time in seconds to wait for the session to start.
+        **session_kwargs : dict, optional
+            Additional keyword arguments passed to the session constructor.
+
+        Returns
+        -------
+        AsyncLumerical
+            Wrapped session.
+        """
+        session_class = _get_product_class(product)
+        # Start the session on the thread that later makes all calls to it.
+        wrapper = cls(None)
+        future = wrapper._executor.submit(functools.partial(session_class, hide=hide, **session_kwargs))
+        try:
+            wrapper._session = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except BaseException:
+            wrapper._closed = True
+            # A constructor that is already running cannot be interrupted, so close the
+            # session it returns once it finishes.
+            future.add_done_callback(_close_late_session)
+            wrapper._executor.shutdown(wait=False)
+            raise
+        return wrapper
+
+    @property
+    def session(self):
+        """Wrapped session. Only use it from inside calls made through :meth:`call`."""
+        return self._session
+
+    @property
+    def closed(self):
+        """Whether the session was closed."""
+        return self._closed
+
+    async def call(self, fn, *args, timeout=None, **kwargs):
+        """Call a function on the worker thread of the session.
+
+        Parameters
+        ----------
+        fn : callable
+            Function called as ``fn(session, *args, **kwargs)``. Use it to run several
+            steps without returning to the event loop in between.
+        *args : any
+            Positional arguments passed to ``fn``.
+        timeout : float, optional
+            Time in seconds to wait for the call to finish.
+        **kwargs : any
+            Keyword arguments passed to ``fn``.
+
+        Returns
+        -------
+        any
+            Return value of ``fn``.
+
+        Raises
+        ------
+        TimeoutError
+            If the call does not finish within ``timeout``.
+        RuntimeError
+            If the session was closed.
+        """
+        if self._closed:
+            raise RuntimeError("Session is closed.")
+        future = asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(fn, self._session, *args, **kwargs))
+        return await asyncio.wait_for(future, timeout)
+
+    def __getattr__(self, name):
+        """Return a coroutine function that calls a method of the session on the worker thread."""
+        if name.startswith("_"):
+            raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+
+        async def method(*args, timeout=None, **kwargs):
+            # Look the method up on the worker thread, since the session can synchronize
+            # user functions with the product when an attribute is accessed.
+            return await self.call(lambda session: getattr(session, name)(*args, **kwargs), timeout=timeout)
+
+        method.__name__ = name
+        return method
+
+    async def eval(self, code, timeout=None):
+        """Evaluate Lumerical script code.
+
+        Parameters
+        ----------
+        code : str
+            Lumerical script code.
+        timeout : float, optional
+            Time in seconds to wait for the code to finish.
+        """
+        return await self.call(lambda session: session.eval(code), timeout=timeout)
+
+    async def run(self, *args, timeout=None):
+        """Run the simulation.
+
+        Parameters
+        ----------
+        *args : any
+            Arguments of the ``run`` script command.
+        timeout : float, optional
+            Time in seconds to wait for the simulation to finish.
+        """
+        return await self.call(lambda session: session.run(*args), timeout=timeout)
+
+    async def getv(self, varname, timeout=None):
+        """Get a variable from the script workspace.
+
+        Parameters
+        ----------
+        varname : str
+            Name of the variable.
+        timeout : float, optional
+            Time in seconds to wait for the transfer to finish.
+
+        Returns
+        -------
+        any
+            Value of the variable.
+        """
+        return await self.call(lambda session: session.getv(varname), timeout=timeout)
+
+    async def putv(self, varname, value, timeout=None):
+        """Put a variable into the script workspace.
+
+        Parameters
+        ----------
+        varname : str
+            Name of the variable.
+        value : any
+            Value of the variable.
+        timeout : float, optional
+            Time in seconds to wait for the transfer to finish.
+        """
+        return await self.call(lambda session: session.putv(varname, value), timeout=timeout)
+
+    async def getresult(self, *args, timeout=None):
+        """Get a result of a simulation object.
+
+        Parameters
+        ----------
+        *args : str
+            Arguments of the ``getresult`` script command, for example the object name and
+            the result name.
+        timeout : float, optional
+            Time in seconds to wait for the transfer to finish.
+
+        Returns
+        -------
+        any
+            Result, or the list of result names if only the object name is given.
+        """
+        return await self.call(lambda session: session.getresult(*args), timeout=timeout)
+
+    async def close(self):
+        """Close the session and stop its worker thread.
+
+        The session is closed after the calls that were already made finish. New calls
+        raise :class:`RuntimeError`.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        future = asyncio.get_running_loop().run_in_executor(self._executor, self._session.close)
+        self._executor.shutdown(wait=False)
+        await future
+
+    async def __aenter__(self):
+        """Return the wrapped session."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close the session."""
+        await self.close()
@@ -22,6 +22,7 @@
 
 """Autodiscover the Lumerical installation directory."""
 
+import json
 import os
 from pathlib import Path
 import platform
@@ -32,6 +33,257 @@ __min_supported_lum_release__ = {"year": 22, "release": 1}
 Supports Lumerical 2022R1 release and later.
 """
 
+# The mock engine settings live here rather than in the mock module, so that
+# autodiscovery does not import lumapi and NumPy.
+_MOCK_ENGINE_VARIABLE = "PYLUMERICAL_MOCK_ENGINE"
+_MOCK_INSTALL_PATH = "mock://lumerical"
+_TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+def _is_mock_engine_requested():
+    """Return whether the environment variable enables the mock engine."""
+    return os.environ.get(_MOCK_ENGINE_VARIABLE, "").strip().lower() in _TRUE_VALUES
+
+
+_CACHE_DIR_VARIABLE = "PYLUMERICAL_CACHE_DIR"
+_MANIFEST_NAME = "installs.json"
+_MANIFEST_FORMAT = 1
+
+_PRODUCT_BINARIES = {"fdtd": "fdtd-solutions", "mode": "mode-solutions", "device": "device", "interconnect": "interconnect"}
+"""Names of the launchers of each product in the ``bin`` directory of an installation."""
+
+_VERSION_PATTERN = re.compile(r"^v?(?:20)?(\d{2})(?:\.|\s*r)?(\d)$", re.IGNORECASE)
+
+
+class LumericalInstall:
+    """Lumerical installation found by :func:`find_lumerical_installs`.
+
+    Parameters
+    ----------
+    path : str
+        Installation directory, which contains the ``bin`` and ``api`` directories.
+    version : tuple of int
+        Two-digit year and release number, such as ``(25, 2)`` for 2025 R2.
+    api_python_path : str or None
+        Directory of the bundled Python API, or ``None`` if it does not exist.
+    binaries : dict of str to str
+        Launcher of each installed product, keyed by ``"fdtd"``, ``"mode"``,
+        ``"device"``, or ``"interconnect"``.
+    """
+
+    def __init__(self, path, version, api_python_path=None, binaries=None):
+        self.path = str(path)
+        self.version = tuple(version)
+        self.api_python_path = api_python_path
+        self.binaries = dict(binaries or {})
+
+    @property
+    def name(self):
+        """Version folder name, such as ``v252``."""
+        return "v%02d%d" % self.version
+
+    @property
+    def release(self):
+        """Release name, such as ``2025 R2``."""
+        return "20%02d R%d" % self.version
+
+    def __eq__(self, other):
+        """Return whether two objects describe the same installation."""
+        return isinstance(other, LumericalInstall) and self._to_json() == other._to_json()
+
+    def __hash__(self):
+        """Return a hash of the directory and version, so that installations can be dictionary keys."""
+        return hash((self.path, self.version))
+
+    def __repr__(self):
+        """Return the release and directory of the installation."""
+        return "<LumericalInstall %s at %s>" % (self.release, self.path)
+
+    def _to_json(self):
+        return {"path": self.path, "version": list(self.version), "api_python_path": self.api_python_path, "binaries": self.binaries}
+
+    @classmethod
+    def _from_json(cls, data):
+        return cls(data["path"], data["version"], data["api_python_path"], data["binaries"])
+
+
+def _parse_version(version):
+    """Return the ``(year, release)`` tuple of a version such as ``"v252"``, ``"2025 R2"``, ``"25.2"``, or ``(25, 2)``."""
+    if isinstance(version, (tuple, list)):
+        year, release = version
+        return int(year) % 100, int(release)
+    match = _VERSION_PATTERN.match(str(version).strip())
+    if match is None:
+        raise ValueError("Invalid Lumerical version '%s'. Use a version such as 'v252', '2025 R2', or (25, 2)." % (version,))
+    return int(match.group(1)), int(match.group(2))
+
+
+def _user_cache_dir():
+    """Return the directory that stores the PyLumerical caches of the user."""
+    if os.environ.get(_CACHE_DIR_VARIABLE):
+        return Path(os.environ[_CACHE_DIR_VARIABLE])
+    if platform.system() == "Windows":
+        return Path(os.environ.get("LOCALAPPDATA", Path("~/AppData/Local").expanduser()), "pylumerical", "cache")
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path("~/.cache").expanduser(), "pylumerical")
+
+
+def _search_roots():
+    """Return the directories that contain Lumerical installations, with the subdirectory of each version folder."""
+    if platform.system() == "Windows":
+        return [["C:\\Program Files\\Lumerical\\", ""], ["C:\\Program Files\\Ansys Inc\\", "Lumerical"]]
+    if platform.system() == "Linux":
+        return [["/opt/lumerical/", ""], [str(Path("~/Ansys/ansys_inc/").expanduser()), "Lumerical"]]
+    raise RuntimeError("Unsupported operating system. Only Windows and Linux are supported.")
+
+
+def _mtime(path):
+    """Return the modification time of a path in nanoseconds, or ``None`` if it does not exist."""
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _scan_installs(roots):
+    """Search the version folders of the search roots for installations."""
+    extension = ".exe" if platform.system() == "Windows" else ""
+    minimum = (__min_supported_lum_release__["year"], __min_supported_lum_release__["release"])
+    installs = []
+    for base, suffix in roots:
+        if not Path(base).is_dir():
+            continue
+        for candidate_dir in Path(base).iterdir():
+            match = re.match(r"v(\d{2})(\d)", candidate_dir.name)
+            install_dir = Path(candidate_dir, suffix)
+            # The api/python directory avoids some false positives from uninstalls
+            if match is None or not install_dir.is_dir() or not Path(install_dir, "api", "python").is_dir():
+                continue
+            version = (int(match.group(1)), int(match.group(2)))
+            if version < minimum:
+                continue
+            binaries = {}
+            for product, binary in _PRODUCT_BINARIES.items():
+                binary_path = Path(install_dir, "bin", binary + extension)
+                if binary_path.is_file():
+                    binaries[product] = str(binary_path)
+            installs.append(LumericalInstall(str(install_dir), version, get_lumerical_api_python_path(install_dir), binaries))
+    return sorted(installs, key=lambda install: install.version, reverse=True)
+
+
+def _read_manifest(manifest_path, roots):
+    """Return the cached installations, or ``None`` if the manifest is missing or outdated."""
+    try:
+        with manifest_path.open() as file:
+            manifest = json.load(file)
+        if manifest["format"] != _MANIFEST_FORMAT or manifest["roots"] != [[base, suffix, _mtime(base)] for base, suffix in roots]:
+            return None
+        installs = [LumericalInstall._from_json(data) for data in manifest["installs"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    # Updating or removing an installation changes its directory, but not always the search root.
+    if any(_mtime(install.path) != mtime for install, mtime in zip(installs, manifest["mtimes"])):
+        return None
+    return installs
+
+
+def _write_manifest(manifest_path, roots, installs):
+    """Write the installations found in the search roots to the manifest, ignoring errors."""
+    manifest = {
+        "format": _MANIFEST_FORMAT,
+        "roots": [[base, suffix, _mtime(base)] for base, suffix in roots],
+        "installs": [install._to_json() for install in installs],
+        "mtimes": [_mtime(install.path) for install in installs],
+    }
+    temporary = manifest_path.with_name("%s.%d.tmp" % (manifest_path.name, os.getpid()))
+    try:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with temporary.open("w") as file:
+            json.dump(manifest, file, indent=1)
+        temporary.replace(manifest_path)
+    except OSError:
+        temporary.unlink(missing_ok=True)
+
+
+def find_lumerical_installs(refresh=False):
+    r"""Find all supported Lumerical installations in the default installation paths.
+
+    The result is cached in the ``installs.json`` manifest under the user cache
+    directory, which is ``$XDG_CACHE_HOME/pylumerical`` or ``~/.cache/pylumerical`` on
+    Linux and ``%LOCALAPPDATA%\pylumerical\cache`` on Windows, unless the
+    ``PYLUMERICAL_CACHE_DIR`` environment variable sets another directory. The cache is
+    valid until the modification time of a search directory or of a cached installation
+    changes, so later calls only check these times instead of searching the directories.
+
+    Parameters
+    ----------
+    refresh : bool, default: False
+        Whether to search the directories even if the cache is valid.
+
+    Returns
+    -------
+    list of LumericalInstall
+        Installations of Lumerical |supported_lum_release| or later that include the
+        Python API, newest first.
+
+    Raises
+    ------
+    RuntimeError
+        If the operating system is not Windows or Linux.
+
+    Examples
+    --------
+    List the installed releases.
+
+    >>> from ansys.lumerical.core import autodiscovery
+    >>> [install.release for install in autodiscovery.find_lumerical_installs()]
+    ['2025 R2', '2024 R2']
+    """
+    roots = _search_roots()
+    manifest_path = Path(_user_cache_dir(), _MANIFEST_NAME)
+    installs = None if refresh else _read_manifest(manifest_path, roots)
+    if installs is None:
+        installs = _scan_installs(roots)
+        _write_manifest(manifest_path, roots, installs)
+    return installs
+
+
+def get_lumerical_install(version=None, refresh=False):
+    """Return the installation of a Lumerical release.
+
+    Parameters
+    ----------
+    version : str or tuple of int, optional
+        Release to find, such as ``"v252"``, ``"2025 R2"``, ``"25.2"``, or ``(25, 2)``.
+        The default is the newest installed release.
+    refresh : bool, default: False
+        Whether to search the directories even if the cache of
+        :func:`find_lumerical_installs` is valid.
+
+    Returns
+    -------
+    LumericalInstall or None
+        Installation of the release, or ``None`` if it is not installed.
+
+    Raises
+    ------
+    ValueError
+        If the version is not a valid Lumerical release.
+
+    Examples
+    --------
+    Use Lumerical 2024 R2 even if a newer release is installed.
+
+    >>> import ansys.api.lumerical.lumapi
+    >>> from ansys.lumerical.core import autodiscovery
+    >>> install = autodiscovery.get_lumerical_install("v242")
+    >>> ansys.api.lumerical.lumapi.InteropPaths.setLumericalInstallPath(install.path)
+    """
+    wanted = None if version is None else _parse_version(version)
+    for install in find_lumerical_installs(refresh):
+        if wanted is None or install.version == wanted:
+            return install
+    return None
+
 
 def get_lumerical_api_python_path(lumerical_install_dir):
     """Get the Python API directory for a Lumerical installation.
@@ -76,10 +328,13 @@ def locate_lumerical_install():
 
     Notes
     -----
+        - Returns the path of the mock engine if the PYLUMERICAL_MOCK_ENGINE environment variable is set to 1.
+          See :mod:`ansys.lumerical.core.mock`.
         - Checks the LUMERICAL_HOME environment variable first. If set and valid, uses it.
         - On Windows, the function first searches the registry, then searches under "C:\\Program Files\\Lumerical\\" and
           "C:\\Program Files\\Ansys Inc\\Lumerical".
         - On Linux, the function searches under "/opt/lumerical/" and "~/Ansys/ansys_inc/Lumerical".
+        - The installations found in these directories are cached. See :func:`find_lumerical_installs`.
 
     Examples
     --------
@@ -115,6 +370,10 @@ def locate_lumerical_install():
     """
     lumerical_install_dir = None
 
+    # Sessions started by the mock engine do not need an installation
+    if _is_mock_engine_requested():
+        return _MOCK_INSTALL_PATH
+
     # Check for environment variable first
     env_install_dir = os.environ.get("LUMERICAL_HOME")
     if env_install_dir and Path(env_install_dir).exists():
@@ -131,30 +390,10 @@ def locate_lumerical_install():
                     return install_folder
         except (FileNotFoundError, OSError):
             pass
-        # if not found in the registry, try to guess the installation path
-        guess_base_and_suffix = [["C:\\Program Files\\Lumerical\\", ""], ["C:\\Program Files\\Ansys Inc\\", "Lumerical"]]
-    elif platform.system() == "Linux":
-        guess_base_and_suffix = [["/opt/lumerical/", ""], [str(Path("~/Ansys/ansys_inc/").expanduser()), "Lumerical"]]
-    else:
-        raise RuntimeError("Unsupported operating system. Only Windows and Linux are supported.")
-
-    # Find the latest installed version that is >= the required version
-    latest_ver_year = __min_supported_lum_release__["year"]
-    latest_ver_release = __min_supported_lum_release__["release"]
-
-    for guess_base, suffix in guess_base_and_suffix:
-        if Path(guess_base).exists():
-            for candidate_dir in Path(guess_base).iterdir():
-                if Path(candidate_dir, suffix).is_dir():
-                    match = re.match(r"v(\d{2})(\d)", candidate_dir.name)
-                    if match:
-                        ver_year = int(match.group(1))
-                        ver_maj = int(match.group(2))
-                        if ver_year > latest_ver_year or (ver_year == latest_ver_year and ver_maj >= latest_ver_release):
-                            latest_ver_year = ver_year
-                            latest_ver_release = ver_maj
-                            # check to make sure the api/python path is there (avoids some false positives from uninstalls)
-                            if Path(candidate_dir, suffix, "api/python/").exists():
-                                lumerical_install_dir = str(Path(candidate_dir, suffix))
+
+    # If not found in the registry, use the latest installed version that is >= the required version
+    installs = find_lumerical_installs()
+    if installs:
+        lumerical_install_dir = installs[0].path
 
     return lumerical_install_dir
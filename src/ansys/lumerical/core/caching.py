@@ -0,0 +1,417 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Cache simulation object properties and results on the Python side of a session."""
+
+import functools
+import threading
+import types
+import weakref
+
+import ansys.api.lumerical.lumapi as lumapi
+
+from .transfer import _internal_name, _script_string
+from .tree import _GROUP_TYPES
+
+_RESULT_COMMANDS = ("eval", "feval", "load", "loaddata", "run", "runanalysis", "runsweep", "switchtolayout")
+"""Session methods after which cached results are discarded."""
+
+_READ_ONLY_PREFIXES = ("get", "have")
+_READ_ONLY_COMMANDS = (
+    "close",
+    "groupscope",
+    "putv",
+    "select",
+    "selectall",
+    "selectpartial",
+    "shiftselect",
+    "shiftselectpartial",
+    "unselectall",
+    "workspace",
+)
+"""Session methods that do not change properties. Every other method discards cached property values."""
+
+
+class _SessionState:
+    """Counters that advance whenever the results or the properties of a session can change."""
+
+    def __init__(self):
+        self.results = 0
+        self.properties = 0
+        self.tracks_properties = False
+        self.schemas = {}
+
+
+_session_states = weakref.WeakKeyDictionary()
+_session_states_lock = threading.Lock()
+
+
+def _advancing(function, state, counters):
+    """Wrap a session method so that it advances state counters of the session."""
+
+    @functools.wraps(function)
+    def method(self, *args, **kwargs):
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            for counter in counters:
+                setattr(state, counter, getattr(state, counter) + 1)
+
+    return method
+
+
+def _install_hooks(session, state, names):
+    """Replace session methods with wrappers that advance the state counters."""
+    for name in names:
+        function = getattr(type(session), name, None)
+        if not callable(function):
+            continue
+        counters = ("results", "properties") if name in _RESULT_COMMANDS else ("properties",)
+        setattr(session, name, types.MethodType(_advancing(function, state, counters), session))
+
+
+def _is_mutating(name):
+    """Return whether a session method can change the properties of simulation objects."""
+    return not (name.startswith("_") or name.startswith(_READ_ONLY_PREFIXES) or name in _READ_ONLY_COMMANDS)
+
+
+def _get_session_state(session, track_properties=False):
+    """Return the state counters of a session, installing the invalidation hooks on first use."""
+    with _session_states_lock:
+        state = _session_states.get(session)
+        if state is None:
+            state = _SessionState()
+            _install_hooks(session, state, _RESULT_COMMANDS)
+            _session_states[session] = state
+        if track_properties and not state.tracks_properties:
+            _install_hooks(session, state, [name for name in dir(type(session)) if _is_mutating(name)])
+            state.tracks_properties = True
+        return state
+
+
+class CachedSimObjectResults(lumapi.SimObjectResults):
+    """Results of a simulation object that are fetched on first access and then cached.
+
+    This object behaves like :class:`ansys.lumerical.core.SimObjectResults`, except that
+    each result is transferred from the session only the first time it is read. The list
+    of result names is cached as well. The cache is discarded automatically after the
+    ``run``, ``runanalysis``, ``runsweep``, ``switchtolayout``, ``load``, ``loaddata``,
+    ``eval``, and ``feval`` methods of the session are called, since these can change the
+    results.
+
+    Cached arrays are returned by reference, so copy them before modifying them in place.
+    Changes made to the session through other clients, or through another Python object
+    connected to the same session, are not detected. Call :meth:`invalidate` in that case.
+
+    Parameters
+    ----------
+    parent : :class:`ansys.lumerical.core.SimObject`
+        Simulation object whose results are cached.
+
+    See Also
+    --------
+    :func:`cache_results` : Replace the results of a simulation object with a cached version.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        # Keep the simulation object alive, so that the results can be used on their own.
+        self._sim_object = parent
+        self._state = _get_session_state(parent._parent)
+        self._generation = self._state.results
+        self._names = None
+        self._values = {}
+
+    def invalidate(self):
+        """Discard all cached results and result names."""
+        self._generation = self._state.results
+        self._names = None
+        self._values = {}
+
+    def prefetch(self, names=None):
+        """Transfer several results from the session at once and cache them.
+
+        Parameters
+        ----------
+        names : list of str, optional
+            Names of the results to load. Underscores can be used in place of spaces.
+            By default, all results of the simulation object are loaded.
+
+        Raises
+        ------
+        AttributeError
+            If the simulation object has no result with one of the names.
+        LumApiError
+            If the results cannot be read.
+        """
+        names = self._result_names() if names is None else [self._resolve(name) for name in names]
+        missing = [name for name in dict.fromkeys(names) if name not in self._values]
+        if not missing:
+            return
+
+        sim_object = self._sim_object
+        session = sim_object._parent
+        vname = _internal_name("results")
+        code = "%s = cell(%d);\n" % (vname, len(missing))
+        for i, name in enumerate(missing):
+            code += "%s{%d} = getresult(%s, %s);\n" % (vname, i + 1, _script_string(sim_object._id.name), _script_string(name))
+
+        # Evaluate through the module function, because the eval method of the session
+        # invalidates the cache.
+        try:
+            lumapi.evalScript(session.handle, code, True)
+            values = session.getv(vname)
+        finally:
+            lumapi.evalScript(session.handle, "clear(%s);" % vname)
+        self._values.update(zip(missing, values))
+
+    def _validate(self):
+        """Discard the cache if the session state changed since it was filled."""
+        if self._generation != self._state.results:
+            self.invalidate()
+
+    def _result_names(self):
+        """Return the cached list of result names."""
+        self._validate()
+        if self._names is None:
+            sim_object = self._sim_object
+            try:
+                names = sim_object._parent.getresult(sim_object._id.name)
+            except lumapi.LumApiError:
+                names = ""
+            self._names = [name for name in names.split("\n") if name]
+        return self._names
+
+    def _resolve(self, name):
+        """Return the result name matching an attribute name."""
+        names = self._result_names()
+        for candidate in (name, name.replace("_", " ")):
+            if candidate in names:
+                return candidate
+        raise AttributeError("'SimObjectResults' object has no attribute '%s'" % name)
+
+    def __dir__(self):
+        """Return the attributes of the object, including the cached result names."""
+        return dir(super(lumapi.SimObjectResults, self)) + self._result_names()
+
+    def __getattr__(self, name):
+        """Return a result, transferring it from the session on first access."""
+        if name.startswith("_"):
+            raise AttributeError("'SimObjectResults' object has no attribute '%s'" % name)
+        name = self._resolve(name)
+        if name not in self._values:
+            sim_object = self._sim_object
+            self._values[name] = sim_object._parent.getresult(sim_object._id.name, name)
+        return self._values[name]
+
+    def __setattr__(self, name, value):
+        """Prevent results from being overwritten."""
+        if name[0] != "_" and name in self._result_names():
+            raise lumapi.LumApiError("Attribute '%s' can not be set" % name)
+        object.__setattr__(self, name, value)
+
+
+def cache_results(sim_object):
+    """Replace the results of a simulation object with a lazily cached version.
+
+    Analysis code that reads the same results repeatedly, for example ``results.x`` inside
+    a loop, then transfers each result only once per simulation run.
+
+    Parameters
+    ----------
+    sim_object : :class:`ansys.lumerical.core.SimObject`
+        Simulation object whose ``results`` attribute is replaced.
+
+    Returns
+    -------
+    CachedSimObjectResults
+        New ``results`` attribute of the simulation object.
+
+    Examples
+    --------
+    Load the monitor position and field in one transfer and reuse them across iterations.
+
+    >>> from ansys.lumerical.core import caching
+    >>> monitor = fdtd.getObjectById("field_monitor")
+    >>> results = caching.cache_results(monitor)
+    >>> results.prefetch(["x", "y", "E"])
+    >>> for index in range(100):
+    ...     field = results.E["E"][:, :, 0, index, :]
+    ...     x, y = results.x, results.y
+    """
+    sim_object.results = CachedSimObjectResults(sim_object)
+    return sim_object.results
+
+
+def _uses_shared_schema(type_name):
+    """Return whether all objects of a type have the same properties.
+
+    Groups can have user properties, so their properties are read for every object.
+    """
+    return type_name not in _GROUP_TYPES
+
+
+class CachedSimObject(lumapi.SimObject):
+    """Simulation object that caches its property names and values.
+
+    This object behaves like :class:`ansys.lumerical.core.SimObject`, with two caches
+    that reduce the number of round-trips to the session when many objects are inspected:
+
+    - The property names of each object type are read once per session and shared by all
+      objects of that type, so ``dir`` and attribute lookups do not query the session.
+      Groups can have user properties, so their property names are read for every group.
+    - Property values are cached after they are first read. Setting a property through
+      the object writes it to the session and caches the value as written.
+
+    Cached values are discarded when any session method that can change properties is
+    called, which is every script command except those that only read data or change the
+    selection, such as ``get``, ``getnamed``, ``select``, and ``groupscope``. Changes made
+    to the session through other clients are not detected. Properties accessed through
+    nested attributes, such as ``obj.material_settings.xyz``, are not cached. Results are
+    cached as described in :class:`CachedSimObjectResults`.
+
+    .. warning::
+
+        Don't initialize this class directly. Use :func:`enable_property_cache` instead.
+
+    Parameters
+    ----------
+    parent : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session that contains the object.
+    id : str
+        Object ID of the simulation object.
+    strict : bool, default: False
+        Whether to read property values from the session on every access. Property names
+        are still cached.
+    """
+
+    def __init__(self, parent, id, strict=False):
+        self._parent = parent
+        self._id = lumapi.SimObjectId(id)
+        self._strict = strict
+        self._state = _get_session_state(parent, track_properties=True)
+        self._generation = self._state.properties
+        self._values = {}
+
+        count, type_name = self._introspect()
+        if self._id.index > count:
+            raise lumapi.LumApiError("Object %s not found" % id)
+        if count > 1:
+            lumapi.lumWarning("Multiple objects named '%s'. Use of this object may give unexpected results." % self._id.name)
+
+        property_names = self._state.schemas.get(type_name)
+        if property_names is None:
+            property_names = parent.getnamed(self._id.name).split("\n")
+            if _uses_shared_schema(type_name):
+                self._state.schemas[type_name] = property_names
+        self._nameMap = self.build_nested(property_names)
+        self.results = CachedSimObjectResults(self)
+
+    def _introspect(self):
+        """Return the number of objects with the name of this object and its type in a single round-trip."""
+        vname = _internal_name("introspect")
+        name = _script_string(self._id.name)
+        code = '%s = cell(2);\n%s{1} = getnamednumber(%s);\n%s{2} = "";\n' % (vname, vname, name, vname)
+        code += 'if(%s{1} >= %d){ %s{2} = getnamed(%s, "type", %d); }\n' % (vname, self._id.index, vname, name, self._id.index)
+        try:
+            lumapi.evalScript(self._parent.handle, code, True)
+            count, type_name = self._parent.getv(vname)
+        finally:
+            lumapi.evalScript(self._parent.handle, "clear(%s);" % vname)
+        return int(count), type_name
+
+    def _resolve(self, name):
+        """Return the property name matching an attribute name."""
+        if name not in self._nameMap:
+            name = name.replace("_", " ")
+            if name not in self._nameMap:
+                raise AttributeError("'SimObject' object has no attribute '%s'" % name)
+        return name
+
+    def _validate(self):
+        """Discard cached values if the session state changed since they were read."""
+        if self._generation != self._state.properties:
+            self._generation = self._state.properties
+            self._values = {}
+
+    def invalidate(self):
+        """Discard all cached property values and results."""
+        self._values = {}
+        self.results.invalidate()
+
+    def __getattr__(self, name):
+        """Return a property, reading it from the session if it is not cached."""
+        if name.startswith("_"):
+            raise AttributeError("'SimObject' object has no attribute '%s'" % name)
+        name = self._resolve(name)
+        if isinstance(self._nameMap[name], lumapi.GetSetHelper) or self._strict:
+            return super().__getattr__(name)
+        self._validate()
+        if name not in self._values:
+            self._values[name] = self._parent.getnamed(self._id.name, self._nameMap[name], self._id.index)
+        return self._values[name]
+
+    def __setattr__(self, name, value):
+        """Set a property in the session and cache the value as written."""
+        if (name[0] == "_") or (name == "results"):
+            return object.__setattr__(self, name, value)
+        result = super().__setattr__(name, value)
+        if not self._strict:
+            self._validate()
+            self._values[self._resolve(name)] = value
+        return result
+
+
+def enable_property_cache(session, strict=False):
+    """Return simulation objects that cache their properties from a session.
+
+    After this function is called, the ``getObjectById``, ``getObjectBySelection``, and
+    ``getAllSelectedObjects`` methods of the session, the methods that add objects, and
+    the ``getParent`` and ``getChildren`` methods of simulation objects return
+    :class:`CachedSimObject` instances. Walking a large object tree then reads the
+    property names of each object type only once and each property value only once
+    until the project changes.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to enable the cache for.
+    strict : bool, default: False
+        Whether to read property values from the session on every access, for strict
+        consistency with changes made outside of Python. Property names are still cached.
+
+    Examples
+    --------
+    Sum the volume of all rectangles in a project.
+
+    >>> from ansys.lumerical.core import caching
+    >>> caching.enable_property_cache(fdtd)
+    >>> fdtd.selectall()
+    >>> volume = sum(obj.x_span * obj.y_span * obj.z_span for obj in fdtd.getAllSelectedObjects() if obj.type == "Rectangle")
+    """
+    _get_session_state(session, track_properties=True)
+
+    def getObjectById(self, id):  # noqa: N802
+        i = id if id.startswith("::") else self.groupscope() + "::" + id
+        return CachedSimObject(self, i, strict=strict)
+
+    session.getObjectById = types.MethodType(functools.wraps(type(session).getObjectById)(getObjectById), session)
@@ -0,0 +1,236 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Run simulations in the background and monitor their progress."""
+
+from concurrent.futures import Future
+import os
+from pathlib import Path
+import re
+import threading
+
+import ansys.api.lumerical.lumapi as lumapi
+
+_PROGRESS_PATTERN = re.compile(rb"(\d+(?:\.\d+)?)% complete")
+_LOG_TAIL_BYTES = 4096
+
+
+def _default_log_file(session):
+    """Return the solver log file of the project open in a session, or ``None`` if it has not been saved."""
+    try:
+        filename = session.currentfilename()
+    except lumapi.LumApiError:
+        return None
+    if not filename:
+        return None
+    path = Path(filename)
+    return path.with_name(path.stem + "_p0.log")
+
+
+def _read_progress(log_file):
+    """Return the last progress percentage written to a solver log file as a fraction, or ``None``."""
+    try:
+        with Path(log_file).open("rb") as log:
+            log.seek(0, os.SEEK_END)
+            log.seek(max(log.tell() - _LOG_TAIL_BYTES, 0))
+            matches = _PROGRESS_PATTERN.findall(log.read())
+    except OSError:
+        return None
+    return float(matches[-1]) / 100 if matches else None
+
+
+class RunJob:
+    """Handle to a simulation that runs in the background.
+
+    The ``run`` method of the session is called on a background thread. The session must
+    not be used until the job is done.
+
+    .. warning::
+
+        Don't initialize this class directly. Use :func:`run_async` instead.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to run the simulation in.
+    args : tuple
+        Arguments of the ``run`` script command.
+    log_file : str or Path, optional
+        Solver log file to read the progress from.
+    """
+
+    def __init__(self, session, args=(), log_file=None):
+        self._session = session
+        self._log_file = log_file
+        self._future = Future()
+        self._terminated = False
+        self._thread = threading.Thread(target=self._run, args=args, name="lumerical-run", daemon=True)
+        self._future.set_running_or_notify_cancel()
+        self._thread.start()
+
+    def _run(self, *args):
+        """Run the simulation and store the outcome."""
+        try:
+            result = self._session.run(*args)
+        except BaseException as error:
+            self._future.set_exception(lumapi.LumApiError("Simulation was terminated") if self._terminated else error)
+        else:
+            self._future.set_result(result)
+
+    @property
+    def session(self):
+        """Session that runs the simulation."""
+        return self._session
+
+    def done(self):
+        """Return whether the simulation finished, failed, or was terminated."""
+        return self._future.done()
+
+    def progress(self):
+        """Return the progress of the simulation.
+
+        The progress is read from the solver log file, which is written by products such as
+        FDTD while the simulation runs.
+
+        Returns
+        -------
+        float or None
+            Fraction of the simulation that is complete, between 0 and 1. ``1.0`` once the
+            simulation finished successfully, and ``None`` if the progress is unknown.
+        """
+        if self._future.done() and self._future.exception() is None:
+            return 1.0
+        return None if self._log_file is None else _read_progress(self._log_file)
+
+    def wait(self, timeout=None):
+        """Wait for the simulation to finish.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time in seconds to wait. By default, wait until the simulation finishes.
+
+        Returns
+        -------
+        bool
+            Whether the simulation finished within ``timeout``.
+        """
+        self._thread.join(timeout)
+        return self._future.done()
+
+    def result(self, timeout=None):
+        """Wait for the simulation to finish and return the value returned by ``run``.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time in seconds to wait. By default, wait until the simulation finishes.
+
+        Raises
+        ------
+        TimeoutError
+            If the simulation does not finish within ``timeout``.
+        LumApiError
+            If the simulation failed or was terminated.
+        """
+        return self._future.result(timeout)
+
+    def add_done_callback(self, fn):
+        """Call a function once the simulation finishes, fails, or is terminated.
+
+        The function is called with the job as its only argument, on the background
+        thread, or immediately if the job is already done.
+
+        Parameters
+        ----------
+        fn : callable
+            Function to call.
+        """
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def terminate(self, timeout=None):
+        """Stop the simulation by closing the session.
+
+        The interop API cannot interrupt a running command, so the connection to the
+        product is closed instead, which ends the solver. The session cannot be used
+        afterwards.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time in seconds to wait for the background thread to stop after the session
+            is closed. By default, wait until it stops.
+
+        Raises
+        ------
+        TimeoutError
+            If the background thread does not stop within ``timeout``, for example because
+            the interop call does not return. The job is not done in this case.
+        """
+        if self._future.done():
+            return
+        self._terminated = True
+        try:
+            self._session.close()
+        except lumapi.LumApiError:
+            pass
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise TimeoutError("The simulation did not stop within %s seconds after the session was closed" % timeout)
+
+
+def run_async(session, *args, log_file=None):
+    """Start a simulation without blocking and return a handle to monitor it.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to run the simulation in. The session must not be used until the job is done.
+    *args : any
+        Arguments of the ``run`` script command.
+    log_file : str or Path, optional
+        Solver log file to read the progress from. By default, this is the
+        ``<project>_p0.log`` file next to the project file, which FDTD writes while a
+        simulation runs. Progress is unknown for projects that have not been saved.
+
+    Returns
+    -------
+    RunJob
+        Handle to the running simulation.
+
+    Examples
+    --------
+    Run two simulations side by side and stop the slower one.
+
+    >>> from ansys.lumerical.core import jobs
+    >>> job_a = jobs.run_async(fdtd_a)
+    >>> job_b = jobs.run_async(fdtd_b)
+    >>> job_a.add_done_callback(lambda job: print("A finished"))
+    >>> if not job_a.wait(timeout=600) or not job_b.wait(timeout=0):
+    ...     progress = job_b.progress()
+    ...     if progress is not None:
+    ...         print(f"B is {progress:.0%} complete, terminating it")
+    ...     job_b.terminate()
+    """
+    if log_file is None:
+        log_file = _default_log_file(session)
+    return RunJob(session, args, log_file)
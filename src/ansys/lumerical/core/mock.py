@@ -0,0 +1,1637 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Run sessions against a pure-Python mock engine instead of a Lumerical product.
+
+The mock engine replaces the interop library that ``lumapi`` loads, so sessions
+created with :class:`ansys.api.lumerical.lumapi.FDTD` and the other session classes
+work without a Lumerical installation or license. Values are marshalled through the
+same ``ctypes`` structures as the real library. The engine evaluates a subset of the
+Lumerical scripting language, keeps an object tree for
+:class:`ansys.api.lumerical.lumapi.SimObject`, and returns deterministic results for
+monitors after ``run``.
+
+The mock engine is used when the ``PYLUMERICAL_MOCK_ENGINE`` environment variable is
+set to ``1``, or when the installation path is set to :data:`MOCK_INSTALL_PATH`, for
+example with :func:`enable`.
+"""
+
+import copy
+from ctypes import POINTER, addressof, c_char, c_double, c_ulonglong, cast, create_string_buffer, string_at
+from functools import lru_cache
+import json
+import math
+from pathlib import Path
+import re
+
+import numpy as np
+
+import ansys.api.lumerical.lumapi as lumapi
+
+from .autodiscovery import _MOCK_ENGINE_VARIABLE, _MOCK_INSTALL_PATH, _is_mock_engine_requested
+
+ENVIRONMENT_VARIABLE = _MOCK_ENGINE_VARIABLE
+"""Environment variable that enables the mock engine when set to ``1``."""
+
+MOCK_INSTALL_PATH = _MOCK_INSTALL_PATH
+"""Installation path that selects the mock engine."""
+
+_NULL = "d6d8d1b2c083c251"
+"""String that represents a missing value in the script workspace, as in ``lumapi.appCall``."""
+
+_SPEED_OF_LIGHT = 299792458.0
+
+_PROJECT_EXTENSIONS = {"fdtd": ".fsp", "mode": ".lms", "device": ".ldev", "interconnect": ".icp"}
+
+_FIELD_POINTS = 10
+"""Number of points along each axis spanned by a monitor in field results."""
+
+_POSITION = {"x": 0.0, "y": 0.0, "z": 0.0}
+_STRUCTURE = dict(_POSITION, material="<Object defined dielectric>", index=1.4)
+_MONITOR = dict(
+    _POSITION,
+    **{
+        "monitor type": "2D Z-normal",
+        "override global monitor settings": 0.0,
+        "x span": 5e-6,
+        "y span": 5e-6,
+        "z span": 0.0,
+        "frequency points": 5.0,
+    },
+)
+_SOURCE = dict(_POSITION, **{"x span": 5e-6, "y span": 5e-6, "injection axis": "z-axis", "wavelength start": 1.5e-6, "wavelength stop": 1.6e-6})
+_REGION = dict(_POSITION, **{"x span": 5e-6, "y span": 5e-6, "z span": 5e-6, "mesh accuracy": 2.0, "simulation time": 1e-12})
+_REGION.update(("%s %s bc" % (axis, side), "PML") for axis in "xyz" for side in ("min", "max"))
+_REGION["same settings on all boundaries"] = 1.0
+
+_OBJECT_KINDS = {
+    "rect": ("rectangle", "Rectangle", dict(_STRUCTURE, **{"x span": 1e-6, "y span": 1e-6, "z span": 1e-6})),
+    "circle": ("circle", "Circle", dict(_STRUCTURE, radius=1e-6, **{"z span": 1e-6})),
+    "sphere": ("sphere", "Sphere", dict(_STRUCTURE, radius=1e-6)),
+    "poly": (
+        "polygon",
+        "Polygon",
+        dict(_STRUCTURE, vertices=np.array([[-0.5, -0.5], [0.5, -0.5], [0.5, 0.5], [-0.5, 0.5]]) * 1e-6, **{"z span": 1e-6}),
+    ),
+    "group": ("group", "Layout Group", dict(_POSITION)),
+    "structuregroup": ("structure group", "Structure Group", dict(_POSITION)),
+    "analysisgroup": ("analysis group", "Analysis Group", dict(_POSITION)),
+    "assemblygroup": ("assembly group", "Assembly Group", dict(_POSITION)),
+    "fdtd": ("FDTD", "FDTD", dict(_REGION, dimension="3D")),
+    "varfdtd": ("varFDTD", "varFDTD", dict(_REGION)),
+    "fde": ("FDE", "FDE", dict(_REGION, **{"solver type": "2D X normal"})),
+    "mesh": ("mesh", "Mesh", dict(_POSITION, **{"x span": 1e-6, "y span": 1e-6, "z span": 1e-6, "dx": 1e-8, "dy": 1e-8, "dz": 1e-8})),
+    "dftmonitor": ("monitor", "DFTMonitor", dict(_MONITOR)),
+    "power": ("monitor", "DFTMonitor", dict(_MONITOR)),
+    "profile": ("monitor", "DFTMonitor", dict(_MONITOR)),
+    "gaussian": ("source", "GaussianSource", dict(_SOURCE)),
+    "plane": ("source", "PlaneSource", dict(_SOURCE)),
+    "mode": ("source", "ModeSource", dict(_SOURCE)),
+    "dipole": ("source", "DipoleSource", dict(_POSITION, **{"wavelength start": 1.5e-6, "wavelength stop": 1.6e-6})),
+}
+"""Object types that ``add<kind>`` commands create, with their default name, type, and properties."""
+
+_SOLVER_KINDS = ("fdtd", "varfdtd")
+
+
+class _ScriptError(Exception):
+    """Error raised by a script command or statement."""
+
+
+class _Break(Exception):  # noqa: N818
+    """Leave the innermost ``for`` loop."""
+
+
+# Parsing of scripts. Statements and expressions are represented by tuples whose first
+# element is the kind of node. Statements end with the line number they start on.
+
+_TOKEN = re.compile(
+    r"(?P<skip>[ \t\r]+|#[^\n]*)|(?P<newline>\n)"
+    r"|(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?i?)"
+    r"|(?P<string>\"[^\"]*\"|'[^']*')"
+    r"|(?P<name>[A-Za-z_]\w*)"
+    r"|(?P<op>==|!=|<=|>=|&&|\|\||[-+*/^<>=!~&|:;,(){}\[\].?])"
+)
+
+_COMPARISONS = ("==", "!=", "<", ">", "<=", ">=")
+
+
+def _tokenize(code):
+    """Split a script into ``(kind, text, line)`` tokens."""
+    tokens = []
+    line = 1
+    position = 0
+    while position < len(code):
+        match = _TOKEN.match(code, position)
+        if match is None:
+            raise _ScriptError("prompt line %d: syntax error, unexpected character '%s'" % (line, code[position]))
+        kind = match.lastgroup
+        if kind == "newline":
+            line += 1
+        elif kind != "skip":
+            tokens.append((kind, match.group(), line))
+        position = match.end()
+    tokens.append(("end", "", line))
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser for the supported subset of the scripting language."""
+
+    def __init__(self, code):
+        self._tokens = _tokenize(code)
+        self._position = 0
+
+    def _peek(self, offset=0):
+        return self._tokens[min(self._position + offset, len(self._tokens) - 1)]
+
+    def _next(self):
+        token = self._tokens[self._position]
+        self._position += 1
+        return token
+
+    def _at(self, text, offset=0):
+        kind, token_text, _ = self._peek(offset)
+        return kind in ("op", "name") and token_text == text
+
+    def _accept(self, text):
+        if self._at(text):
+            self._position += 1
+            return True
+        return False
+
+    def _expect(self, text):
+        if not self._accept(text):
+            kind, token_text, line = self._peek()
+            raise _ScriptError("prompt line %d: syntax error, expected '%s' but found '%s'" % (line, text, token_text or "end of script"))
+
+    def _end_statement(self):
+        if not self._accept(";") and not (self._at("}") or self._peek()[0] == "end"):
+            self._expect(";")
+
+    def program(self):
+        """Parse all statements of the script."""
+        statements = []
+        while self._peek()[0] != "end":
+            statement = self._statement()
+            if statement is not None:
+                statements.append(statement)
+        return statements
+
+    def _block(self):
+        if not self._accept("{"):
+            statement = self._statement()
+            return [] if statement is None else [statement]
+        statements = []
+        while not self._accept("}"):
+            if self._peek()[0] == "end":
+                self._expect("}")
+            statement = self._statement()
+            if statement is not None:
+                statements.append(statement)
+        return statements
+
+    def _statement(self):
+        kind, text, line = self._peek()
+        if self._accept(";"):
+            return None
+        if kind == "name" and text in ("if", "for", "try", "break", "clear"):
+            return getattr(self, "_statement_" + text)(line)
+        if self._accept("?"):
+            expression = self._expression()
+            self._end_statement()
+            return ("print", expression, line)
+        statement = self._simple_statement(line)
+        self._end_statement()
+        return statement
+
+    def _simple_statement(self, line):
+        expression = self._expression()
+        if self._accept("="):
+            return ("assign", self._target(expression, line), self._expression(), line)
+        return ("expr", expression, line)
+
+    def _statement_if(self, line):
+        self._next()
+        self._expect("(")
+        condition = self._expression()
+        self._expect(")")
+        body = self._block()
+        orelse = []
+        if self._accept("else"):
+            orelse = [self._statement_if(self._peek()[2])] if self._at("if") else self._block()
+        return ("if", condition, body, orelse, line)
+
+    def _statement_for(self, line):
+        self._next()
+        self._expect("(")
+        kind, name, _ = self._next()
+        if kind != "name":
+            raise _ScriptError("prompt line %d: syntax error in for loop" % line)
+        self._expect("=")
+        start = self._expression()
+        if self._accept(";"):
+            condition = self._expression()
+            self._expect(";")
+            step = self._simple_statement(line)
+            self._expect(")")
+            return ("while", name, start, condition, step, self._block(), line)
+        self._expect(")")
+        return ("for", name, start, self._block(), line)
+
+    def _statement_try(self, line):
+        self._next()
+        body = self._block()
+        self._expect("catch")
+        self._expect("(")
+        target = self._target(self._expression(), line)
+        self._expect(")")
+        self._accept(";")
+        return ("try", body, target, line)
+
+    def _statement_break(self, line):
+        self._next()
+        self._end_statement()
+        return ("break", line)
+
+    def _statement_clear(self, line):
+        self._next()
+        names = []
+        if self._accept("("):
+            while not self._accept(")"):
+                kind, name, _ = self._next()
+                if kind != "name":
+                    raise _ScriptError("prompt line %d: syntax error in clear" % line)
+                names.append(name)
+                self._accept(",")
+        self._end_statement()
+        return ("clear", names, line)
+
+    def _target(self, expression, line):
+        kind = expression[0]
+        if kind == "name":
+            return expression
+        if kind == "call":
+            return ("index", ("name", expression[1]), expression[2])
+        if kind in ("index", "cell"):
+            return (kind, self._target(expression[1], line), expression[2])
+        if kind == "member":
+            return ("member", self._target(expression[1], line), expression[2])
+        raise _ScriptError("prompt line %d: syntax error, cannot assign to an expression" % line)
+
+    # Expressions, from the lowest to the highest precedence.
+
+    def _expression(self):
+        left = self._and()
+        while self._at("|") or self._at("||") or self._at("or"):
+            self._next()
+            left = ("binary", "|", left, self._and())
+        return left
+
+    def _and(self):
+        left = self._comparison()
+        while self._at("&") or self._at("&&") or self._at("and"):
+            self._next()
+            left = ("binary", "&", left, self._comparison())
+        return left
+
+    def _comparison(self):
+        left = self._range()
+        while self._peek()[0] == "op" and self._peek()[1] in _COMPARISONS:
+            operator = self._next()[1]
+            left = ("binary", operator, left, self._range())
+        return left
+
+    def _range(self):
+        start = self._additive()
+        if not self._at(":"):
+            return start
+        self._next()
+        stop = self._additive()
+        if self._accept(":"):
+            return ("range", start, stop, self._additive())
+        return ("range", start, ("number", 1.0), stop)
+
+    def _additive(self):
+        left = self._multiplicative()
+        while self._at("+") or self._at("-"):
+            operator = self._next()[1]
+            left = ("binary", operator, left, self._multiplicative())
+        return left
+
+    def _multiplicative(self):
+        left = self._unary()
+        while self._at("*") or self._at("/"):
+            operator = self._next()[1]
+            left = ("binary", operator, left, self._unary())
+        return left
+
+    def _unary(self):
+        if self._at("-") or self._at("+") or self._at("!") or self._at("~"):
+            operator = self._next()[1]
+            return ("unary", "!" if operator == "~" else operator, self._unary())
+        return self._power()
+
+    def _power(self):
+        base = self._postfix()
+        if self._accept("^"):
+            return ("binary", "^", base, self._unary())
+        return base
+
+    def _arguments(self, closing):
+        arguments = []
+        while not self._accept(closing):
+            if self._at(":") and (self._at(",", 1) or self._at(closing, 1)):
+                self._next()
+                arguments.append(("colon",))
+            else:
+                arguments.append(self._expression())
+            if not self._at(closing):
+                self._expect(",")
+        return arguments
+
+    def _postfix(self):
+        expression = self._primary()
+        while True:
+            if self._accept("("):
+                arguments = self._arguments(")")
+                expression = ("call", expression[1], arguments) if expression[0] == "name" else ("index", expression, arguments)
+            elif self._accept("{"):
+                expression = ("cell", expression, self._arguments("}"))
+            elif self._at(".") and self._peek(1)[0] == "name":
+                self._next()
+                name = self._next()[1]
+                # ``dataset.addattribute(...)`` calls a command with the value as first argument.
+                expression = ("method", expression, name, self._arguments(")")) if self._accept("(") else ("member", expression, name)
+            else:
+                return expression
+
+    def _primary(self):
+        kind, text, line = self._next()
+        if kind == "number":
+            return ("number", complex(0, float(text[:-1])) if text.endswith("i") else float(text))
+        if kind == "string":
+            return ("string", text[1:-1])
+        if kind == "name":
+            return ("name", text)
+        if kind == "op" and text == "(":
+            expression = self._expression()
+            self._expect(")")
+            return expression
+        if kind == "op" and text == "[":
+            rows = [[]]
+            while not self._accept("]"):
+                if self._accept(";"):
+                    rows.append([])
+                    continue
+                rows[-1].append(self._expression())
+                self._accept(",")
+            return ("matrix", [row for row in rows if row])
+        if kind == "op" and text == "{":
+            return ("cells", self._arguments("}"))
+        raise _ScriptError("prompt line %d: syntax error, unexpected '%s'" % (line, text or "end of script"))
+
+
+@lru_cache(maxsize=256)
+def _parse(code):
+    """Parse a script, reusing the result for scripts that are evaluated repeatedly."""
+    return _Parser(code).program()
+
+
+# Conversion between script values. Numbers are stored as Python floats or complex
+# numbers, matrices as NumPy arrays with at least two dimensions, cell arrays as lists,
+# structs and datasets as dictionaries, and null as None.
+
+
+def _normalize(value):
+    """Convert a computed value to the representation of the script workspace."""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in "biu":
+            value = value.astype(float)
+        if value.size == 1:
+            return _normalize(value.item())
+        if value.ndim < 2:
+            return value.reshape(-1, 1)
+        # Like Lumerical, matrices never end with singleton dimensions beyond the second.
+        while value.ndim > 2 and value.shape[-1] == 1:
+            value = value[..., 0]
+        return value
+    if isinstance(value, (complex, np.complexfloating)):
+        return complex(value)
+    if isinstance(value, (bool, int, float, np.number, np.bool_)):
+        return float(value)
+    return value
+
+
+def _column(values):
+    """Return a column vector."""
+    return np.asarray(values, dtype=float).reshape(-1, 1)
+
+
+def _numeric(value, context):
+    """Return a number or matrix, or raise if the value is a string, cell array, or struct."""
+    if isinstance(value, (float, complex, np.ndarray)):
+        return value
+    if isinstance(value, (int, bool, np.number)):
+        return float(value)
+    raise _ScriptError("in %s, the argument must be a number or a matrix" % context)
+
+
+def _number(value, context):
+    """Return a real number."""
+    value = _numeric(value, context)
+    if isinstance(value, np.ndarray):
+        if value.size != 1:
+            raise _ScriptError("in %s, the argument must be a single number" % context)
+        value = value.item()
+    return float(value.real if isinstance(value, complex) else value)
+
+
+def _string(value, context):
+    """Return a string."""
+    if not isinstance(value, str):
+        raise _ScriptError("in %s, the argument must be a string" % context)
+    return value
+
+
+def _truth(value, context="if"):
+    """Return the truth value of a condition."""
+    value = _numeric(value, context)
+    if isinstance(value, np.ndarray):
+        return value.size > 0 and bool(np.all(value != 0))
+    return value != 0
+
+
+def _format_number(value):
+    """Format a number like ``num2str``."""
+    if isinstance(value, complex):
+        return "%.15g%+.15gi" % (value.real, value.imag)
+    return "%.15g" % value
+
+
+def _positions(argument, length, context):
+    """Return the zero-based positions selected by an index argument along an axis."""
+    if isinstance(argument, tuple):
+        return np.arange(length)
+    indices = np.asarray(_numeric(argument, context)).real.ravel()
+    positions = np.rint(indices).astype(np.intp) - 1
+    if positions.size and (positions.min() < 0 or (length is not None and positions.max() >= length)):
+        raise _ScriptError("in %s, index out of bounds" % context)
+    return positions
+
+
+def _index(value, arguments, context):
+    """Return the elements of a matrix selected by one-based indices."""
+    array = np.asarray(_numeric(value, context))
+    array = array.reshape(array.shape + (1,) * (2 - array.ndim)) if array.ndim < 2 else array
+    if len(arguments) == 1:
+        flat = array.ravel(order="F")
+        return _normalize(flat[_positions(arguments[0], flat.size, context)])
+    shape = array.shape + (1,) * max(len(arguments) - array.ndim, 0)
+    if len(arguments) < array.ndim:
+        shape = shape[: len(arguments) - 1] + (int(np.prod(shape[len(arguments) - 1 :])),)
+    positions = [_positions(argument, length, context) for argument, length in zip(arguments, shape)]
+    return _normalize(array.reshape(shape, order="F")[np.ix_(*positions)])
+
+
+def _assign_index(current, arguments, value, context):
+    """Assign to the elements of a matrix selected by one-based indices, growing it if needed.
+
+    The matrix is modified in place when it does not grow and keeps its data type.
+    """
+    value = np.asarray(_numeric(value, context))
+    if isinstance(current, np.ndarray):
+        array = current
+    else:
+        array = np.zeros((0, 0)) if current is None else np.array([[_numeric(current, context)]])
+    positions = [None if isinstance(argument, tuple) else _positions(argument, None, context) for argument in arguments]
+    if len(positions) == 1:
+        needed = array.size if positions[0] is None or positions[0].size == 0 else max(array.size, int(positions[0].max()) + 1)
+        shape = array.shape if needed == array.size else (1, needed) if array.shape[0] == 1 and array.size > 1 else (needed, 1)
+    else:
+        if len(positions) < array.ndim:
+            raise _ScriptError("in %s, the number of indices is smaller than the number of dimensions" % context)
+        padded = array.shape + (1,) * (len(positions) - array.ndim)
+        shape = tuple(length if axis is None or axis.size == 0 else max(length, int(axis.max()) + 1) for axis, length in zip(positions, padded))
+    dtype = np.result_type(array.dtype, value.dtype, float)
+    if shape != array.shape[: len(shape)] + (1,) * (len(shape) - array.ndim) or dtype != array.dtype:
+        grown = np.zeros(shape, dtype=dtype)
+        if len(positions) == 1 and shape != array.shape:
+            grown[np.unravel_index(np.arange(array.size), shape, order="F")] = array.ravel(order="F")
+        else:
+            grown[tuple(slice(0, length) for length in array.shape)] = array
+        array = grown
+    values = value.ravel(order="F") if value.size > 1 else value.item()
+    try:
+        if len(positions) == 1:
+            selected = np.arange(array.size) if positions[0] is None else positions[0]
+            array[np.unravel_index(selected, array.shape, order="F")] = values
+        else:
+            view = array.reshape(array.shape + (1,) * (len(positions) - array.ndim))
+            axes = [np.arange(length) if axis is None else axis for axis, length in zip(positions, view.shape)]
+            view[np.ix_(*axes)] = values.reshape([axis.size for axis in axes], order="F") if value.size > 1 else values
+    except ValueError:
+        raise _ScriptError("in %s, the number of values does not match the number of indices" % context) from None
+    return array
+
+
+def _binary(operator, left, right):
+    """Evaluate a binary operator."""
+    if isinstance(left, str) or isinstance(right, str):
+        if operator == "+" and isinstance(left, str) and isinstance(right, str):
+            return left + right
+        if operator in ("==", "!="):
+            return float((left == right) == (operator == "=="))
+        raise _ScriptError("operator %s is not supported for strings" % operator)
+    left = _numeric(left, "operator " + operator)
+    right = _numeric(right, "operator " + operator)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if operator == "+":
+            result = np.add(left, right)
+        elif operator == "-":
+            result = np.subtract(left, right)
+        elif operator == "*":
+            result = np.multiply(left, right)
+        elif operator == "/":
+            result = np.true_divide(left, right)
+        elif operator == "^":
+            result = np.power(np.asarray(left, dtype=complex) if np.any(np.asarray(left).real < 0) else left, right)
+            if np.iscomplexobj(result) and not np.any(np.imag(result)):
+                result = np.real(result)
+        elif operator == "&":
+            result = np.logical_and(left, right)
+        elif operator == "|":
+            result = np.logical_or(left, right)
+        else:
+            left, right = np.real(left), np.real(right)
+            comparisons = {"==": np.equal, "!=": np.not_equal, "<": np.less, ">": np.greater, "<=": np.less_equal, ">=": np.greater_equal}
+            result = comparisons[operator](left, right)
+    return _normalize(result)
+
+
+def _dataset(value, context):
+    """Return a dataset, or raise if the value is not one."""
+    if not isinstance(value, dict) or "Lumerical_dataset" not in value:
+        raise _ScriptError("in %s, the argument is not a dataset" % context)
+    return value
+
+
+def _reduce(function, context):
+    """Return a script function that reduces all elements, or the elements along a dimension."""
+
+    def reduce(value, dim=None):
+        array = np.asarray(_numeric(value, context))
+        if dim is None:
+            return _normalize(function(array))
+        return _normalize(function(array, axis=int(_number(dim, context)) - 1, keepdims=True))
+
+    return reduce
+
+
+def _matrix(*dims):
+    return _normalize(np.zeros([int(_number(dim, "matrix")) for dim in dims] + [1] * (2 - len(dims))))
+
+
+def _linspace(start, stop, count):
+    return _normalize(_column(np.linspace(_number(start, "linspace"), _number(stop, "linspace"), int(_number(count, "linspace")))))
+
+
+def _size(value):
+    if isinstance(value, np.ndarray):
+        shape = value.shape + (1,) * (2 - value.ndim)
+    elif isinstance(value, list):
+        shape = (len(value), 1)
+    elif isinstance(value, str):
+        shape = (1, len(value))
+    else:
+        shape = (1, 1)
+    return np.array([shape], dtype=float)
+
+
+def _length(value):
+    if isinstance(value, np.ndarray):
+        return float(value.size)
+    if isinstance(value, (str, list, dict)):
+        return float(len(value))
+    return 1.0
+
+
+def _num2str(value):
+    if isinstance(value, str):
+        return value
+    value = _numeric(value, "num2str")
+    if isinstance(value, np.ndarray):
+        rows = value.reshape(value.shape[0], -1, order="F")
+        return "\n".join("\t".join(_format_number(element) for element in row) for row in rows.tolist())
+    return _format_number(value)
+
+
+def _str2num(value):
+    try:
+        return float(_string(value, "str2num"))
+    except ValueError:
+        raise _ScriptError("in str2num, '%s' is not a number" % value) from None
+
+
+def _findstring(value, pattern, start=1.0):
+    position = _string(value, "findstring").find(_string(pattern, "findstring"), int(_number(start, "findstring")) - 1)
+    return float(position + 1) if position >= 0 else -1.0
+
+
+def _substring(value, start, length=None):
+    value = _string(value, "substring")
+    start = int(_number(start, "substring")) - 1
+    return value[start:] if length is None else value[start : start + int(_number(length, "substring"))]
+
+
+def _pinch(value):
+    array = np.squeeze(np.asarray(_numeric(value, "pinch")))
+    return _normalize(array.reshape(-1, 1) if array.ndim == 1 else array)
+
+
+def _reshape(value, *dims):
+    return _normalize(np.reshape(np.asarray(_numeric(value, "reshape")), [int(_number(dim, "reshape")) for dim in dims], order="F"))
+
+
+def _getattribute(dataset, name=None):
+    dataset = _dataset(dataset, "getattribute")
+    names = dataset["Lumerical_dataset"].get("attributes", [])
+    if name is None:
+        return "\n".join(names)
+    if name not in names:
+        raise _ScriptError("in getattribute, the dataset has no attribute '%s'" % name)
+    return _normalize(np.array(dataset[name], copy=True))
+
+
+def _getparameter(dataset, name=None):
+    dataset = _dataset(dataset, "getparameter")
+    names = [name for group in dataset["Lumerical_dataset"].get("parameters", []) for name in group]
+    if name is None:
+        return "\n".join(names)
+    if name not in names:
+        raise _ScriptError("in getparameter, the dataset has no parameter '%s'" % name)
+    return _normalize(np.array(dataset[name], copy=True))
+
+
+def _axis(value, context):
+    return _column(np.real(_numeric(value, context)))
+
+
+def _matrixdataset(name=None):
+    return {"Lumerical_dataset": {}}
+
+
+def _rectilineardataset(*args):
+    x, y, z = args[-3:]
+    return {
+        "Lumerical_dataset": {"geometry": "rectilinear"},
+        "x": _axis(x, "rectilineardataset"),
+        "y": _axis(y, "rectilineardataset"),
+        "z": _axis(z, "rectilineardataset"),
+    }
+
+
+def _unstructureddataset(*args):
+    x, y, z, connectivity = args[-4:]
+    dataset = {"Lumerical_dataset": {"geometry": "unstructured"}}
+    dataset.update((axis, _axis(value, "unstructureddataset")) for axis, value in zip("xyz", (x, y, z)))
+    dataset["connectivity"] = np.asarray(_numeric(connectivity, "unstructureddataset"), dtype=float)
+    return dataset
+
+
+def _addparameter(dataset, *args):
+    dataset = _dataset(dataset, "addparameter")
+    names = [_string(name, "addparameter") for name in args[::2]]
+    for name, value in zip(names, args[1::2]):
+        dataset[name] = _axis(value, "addparameter")
+    dataset["Lumerical_dataset"].setdefault("parameters", []).append(names)
+
+
+def _addattribute(dataset, name, *components):
+    """Add an attribute to a dataset, stored with the shape conventions of ``lumapi``."""
+    dataset = _dataset(dataset, "addattribute")
+    metadata = dataset["Lumerical_dataset"]
+    geometry = metadata.get("geometry")
+    points = {"rectilinear": [dataset.get("x", ()), dataset.get("y", ()), dataset.get("z", ())], "unstructured": [dataset.get("x", ())]}
+    shape = [np.size(axis) for axis in points.get(geometry, [])]
+    values = [np.asarray(_numeric(component, "addattribute")) for component in components]
+    key = "attributes"
+    if geometry == "unstructured" and values[0].shape[0] != shape[0]:
+        key, shape = "cell_attributes", [values[0].shape[0]]
+    shape += [np.size(dataset[group[0]]) for group in metadata.get("parameters", [])]
+    try:
+        if len(values) > 1:
+            value = np.stack([component.reshape(shape, order="F") for component in values], axis=-1)
+        else:
+            value = values[0].reshape(shape + [-1], order="F")
+    except ValueError:
+        raise _ScriptError("in addattribute, the size of attribute '%s' does not match the dataset" % name) from None
+    if value.shape[-1] == 1 and geometry != "unstructured":
+        value = value.reshape(value.shape[:-1])
+    dataset[_string(name, "addattribute")] = value
+    metadata.setdefault(key, []).append(name)
+
+
+_FUNCTIONS = {
+    "abs": lambda x: _normalize(np.abs(_numeric(x, "abs"))),
+    "addattribute": _addattribute,
+    "addparameter": _addparameter,
+    "angle": lambda x: _normalize(np.angle(_numeric(x, "angle"))),
+    "c": lambda: _SPEED_OF_LIGHT,
+    "ceil": lambda x: _normalize(np.ceil(_numeric(x, "ceil"))),
+    "cell": lambda n: [0.0] * int(_number(n, "cell")),
+    "conj": lambda x: _normalize(np.conj(_numeric(x, "conj"))),
+    "cos": lambda x: _normalize(np.cos(_numeric(x, "cos"))),
+    "endl": lambda: "\n",
+    "exp": lambda x: _normalize(np.exp(_numeric(x, "exp"))),
+    "false": lambda: 0.0,
+    "findstring": _findstring,
+    "floor": lambda x: _normalize(np.floor(_numeric(x, "floor"))),
+    "getattribute": _getattribute,
+    "getparameter": _getparameter,
+    "imag": lambda x: _normalize(np.imag(_numeric(x, "imag"))),
+    "isnull": lambda x: float(x is None),
+    "length": _length,
+    "linspace": _linspace,
+    "log": lambda x: _normalize(np.log(_numeric(x, "log"))),
+    "log10": lambda x: _normalize(np.log10(_numeric(x, "log10"))),
+    "matrix": _matrix,
+    "matrixdataset": _matrixdataset,
+    "max": _reduce(np.max, "max"),
+    "mean": _reduce(np.mean, "mean"),
+    "min": _reduce(np.min, "min"),
+    "mod": lambda x, y: _normalize(np.mod(_numeric(x, "mod"), _numeric(y, "mod"))),
+    "num2str": _num2str,
+    "pi": lambda: math.pi,
+    "pinch": _pinch,
+    "ones": lambda *dims: _matrix(*dims) + 1,
+    "randmatrix": lambda *dims: _normalize(np.random.random_sample([int(_number(dim, "randmatrix")) for dim in dims] + [1] * (2 - len(dims)))),
+    "real": lambda x: _normalize(np.real(_numeric(x, "real"))),
+    "rectilineardataset": _rectilineardataset,
+    "reshape": _reshape,
+    "round": lambda x: _normalize(np.round(_numeric(x, "round"))),
+    "sin": lambda x: _normalize(np.sin(_numeric(x, "sin"))),
+    "size": _size,
+    "splitstring": lambda value, delimiter: _string(value, "splitstring").split(_string(delimiter, "splitstring")),
+    "sqrt": lambda x: _normalize(
+        np.sqrt(np.asarray(_numeric(x, "sqrt")) + 0j) if np.any(np.real(_numeric(x, "sqrt")) < 0) else np.sqrt(_numeric(x, "sqrt"))
+    ),
+    "str2num": _str2num,
+    "struct": lambda: {},
+    "substring": _substring,
+    "sum": _reduce(np.sum, "sum"),
+    "tan": lambda x: _normalize(np.tan(_numeric(x, "tan"))),
+    "transpose": lambda x: _normalize(np.transpose(_numeric(x, "transpose"))),
+    "true": lambda: 1.0,
+    "unstructureddataset": _unstructureddataset,
+    "zeros": _matrix,
+}
+"""Script functions that do not depend on the state of a session."""
+
+
+# Simulation objects.
+
+
+def _bound(name):
+    """Split a property name such as ``x min`` into its axis and bound."""
+    match = re.fullmatch(r"([xyz]) (min|max)", name)
+    return match.groups() if match else (None, None)
+
+
+class _Object:
+    """Object of the object tree, with its properties and children."""
+
+    def __init__(self, kind, properties, parent=None):
+        self.kind = kind
+        self.properties = properties
+        self.parent = parent
+        self.children = []
+        self.results = {}
+
+    @property
+    def name(self):
+        return self.properties["name"]
+
+    @property
+    def id(self):
+        return "::model" if self.parent is None else self.parent.id + "::" + self.name
+
+    @property
+    def is_group(self):
+        return self.parent is None or "Group" in self.properties["type"]
+
+    def property_names(self):
+        names = list(self.properties)
+        for axis in "xyz":
+            if axis + " span" in self.properties:
+                names += [axis + " min", axis + " max"]
+        return names
+
+    def get(self, name, context):
+        if name in self.properties:
+            value = self.properties[name]
+            return value.copy() if isinstance(value, np.ndarray) else value
+        axis, bound = _bound(name)
+        if axis and axis + " span" in self.properties:
+            sign = -0.5 if bound == "min" else 0.5
+            return self.properties[axis] + sign * self.properties[axis + " span"]
+        raise _ScriptError("in %s, the requested property '%s' was not found" % (context, name))
+
+    def set(self, name, value, context):
+        axis, bound = _bound(name)
+        if name not in self.properties and not (axis and axis + " span" in self.properties):
+            raise _ScriptError("in %s, the requested property '%s' was not found" % (context, name))
+        if name == "type" or (name == "name" and not isinstance(value, str)):
+            raise _ScriptError("in %s, the property '%s' cannot be set to this value" % (context, name))
+        if axis:
+            value = _number(value, context)
+            other = self.get(axis + (" max" if bound == "min" else " min"), context)
+            self.properties[axis] = 0.5 * (value + other)
+            self.properties[axis + " span"] = abs(other - value)
+            return
+        current = self.properties[name]
+        if isinstance(current, str) != isinstance(value, str):
+            raise _ScriptError("in %s, the type of the value is not supported for the property '%s'" % (context, name))
+        self.properties[name] = value if isinstance(value, str) else _normalize(copy.deepcopy(value))
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_json(self):
+        properties = {name: {"matrix": value.tolist()} if isinstance(value, np.ndarray) else value for name, value in self.properties.items()}
+        return {"kind": self.kind, "properties": properties, "children": [child.to_json() for child in self.children]}
+
+    @classmethod
+    def from_json(cls, description, parent=None):
+        properties = {name: np.array(value["matrix"]) if isinstance(value, dict) else value for name, value in description["properties"].items()}
+        obj = cls(description["kind"], properties, parent)
+        obj.children = [cls.from_json(child, obj) for child in description["children"]]
+        return obj
+
+
+def _new_root():
+    return _Object("model", {"name": "model", "type": "Layout Group"})
+
+
+def _area(obj):
+    """Return the area of a structure in the XY plane and its thickness, or ``None`` for other objects."""
+    properties = obj.properties
+    if obj.kind == "rect":
+        return properties["x span"] * properties["y span"], properties["z span"]
+    if obj.kind == "circle":
+        return math.pi * properties["radius"] ** 2, properties["z span"]
+    if obj.kind == "sphere":
+        return math.pi * properties["radius"] ** 2, 2 * properties["radius"]
+    if obj.kind == "poly":
+        x, y = np.asarray(properties["vertices"], dtype=float).reshape(-1, 2).T
+        return 0.5 * abs(float(np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1)))), properties["z span"]
+    return None
+
+
+class _Application:
+    """Application opened by the mock engine, with a script workspace and an object tree."""
+
+    def __init__(self, product):
+        self.alive = True
+        self.product = product
+        self.variables = {}
+        self.output = []
+        self.last_error = ""
+        self.directory = str(Path.cwd())
+        self._line = 0
+        self._commands = dict(_FUNCTIONS)
+        self._commands.update((name[5:], getattr(self, name)) for name in dir(self) if name.startswith("_cmd_"))
+        self._new_project()
+
+    def _new_project(self):
+        self.root = _new_root()
+        self.scope = self.root
+        self.selected = []
+        self.layout = True
+        self.filename = ""
+
+    # Evaluation of scripts.
+
+    def evaluate(self, code):
+        """Evaluate a script and return ``0``, or ``-1`` if it fails."""
+        try:
+            self._run(_parse(code))
+        except (_ScriptError, _Break) as error:
+            self.last_error = str(error)
+            return -1
+        return 0
+
+    def _run(self, statements):
+        for statement in statements:
+            self._line = statement[-1]
+            kind = statement[0]
+            if kind == "assign":
+                value = self._evaluate(statement[2])
+                if statement[2][0] in ("name", "member", "cell"):
+                    value = copy.deepcopy(value)
+                self._assign(statement[1], value)
+            elif kind == "expr":
+                self._evaluate(statement[1])
+            elif kind == "if":
+                self._run(statement[2] if _truth(self._evaluate(statement[1])) else statement[3])
+            elif kind == "for":
+                self._for(statement[1], _numeric(self._evaluate(statement[2]), "for"), statement[3])
+            elif kind == "while":
+                self._while(*statement[1:-1])
+            elif kind == "try":
+                try:
+                    self._run(statement[1])
+                except _ScriptError as error:
+                    self._assign(statement[2], "Error: prompt line %d: %s" % (self._line, error))
+            elif kind == "clear":
+                for name in statement[1] or list(self.variables):
+                    self.variables.pop(name, None)
+            elif kind == "print":
+                value = self._evaluate(statement[1])
+                self.output.append(
+                    value if isinstance(value, str) else _num2str(value) if isinstance(value, (float, complex, np.ndarray)) else repr(value)
+                )
+            else:
+                raise _Break()
+
+    def _for(self, name, values, body):
+        try:
+            for value in np.ravel(values):
+                self.variables[name] = _normalize(value)
+                self._run(body)
+        except _Break:
+            pass
+
+    def _while(self, name, start, condition, step, body):
+        self.variables[name] = _normalize(self._evaluate(start))
+        try:
+            while _truth(self._evaluate(condition), "for"):
+                self._run(body)
+                self._run([step])
+        except _Break:
+            pass
+
+    def _evaluate(self, node):
+        kind = node[0]
+        if kind in ("number", "string"):
+            return node[1]
+        if kind == "name":
+            if node[1] in self.variables:
+                return self.variables[node[1]]
+            return self._call(node[1], [])
+        if kind == "call":
+            if node[1] in self.variables:
+                return _index(self.variables[node[1]], self._arguments(node[2]), node[1])
+            return self._call(node[1], [self._evaluate(argument) for argument in node[2]])
+        if kind == "binary":
+            return _binary(node[1], self._evaluate(node[2]), self._evaluate(node[3]))
+        if kind == "unary":
+            value = _numeric(self._evaluate(node[2]), "operator " + node[1])
+            return _normalize(np.negative(value) if node[1] == "-" else value if node[1] == "+" else np.equal(value, 0))
+        if kind == "cell":
+            value = self._evaluate(node[1])
+            arguments = self._arguments(node[2])
+            if not isinstance(value, list) or len(arguments) != 1:
+                raise _ScriptError("the {} operator can only be used with cell arrays")
+            position = int(_positions(arguments[0], len(value), "cell array")[0])
+            return value[position]
+        if kind == "member":
+            value = self._evaluate(node[1])
+            if not isinstance(value, dict) or node[2] not in value:
+                raise _ScriptError("'%s' is not a member of the struct" % node[2])
+            return value[node[2]]
+        if kind == "index":
+            return _index(self._evaluate(node[1]), self._arguments(node[2]), "index")
+        if kind == "method":
+            return self._call(node[2], [self._evaluate(node[1])] + [self._evaluate(argument) for argument in node[3]])
+        if kind == "range":
+            start, step, stop = (_number(self._evaluate(part), "range") for part in node[1:])
+            count = max(int(math.floor((stop - start) / step + 1e-10)) + 1, 0) if step else 0
+            return _normalize(_column(start + step * np.arange(count))) if count != 1 else start
+        if kind == "cells":
+            return [copy.deepcopy(self._evaluate(element)) for element in node[1]]
+        if kind == "matrix":
+            rows = [np.hstack([np.atleast_2d(_numeric(self._evaluate(element), "[]")) for element in row]) for row in node[1]]
+            return _normalize(np.vstack(rows)) if rows else np.zeros((0, 0))
+        raise _ScriptError("':' can only be used as an index")
+
+    def _arguments(self, arguments):
+        return [argument if argument == ("colon",) else self._evaluate(argument) for argument in arguments]
+
+    def _assign(self, target, value):
+        kind = target[0]
+        if kind == "name":
+            self.variables[target[1]] = value
+            return
+        try:
+            holder = self._evaluate(target[1])
+        except _ScriptError:
+            holder = None
+        if kind == "member":
+            if not isinstance(holder, dict):
+                holder = {}
+                self._assign(target[1], holder)
+            holder[target[2]] = value
+        elif kind == "cell":
+            arguments = self._arguments(target[2])
+            if not isinstance(holder, list):
+                holder = []
+                self._assign(target[1], holder)
+            position = int(_positions(arguments[0], None, "cell array")[0])
+            holder.extend([0.0] * (position + 1 - len(holder)))
+            holder[position] = value
+        else:
+            updated = _assign_index(holder, self._arguments(target[2]), value, "index")
+            if updated is not holder:
+                self._assign(target[1], _normalize(updated))
+
+    def _call(self, name, arguments):
+        function = self._commands.get(name)
+        if function is None and name.startswith("add") and name[3:] in _OBJECT_KINDS:
+            return self._add(name[3:], *arguments)
+        if function is None:
+            raise _ScriptError("%s is not a valid function or a variable name" % name)
+        try:
+            return function(*arguments)
+        except TypeError:
+            raise _ScriptError("in %s, the number or type of the arguments is incorrect" % name) from None
+
+    # Object tree.
+
+    def _check_layout(self, command):
+        if not self.layout:
+            raise _ScriptError("in %s, the simulation is in analysis mode. Use switchtolayout to modify it" % command)
+
+    def _find(self, name):
+        """Return the objects that match a name relative to the group scope, or a full ID."""
+        if name.startswith("::"):
+            parts = name.split("::")[1:]
+            if not parts or parts[0] != "model":
+                return []
+            nodes, parts = [self.root], parts[1:]
+        else:
+            nodes, parts = [self.scope], name.split("::")
+        for part in parts:
+            nodes = [child for node in nodes for child in node.children if child.name == part]
+        return nodes
+
+    def _named(self, name, index, context):
+        objects = self._find(_string(name, context))
+        if not objects:
+            raise _ScriptError("in %s, no items matching the name '%s' can be found" % (context, name))
+        index = int(_number(index, context))
+        if not 1 <= index <= len(objects):
+            raise _ScriptError("in %s, there is no item number %d named '%s'" % (context, index, name))
+        return objects[index - 1]
+
+    def _selection(self, context, index=None):
+        if not self.selected:
+            raise _ScriptError("in %s, no items are currently selected" % context)
+        if index is None:
+            return self.selected
+        index = int(_number(index, context))
+        if not 1 <= index <= len(self.selected):
+            raise _ScriptError("in %s, there is no selected item number %d" % (context, index))
+        return [self.selected[index - 1]]
+
+    def _add(self, kind, properties=None):
+        command = "add" + kind
+        self._check_layout(command)
+        if properties is not None and not isinstance(properties, dict):
+            raise _ScriptError("in %s, the requested object cannot be created" % command)
+        name, type, defaults = _OBJECT_KINDS[kind]
+        obj = _Object(kind, dict({"name": name, "type": type}, **copy.deepcopy(defaults)), self.scope)
+        self.scope.children.append(obj)
+        self.selected = [obj]
+        for key, value in (properties or {}).items():
+            obj.set(key, value, command)
+
+    def _cmd_set(self, name, value, index=None):
+        self._check_layout("set")
+        for obj in self._selection("set", index):
+            obj.set(_string(name, "set"), value, "set")
+
+    def _cmd_get(self, name, index=None):
+        return self._selection("get", 1 if index is None else index)[0].get(_string(name, "get"), "get")
+
+    def _cmd_getnumber(self):
+        return float(len(self.selected))
+
+    def _cmd_getnamed(self, name, prop=None, index=1.0):
+        obj = self._named(name, index, "getnamed")
+        return "\n".join(obj.property_names()) if prop is None else obj.get(_string(prop, "getnamed"), "getnamed")
+
+    def _cmd_setnamed(self, name, prop, value, index=None):
+        self._check_layout("setnamed")
+        objects = self._find(_string(name, "setnamed")) if index is None else [self._named(name, index, "setnamed")]
+        if not objects:
+            raise _ScriptError("in setnamed, no items matching the name '%s' can be found" % name)
+        for obj in objects:
+            obj.set(_string(prop, "setnamed"), value, "setnamed")
+
+    def _cmd_getnamednumber(self, name):
+        return float(len(self._find(_string(name, "getnamednumber"))))
+
+    def _cmd_haveproperty(self, name):
+        return float(sum(_string(name, "haveproperty") in obj.property_names() for obj in self.selected))
+
+    def _cmd_getid(self):
+        return "\n".join(obj.id for obj in self._selection("getid"))
+
+    def _cmd_select(self, name):
+        self.selected = self._find(_string(name, "select"))
+
+    def _cmd_shiftselect(self, name):
+        self.selected += [obj for obj in self._find(_string(name, "shiftselect")) if obj not in self.selected]
+
+    def _cmd_selectall(self):
+        self.selected = list(self.scope.children)
+
+    def _cmd_selectpartial(self, name):
+        self.selected = [obj for obj in self.scope.children if _string(name, "selectpartial") in obj.name]
+
+    def _cmd_unselectall(self):
+        self.selected = []
+
+    def _cmd_delete(self):
+        self._check_layout("delete")
+        for obj in self._selection("delete"):
+            obj.parent.children.remove(obj)
+        self.selected = []
+
+    def _cmd_deleteall(self):
+        self._check_layout("deleteall")
+        self.scope.children = []
+        self.selected = []
+
+    def _cmd_groupscope(self, name=None):
+        if name is None:
+            return self.scope.id
+        groups = [obj for obj in self._find(_string(name, "groupscope")) if obj.is_group]
+        if not groups:
+            raise _ScriptError("in groupscope, the group '%s' was not found" % name)
+        self.scope = groups[0]
+        self.selected = []
+
+    def _cmd_addtogroup(self, name):
+        self._check_layout("addtogroup")
+        groups = [obj for obj in self._find(_string(name, "addtogroup")) if obj.is_group]
+        if not groups:
+            selected = self._selection("addtogroup")
+            self._add("group", {"name": name})
+            groups, self.selected = self.selected, selected
+        for obj in self._selection("addtogroup"):
+            obj.parent.children.remove(obj)
+            obj.parent = groups[0]
+            groups[0].children.append(obj)
+
+    # Simulation and results.
+
+    def _cmd_layoutmode(self):
+        return float(self.layout)
+
+    def _cmd_switchtolayout(self):
+        self.layout = True
+        for obj in self.root.walk():
+            obj.results = {}
+
+    def _cmd_run(self, *args):
+        regions = [obj for obj in self.root.walk() if obj.kind in _SOLVER_KINDS]
+        if not regions:
+            raise _ScriptError("in run, no simulation region was found")
+        self.layout = False
+        region = regions[0].properties
+        region_area = region["x span"] * region["y span"]
+        # The optical path through the structures decides the transmission, so results change with the design.
+        optical_path = 0.0
+        for obj in self.root.walk():
+            area = _area(obj)
+            if area is not None and isinstance(obj.properties.get("index"), float):
+                optical_path += (obj.properties["index"] - 1) * area[1] * min(area[0] / region_area, 1.0)
+        sources = [obj.properties for obj in self.root.walk() if "wavelength start" in obj.properties]
+        start, stop = (sources[0]["wavelength start"], sources[0]["wavelength stop"]) if sources else (1.5e-6, 1.6e-6)
+        for monitor in [obj for obj in self.root.walk() if obj.kind in ("dftmonitor", "power", "profile")]:
+            monitor.results = self._monitor_results(monitor.properties, start, stop, optical_path)
+        if self.filename:
+            log = "Running simulation\n100% complete. Max time remaining: 0 secs.\n"
+            Path(self.filename).with_name(Path(self.filename).stem + "_p0.log").write_text(log)
+
+    @staticmethod
+    def _monitor_results(properties, start, stop, optical_path):
+        wavelength = _column(np.linspace(start, stop, max(int(properties["frequency points"]), 1)))
+        frequency = _SPEED_OF_LIGHT / wavelength
+        transmission = np.cos(np.pi * optical_path / wavelength[:, 0]) ** 2
+        axes = []
+        for axis in "xyz":
+            span = properties.get(axis + " span", 0.0)
+            axes.append(_column(np.linspace(-span / 2, span / 2, _FIELD_POINTS if span > 0 else 1) + properties[axis]))
+        width = max(max(properties.get(axis + " span", 0.0) for axis in "xyz") / 4, 1e-7)
+        x, y, z = np.meshgrid(axes[0][:, 0] - properties["x"], axes[1][:, 0] - properties["y"], axes[2][:, 0], indexing="ij")
+        profile = np.exp(-(x**2 + y**2) / width**2)
+        amplitude = np.sqrt(transmission) * np.exp(2j * np.pi * optical_path / wavelength[:, 0])
+        field = profile[..., np.newaxis] * amplitude
+        return {
+            "T": {
+                "Lumerical_dataset": {"parameters": [["lambda", "f"]], "attributes": ["T"]},
+                "lambda": wavelength,
+                "f": frequency,
+                "T": transmission,
+            },
+            "E": {
+                "Lumerical_dataset": {"geometry": "rectilinear", "parameters": [["lambda", "f"]], "attributes": ["E"]},
+                "x": axes[0],
+                "y": axes[1],
+                "z": axes[2],
+                "lambda": wavelength,
+                "f": frequency,
+                "E": np.stack([field, 0.1j * field, np.zeros_like(field)], axis=-1),
+            },
+        }
+
+    def _results(self, name, context):
+        obj = self._named(name, 1.0, context)
+        if obj.kind not in _SOLVER_KINDS:
+            return obj.results
+        # Simulation regions report the positions of their mesh points in layout mode too.
+        points = int(10 * obj.properties["mesh accuracy"]) + 1
+        spans = [(obj.properties[axis], obj.properties[axis + " span"]) for axis in "xyz"]
+        mesh = {axis: _column(np.linspace(center - span / 2, center + span / 2, points)) for axis, (center, span) in zip("xyz", spans)}
+        return dict(mesh, status=1.0 if self.layout else 2.0, **obj.results)
+
+    def _cmd_getresult(self, name, result=None):
+        results = self._results(name, "getresult")
+        if result is None:
+            return "\n".join(results)
+        if result not in results:
+            raise _ScriptError("in getresult, the result '%s' was not found for '%s'" % (result, name))
+        return copy.deepcopy(results[result])
+
+    def _cmd_haveresult(self, name=None, result=None):
+        if name is None:
+            return float(any(obj.results for obj in self.root.walk()))
+        results = self._results(name, "haveresult")
+        return float(bool(results) if result is None else result in results)
+
+    def _cmd_getdata(self, name, data=None):
+        field = self._results(name, "getdata").get("E")
+        if field is None:
+            raise _ScriptError("in getdata, there is no data for '%s'" % name)
+        data_sets = {axis: field[axis] for axis in "xyz"}
+        data_sets["f"] = field["f"]
+        data_sets.update(("E" + axis, _normalize(field["E"][..., k])) for k, axis in enumerate("xyz"))
+        if data is None:
+            return "\n".join(data_sets)
+        if data not in data_sets:
+            raise _ScriptError("in getdata, the data '%s' was not found for '%s'" % (data, name))
+        return data_sets[data].copy()
+
+    # Projects and files.
+
+    def _path(self, filename):
+        return str(Path(self.directory, _string(filename, "file name")))
+
+    def _cmd_clc(self):
+        self.output = []
+
+    def _cmd_cd(self, directory):
+        path = self._path(directory)
+        if not Path(path).is_dir():
+            raise _ScriptError("in cd, the directory '%s' does not exist" % directory)
+        self.directory = path
+
+    def _cmd_pwd(self):
+        return self.directory
+
+    def _cmd_fileexists(self, filename):
+        return float(Path(self._path(filename)).exists())
+
+    def _cmd_currentfilename(self):
+        return self.filename
+
+    def _cmd_newproject(self, *args):
+        self._new_project()
+
+    def _cmd_save(self, filename=None):
+        if filename is None and not self.filename:
+            raise _ScriptError("in save, the project has not been saved before, a file name is required")
+        path = Path(self.filename if filename is None else self._path(filename))
+        if not path.suffix:
+            path = path.with_suffix(_PROJECT_EXTENSIONS[self.product])
+        project = {"product": self.product, "model": self.root.to_json()}
+        path.write_text(json.dumps(project))
+        self.filename = str(path)
+
+    def _cmd_load(self, filename):
+        path = Path(self._path(filename))
+        try:
+            project = json.loads(path.read_text())
+        except (OSError, ValueError):
+            raise _ScriptError("in load, the file '%s' could not be loaded" % filename) from None
+        self._new_project()
+        self.root = self.scope = _Object.from_json(project["model"])
+        self.filename = str(path)
+
+    def _cmd_feval(self, filename):
+        try:
+            code = Path(self._path(filename)).read_text()
+        except OSError:
+            raise _ScriptError("in feval, the file '%s' could not be found" % filename) from None
+        self._run(_parse(code))
+
+    def _cmd_workspace(self):
+        return "Workspace variables:\n" + "\n".join(sorted(self.variables))
+
+    def _cmd_getcommands(self):
+        return "\n".join(sorted(list(self._commands) + ["add" + kind for kind in _OBJECT_KINDS]))
+
+
+class MockInteropLibrary:
+    """Pure-Python stand-in for the library returned by ``lumapi.initLib``.
+
+    Each call to ``appOpen`` starts a new application with its own script workspace
+    and object tree. Values are allocated as the ``ctypes`` structures that ``lumapi``
+    reads and writes, and each value keeps the buffers it points to alive until it is
+    released with ``freeAny``.
+    """
+
+    def __init__(self):
+        self._owned = {}
+        self._last_error = ""
+        # ``getApiVersion`` sets ctypes attributes on the version entry points, so they must be plain functions.
+        self.verMajor = lambda: 1
+        self.verMinor = lambda: 0
+
+    def appOpen(self, url, key):  # noqa: N802
+        """Open a new application for the product in the URL."""
+        return _Application(url.decode().split(":", 1)[0])
+
+    def appOpened(self, handle):  # noqa: N802
+        """Return whether an application is open."""
+        return handle.alive
+
+    def appClose(self, handle):  # noqa: N802
+        """Close an application."""
+        handle.alive = False
+
+    def appGetLastError(self):  # noqa: N802
+        """Return the last error message."""
+        return POINTER(lumapi.LumString)(self._string(self._last_error.encode())[0])
+
+    def appEvalScript(self, handle, code):  # noqa: N802
+        """Evaluate a script in an application."""
+        result = handle.evaluate(code.decode())
+        if result < 0:
+            self._last_error = handle.last_error
+        return result
+
+    def _new(self, type, buffers=(), children=()):
+        value = lumapi.Any()
+        value.type = type
+        pointer = POINTER(lumapi.Any)(value)
+        self._owned[addressof(value)] = (value, list(buffers), list(children))
+        return pointer, value
+
+    def _string(self, data):
+        buffer = create_string_buffer(data, len(data) + 1)
+        string = lumapi.LumString()
+        string.len = len(data)
+        string.str = cast(buffer, POINTER(c_char))
+        return string, buffer
+
+    def allocateLumDouble(self, value):  # noqa: N802
+        """Allocate a number."""
+        pointer, any_value = self._new(1)
+        any_value.val.doubleVal = value
+        return pointer
+
+    def allocateLumString(self, length, data):  # noqa: N802
+        """Allocate a string."""
+        string, buffer = self._string(data[:length])
+        pointer, any_value = self._new(0, [buffer])
+        any_value.val.strVal = string
+        return pointer
+
+    def _allocate_matrix(self, mode, dim, dims):
+        shape = [int(dims[i]) for i in range(getattr(dim, "value", dim))]
+        data = np.empty(max(int(np.prod(shape)), 1) * mode)
+        dimlst = (c_ulonglong * len(shape))(*shape)
+        pointer, any_value = self._new(2, [data, dimlst])
+        any_value.val.matrixVal.mode = mode
+        any_value.val.matrixVal.dim = len(shape)
+        any_value.val.matrixVal.dimlst = cast(dimlst, POINTER(c_ulonglong))
+        any_value.val.matrixVal.data = data.ctypes.data_as(POINTER(c_double))
+        return pointer
+
+    def allocateLumMatrix(self, dim, dims):  # noqa: N802
+        """Allocate a real matrix."""
+        return self._allocate_matrix(1, dim, dims)
+
+    def allocateComplexLumMatrix(self, dim, dims):  # noqa: N802
+        """Allocate a complex matrix, stored interleaved."""
+        return self._allocate_matrix(2, dim, dims)
+
+    def memmovePackComplexLumMatrix(self, dest, src, n):  # noqa: N802
+        """Copy interleaved complex data into a matrix."""
+        np.ctypeslib.as_array(dest, (2 * n,))[:] = np.ctypeslib.as_array(src, (2 * n,))
+
+    def memmoveUnpackComplexLumMatrix(self, dest, src, n):  # noqa: N802
+        """Copy interleaved complex data out of a matrix."""
+        np.ctypeslib.as_array(dest, (2 * n,))[:] = np.ctypeslib.as_array(src, (2 * n,))
+
+    def allocateLumNameValuePair(self, length, name, value):  # noqa: N802
+        """Allocate a struct member."""
+        string, buffer = self._string(name[:length])
+        pointer, any_value = self._new(3, [buffer], [value])
+        any_value.val.nameValuePairVal.name = string
+        any_value.val.nameValuePairVal.value = value
+        return pointer
+
+    def _allocate_collection(self, type, size, elements):
+        pointer, any_value = self._new(type, [elements], [elements[i] for i in range(size)])
+        collection = any_value.val.structVal if type == 4 else any_value.val.listVal
+        collection.size = size
+        collection.elements = cast(elements, POINTER(POINTER(lumapi.Any)))
+        return pointer
+
+    def allocateLumStruct(self, size, elements):  # noqa: N802
+        """Allocate a struct."""
+        return self._allocate_collection(4, size, elements)
+
+    def allocateLumList(self, size, elements):  # noqa: N802
+        """Allocate a cell array."""
+        return self._allocate_collection(5, size, elements)
+
+    def freeAny(self, value):  # noqa: N802
+        """Release a value and the values it contains."""
+        owned = self._owned.pop(addressof(value.contents), None) if value else None
+        for child in owned[2] if owned else ():
+            self.freeAny(child)
+
+    # Conversion between values and workspace variables. Datasets are stored with the
+    # conventions of ``lumapi``, so members are converted in the same way as by the product.
+
+    def _decode(self, value):
+        if value.type == 0:
+            return string_at(value.val.strVal.str, value.val.strVal.len).decode()
+        if value.type == 1:
+            return value.val.doubleVal
+        if value.type == 2:
+            matrix = value.val.matrixVal
+            shape = [int(matrix.dimlst[i]) for i in range(matrix.dim)]
+            size = int(np.prod(shape))
+            if size == 0:
+                data = np.empty(0, dtype=float if matrix.mode == 1 else complex)
+            else:
+                data = np.ctypeslib.as_array(matrix.data, (size * matrix.mode,)).copy()
+                data = data.view(complex) if matrix.mode == 2 else data
+            # Script matrices have at least two dimensions.
+            return data.reshape(shape + [1] * (2 - len(shape)), order="F")
+        if value.type == 3:
+            pair = value.val.nameValuePairVal
+            return string_at(pair.name.str, pair.name.len).decode(), self._decode(pair.value[0])
+        collection = value.val.structVal if value.type == 4 else value.val.listVal
+        items = [self._decode(collection.elements[i][0]) for i in range(collection.size)]
+        if value.type == 5:
+            return items
+        struct = dict(items)
+        lumapi.GetTranslator.applyLumDatasetConventions(struct)
+        return struct
+
+    def _encode(self, value):
+        if isinstance(value, str):
+            data = value.encode()
+            return self.allocateLumString(len(data), data)
+        if value is None:
+            value = np.empty((0, 0))
+        if isinstance(value, complex):
+            value = np.array([[value]])
+        if isinstance(value, np.ndarray):
+            is_complex = np.iscomplexobj(value)
+            allocate = self.allocateComplexLumMatrix if is_complex else self.allocateLumMatrix
+            pointer = allocate(value.ndim, (c_ulonglong * value.ndim)(*value.shape))
+            flat = np.asarray(value, dtype=complex if is_complex else float).ravel(order="F").view(float)
+            if flat.size:
+                np.ctypeslib.as_array(pointer[0].val.matrixVal.data, flat.shape)[:] = flat
+            return pointer
+        if isinstance(value, dict):
+            translators = lumapi.PutTranslator.createStructMemberPreTranslators(value)
+            elements = (POINTER(lumapi.Any) * len(value))()
+            for index, (key, item) in enumerate(value.items()):
+                item = translators[key](item) if key in translators else item
+                elements[index] = self.allocateLumNameValuePair(len(key.encode()), key.encode(), self._encode(item))
+            return self.allocateLumStruct(len(value), elements)
+        if isinstance(value, (list, tuple)):
+            elements = (POINTER(lumapi.Any) * len(value))(*[self._encode(item) for item in value])
+            return self.allocateLumList(len(value), elements)
+        return self.allocateLumDouble(float(value))
+
+    def appPutVar(self, handle, name, value):  # noqa: N802
+        """Store a value in the script workspace and release it."""
+        handle.variables[name.decode()] = self._decode(value[0])
+        self.freeAny(value)
+        return 0
+
+    def appGetVar(self, handle, name, ref):  # noqa: N802
+        """Allocate a copy of a script workspace variable."""
+        name = name.decode()
+        if name not in handle.variables:
+            return -1
+        ref._obj.contents = self._encode(handle.variables[name])[0]
+        return 0
+
+
+def is_enabled():
+    """Return whether new sessions use the mock engine.
+
+    Returns
+    -------
+    bool
+        ``True`` if the ``PYLUMERICAL_MOCK_ENGINE`` environment variable is set to ``1``,
+        or if the installation path is :data:`MOCK_INSTALL_PATH`.
+    """
+    return _is_mock_engine_requested() or lumapi.InteropPaths.LUMERICALINSTALLDIR == MOCK_INSTALL_PATH
+
+
+_previous_install_path = None
+
+
+def enable():
+    """Use the mock engine for new sessions.
+
+    The installation path is set to :data:`MOCK_INSTALL_PATH` until :func:`disable`
+    restores the previous one. Sessions that are already open are not affected.
+
+    Examples
+    --------
+    Build and run a simulation without a Lumerical installation.
+
+    >>> import ansys.api.lumerical.lumapi as lumapi
+    >>> from ansys.lumerical.core import mock
+    >>> mock.enable()
+    >>> fdtd = lumapi.FDTD(hide=True)
+    >>> fdtd.addfdtd()
+    >>> fdtd.addpower(name="T")
+    >>> fdtd.run()
+    >>> transmission = fdtd.getresult("T", "T")["T"]
+    """
+    global _previous_install_path
+    install()
+    if lumapi.InteropPaths.LUMERICALINSTALLDIR != MOCK_INSTALL_PATH:
+        _previous_install_path = (lumapi.InteropPaths.LUMERICALINSTALLDIR, lumapi.InteropPaths.INTEROPLIBDIR)
+        lumapi.InteropPaths.setLumericalInstallPath(MOCK_INSTALL_PATH)
+
+
+def disable():
+    """Stop using the mock engine for new sessions and restore the previous installation path.
+
+    The ``PYLUMERICAL_MOCK_ENGINE`` environment variable still enables the mock engine
+    if it is set.
+    """
+    global _previous_install_path
+    if _previous_install_path is not None and lumapi.InteropPaths.LUMERICALINSTALLDIR == MOCK_INSTALL_PATH:
+        lumapi.InteropPaths.LUMERICALINSTALLDIR, lumapi.InteropPaths.INTEROPLIBDIR = _previous_install_path
+    _previous_install_path = None
+
+
+_load_interop_library = lumapi.initLib
+
+
+def _init_lib(remoteArgs):  # noqa: N803
+    """Return the mock interop library if it is enabled, otherwise load the library of the installation."""
+    if is_enabled():
+        return MockInteropLibrary()
+    return _load_interop_library(remoteArgs)
+
+
+def install():
+    """Let ``lumapi`` sessions use the mock engine when it is enabled.
+
+    This is called by :func:`enable`, and when :mod:`ansys.lumerical.core` bootstraps
+    with the ``PYLUMERICAL_MOCK_ENGINE`` environment variable set. Sessions load the
+    interop library of the installation as before unless the mock engine is enabled.
+    """
+    global _load_interop_library
+    if lumapi.initLib is not _init_lib:
+        _load_interop_library = lumapi.initLib
+        lumapi.initLib = _init_lib
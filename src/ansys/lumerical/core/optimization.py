@@ -0,0 +1,404 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Helpers that reduce the number of simulations run by optimizations, such as lumopt2 optimizations."""
+
+import functools
+import hashlib
+from pathlib import Path
+import threading
+
+import numpy as np
+
+from .result_cache import _ENTRY_SUFFIX, _flatten, _read_entry, _unflatten, _write_entry
+from .sweep import map_sessions
+
+_PARAMS_KEY = "params"
+
+
+def _as_params(params):
+    """Return a parameter vector as a one-dimensional array of floats."""
+    return np.array(params, dtype=float).ravel()
+
+
+def _params_digest(params):
+    """Return the name of the file that stores an evaluation at the given parameters."""
+    return hashlib.sha256(params.tobytes()).hexdigest()
+
+
+class EvaluationCache:
+    """Memoize evaluations of a function of the optimization parameters.
+
+    Gradient-based optimizers such as L-BFGS-B often evaluate the figure of merit and its
+    gradient several times at the same, or nearly the same, parameter vector. Each
+    evaluation runs forward and adjoint simulations. The cache returns the stored
+    result of a previous evaluation instead when the parameter vectors match within
+    the given tolerance, as tested by :func:`numpy.allclose`.
+
+    If a directory is given, each evaluation is also stored on disk as a compressed
+    ``.npz`` file, so that a restarted optimization does not simulate the points
+    that were already evaluated.
+
+    Parameters
+    ----------
+    directory : str or Path, optional
+        Directory to store evaluations in. It is created if it does not exist.
+        Evaluations already in the directory are loaded.
+    rtol : float, default: 0.0
+        Relative tolerance of the parameter comparison.
+    atol : float, default: 0.0
+        Absolute tolerance of the parameter comparison.
+
+    Examples
+    --------
+    Memoize a function that runs the forward and adjoint simulations and returns the
+    figure of merit and its gradient.
+
+    >>> from ansys.lumerical.core.optimization import EvaluationCache
+    >>> @EvaluationCache("evaluations", atol=1e-12)
+    ... def fom_and_gradient(params):
+    ...     return simulate(params)
+    """
+
+    def __init__(self, directory=None, rtol=0.0, atol=0.0):
+        self._directory = None if directory is None else Path(directory)
+        self.rtol = rtol
+        self.atol = atol
+        self._lock = threading.Lock()
+        self._params = []
+        self._results = []
+        self.hits = 0
+        self.misses = 0
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            for entry in sorted(self._directory.glob("*" + _ENTRY_SUFFIX)):
+                manifest, arrays = _read_entry(entry)
+                self._params.append(arrays.pop(_PARAMS_KEY))
+                self._results.append(_unflatten(manifest, arrays))
+
+    def __len__(self):
+        """Return the number of stored evaluations."""
+        return len(self._params)
+
+    def _find(self, params):
+        """Return the index of a stored evaluation matching the parameters, or ``None``."""
+        for index, stored in enumerate(self._params):
+            if stored.shape == params.shape and np.allclose(params, stored, rtol=self.rtol, atol=self.atol):
+                return index
+        return None
+
+    def lookup(self, params, default=None):
+        """Return the stored result of an evaluation at the given parameters.
+
+        Parameters
+        ----------
+        params : array_like
+            Parameter vector.
+        default : any, optional
+            Value to return if no evaluation matches the parameters.
+
+        Returns
+        -------
+        any
+            Stored result, or ``default``.
+        """
+        params = _as_params(params)
+        with self._lock:
+            index = self._find(params)
+            return default if index is None else self._results[index]
+
+    def store(self, params, result):
+        """Store the result of an evaluation at the given parameters.
+
+        Parameters
+        ----------
+        params : array_like
+            Parameter vector.
+        result : any
+            Result of the evaluation. To be stored on disk, it must consist of arrays,
+            numbers, strings, and dictionaries, lists, or tuples of them.
+        """
+        params = _as_params(params)
+        if self._directory is not None:
+            arrays = {}
+            manifest = _flatten(result, arrays)
+            arrays[_PARAMS_KEY] = params
+            _write_entry(Path(self._directory, _params_digest(params) + _ENTRY_SUFFIX), manifest, arrays)
+        with self._lock:
+            self._params.append(params)
+            self._results.append(result)
+
+    def wrap(self, function):
+        """Return a memoized version of a function whose first argument is the parameter vector.
+
+        Other arguments are passed to the function but are not part of the cache key.
+
+        Parameters
+        ----------
+        function : callable
+            Function to memoize.
+
+        Returns
+        -------
+        callable
+            Memoized function.
+        """
+        missing = object()
+
+        @functools.wraps(function)
+        def memoized(params, *args, **kwargs):
+            result = self.lookup(params, missing)
+            if result is not missing:
+                self.hits += 1
+                return result
+            self.misses += 1
+            result = function(params, *args, **kwargs)
+            self.store(params, result)
+            return result
+
+        memoized.cache = self
+        return memoized
+
+    __call__ = wrap
+
+
+def memoize(obj, name, cache=None):
+    """Memoize a method of an object, such as the evaluation method of a lumopt2 project.
+
+    The method is replaced on the instance only, so other objects of the same class are
+    not affected.
+
+    Parameters
+    ----------
+    obj : object
+        Object whose method to memoize.
+    name : str
+        Name of the method. Its first argument must be the parameter vector.
+    cache : EvaluationCache, optional
+        Cache to store evaluations in. By default, a new in-memory cache is used.
+
+    Returns
+    -------
+    EvaluationCache
+        Cache of the method.
+
+    Examples
+    --------
+    >>> from ansys.lumerical.core.optimization import EvaluationCache, memoize
+    >>> cache = memoize(problem, "evaluate", EvaluationCache("evaluations", rtol=1e-9))
+    >>> problem.evaluate(x0)
+    >>> problem.evaluate(x0)
+    >>> cache.hits
+    1
+    """
+    cache = EvaluationCache() if cache is None else cache
+    setattr(obj, name, cache.wrap(getattr(obj, name)))
+    return cache
+
+
+class AdjointTerm:
+    """Forward and adjoint simulations of one term of a figure of merit.
+
+    The adjoint simulation of a term does not depend on the results of its forward
+    simulation, because the adjoint source is normalized and its amplitude is applied
+    afterwards. Both simulations of all terms can therefore run at the same time on
+    separate sessions. Each term is, for example, one port or one wavelength band of a
+    multi-objective figure of merit.
+
+    Parameters
+    ----------
+    forward : callable
+        Function called as ``forward(session, params)`` that sets up and runs the forward
+        simulation on an empty session and returns its results.
+    adjoint : callable
+        Function called as ``adjoint(session, params)`` that sets up and runs the adjoint
+        simulation on an empty session and returns its results.
+    combine : callable
+        Function called as ``combine(params, forward_results, adjoint_results)`` that returns
+        the value of the term and its gradient. ``adjoint_results`` is ``None`` when
+        no gradient is requested, in which case the gradient can be ``None``.
+    """
+
+    def __init__(self, forward, adjoint, combine):
+        self.forward = forward
+        self.adjoint = adjoint
+        self.combine = combine
+
+
+def _call_with_params(session, task):
+    """Call a simulation of a term, or a function evaluated at a candidate, on a leased session."""
+    function, params = task
+    return function(session, params)
+
+
+def fom_and_gradient(pool, terms, params, gradient=True, retries=1):
+    """Evaluate a figure of merit and its gradient, running all simulations concurrently.
+
+    The forward and adjoint simulations of all terms are spread across the sessions of
+    the pool. Once they have all finished, the values and gradients of the terms are
+    summed.
+
+    Parameters
+    ----------
+    pool : :class:`ansys.lumerical.core.SessionPool`
+        Pool of sessions to run the simulations on. Up to ``pool.size`` simulations run
+        at the same time.
+    terms : list of AdjointTerm
+        Terms of the figure of merit.
+    params : array_like
+        Parameter vector.
+    gradient : bool, default: True
+        Whether to run the adjoint simulations and compute the gradient. Gradient-free
+        optimizers only need the forward simulations.
+    retries : int, default: 1
+        Number of times a simulation is retried on a fresh session after a lost connection.
+
+    Returns
+    -------
+    tuple
+        Value of the figure of merit and its gradient. The gradient is ``None`` if
+        ``gradient`` is ``False``.
+
+    Examples
+    --------
+    Evaluate a two-port figure of merit on four sessions, so that the forward and adjoint
+    simulations of both ports run at the same time.
+
+    >>> import ansys.lumerical.core as lumapi
+    >>> from ansys.lumerical.core.optimization import AdjointTerm, fom_and_gradient
+    >>> terms = [AdjointTerm(forward_port1, adjoint_port1, gradient_port1), AdjointTerm(forward_port2, adjoint_port2, gradient_port2)]
+    >>> with lumapi.SessionPool("fdtd", size=4) as pool:
+    ...     fom, grad = fom_and_gradient(pool, terms, params)
+    """
+    simulations = [term.forward for term in terms]
+    if gradient:
+        simulations += [term.adjoint for term in terms]
+    results = map_sessions(_call_with_params, [(simulation, params) for simulation in simulations], workers=pool.size, retries=retries, pool=pool)
+
+    total, total_gradient = 0.0, None
+    for index, term in enumerate(terms):
+        adjoint_results = results[len(terms) + index] if gradient else None
+        value, term_gradient = term.combine(params, results[index], adjoint_results)
+        total = total + value
+        if term_gradient is not None:
+            total_gradient = term_gradient if total_gradient is None else total_gradient + term_gradient
+    return total, total_gradient
+
+
+def evaluate_batch(pool, function, param_matrix, cache=None, retries=1):
+    """Evaluate a function at several parameter vectors concurrently.
+
+    Gradient-free optimizers, such as population-based methods, evaluate many
+    candidates that do not depend on each other. The candidates are spread across
+    the sessions of the pool.
+
+    Parameters
+    ----------
+    pool : :class:`ansys.lumerical.core.SessionPool`
+        Pool of sessions to evaluate the candidates on. Up to ``pool.size`` evaluations
+        run at the same time.
+    function : callable
+        Function called as ``function(session, params)`` for each candidate. It receives an
+        empty session and a one-dimensional parameter vector.
+    param_matrix : array_like
+        Candidates, one parameter vector per row.
+    cache : EvaluationCache, optional
+        Cache of previous evaluations. Candidates that are found in the cache are not
+        evaluated again, and new evaluations are stored in it.
+    retries : int, default: 1
+        Number of times an evaluation is retried on a fresh session after a lost connection.
+
+    Returns
+    -------
+    list
+        Return values of ``function``, one per row of ``param_matrix``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import ansys.lumerical.core as lumapi
+    >>> from ansys.lumerical.core.optimization import evaluate_batch
+    >>> with lumapi.SessionPool("fdtd", size=8) as pool:
+    ...     foms = evaluate_batch(pool, simulate_transmission, np.random.default_rng().uniform(0.1, 0.5, (32, 4)))
+    """
+    rows = np.atleast_2d(np.asarray(param_matrix, dtype=float))
+    missing = object()
+    results = [missing if cache is None else cache.lookup(params, missing) for params in rows]
+    pending = [index for index, result in enumerate(results) if result is missing]
+    if cache is not None:
+        cache.hits += len(rows) - len(pending)
+        cache.misses += len(pending)
+
+    if pending:
+        tasks = [(function, rows[index]) for index in pending]
+        for index, result in zip(pending, map_sessions(_call_with_params, tasks, workers=pool.size, retries=retries, pool=pool)):
+            results[index] = result
+            if cache is not None:
+                cache.store(rows[index], result)
+    return results
+
+
+def batch_objective(pool, function, cache=None, retries=1):
+    """Return an objective that evaluates whole populations concurrently.
+
+    The objective follows the convention of the ``vectorized`` option of
+    :func:`scipy.optimize.differential_evolution`: it takes an array of shape
+    ``(N, S)`` with one candidate per column and returns ``S`` values. Called with a
+    single parameter vector, it returns a single value.
+
+    Parameters
+    ----------
+    pool : :class:`ansys.lumerical.core.SessionPool`
+        Pool of sessions to evaluate the candidates on.
+    function : callable
+        Function called as ``function(session, params)`` that returns the value of the
+        objective for one candidate.
+    cache : EvaluationCache, optional
+        Cache of previous evaluations.
+    retries : int, default: 1
+        Number of times an evaluation is retried on a fresh session after a lost connection.
+
+    Returns
+    -------
+    callable
+        Vectorized objective.
+
+    Examples
+    --------
+    Run differential evolution with the candidates of each generation spread over eight
+    sessions.
+
+    >>> from scipy.optimize import differential_evolution
+    >>> import ansys.lumerical.core as lumapi
+    >>> from ansys.lumerical.core.optimization import batch_objective
+    >>> with lumapi.SessionPool("fdtd", size=8) as pool:
+    ...     objective = batch_objective(pool, simulate_loss)
+    ...     result = differential_evolution(objective, bounds, vectorized=True, updating="deferred", popsize=8)
+    """
+
+    def objective(x):
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            return float(evaluate_batch(pool, function, x[None, :], cache=cache, retries=retries)[0])
+        return np.array(evaluate_batch(pool, function, x.T, cache=cache, retries=retries), dtype=float)
+
+    return objective
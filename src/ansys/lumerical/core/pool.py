@@ -0,0 +1,285 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Keep warm Lumerical sessions that can be leased and reused."""
+
+from contextlib import contextmanager
+import threading
+import time
+
+import ansys.api.lumerical.lumapi as lumapi
+
+_PRODUCT_CLASS_NAMES = {"fdtd": "FDTD", "mode": "MODE", "device": "DEVICE", "interconnect": "INTERCONNECT"}
+
+_DEFAULT_RESET_SCRIPT = 'switchtolayout;\ngroupscope("::model");\ndeleteall;\nclear;\n'
+
+_DEFAULT_RESET_SCRIPTS = {
+    "fdtd": _DEFAULT_RESET_SCRIPT,
+    "mode": _DEFAULT_RESET_SCRIPT,
+    "device": _DEFAULT_RESET_SCRIPT,
+    "interconnect": "switchtolayout;\ndeleteall;\nclear;\n",
+}
+
+
+def _get_product_class(product):
+    """Return the ``lumapi`` session class for a product name."""
+    try:
+        return getattr(lumapi, _PRODUCT_CLASS_NAMES[product])
+    except KeyError:
+        raise lumapi.LumApiError("Product [" + str(product) + "] is not available") from None
+
+
+def _is_session_alive(session):
+    """Return ``True`` if the session still has a live connection to the product."""
+    try:
+        return bool(lumapi.verifyConnection(session.handle))
+    except lumapi.LumApiError:
+        return False
+
+
+def _close_quietly(session):
+    """Close a session, ignoring errors from sessions that are already gone."""
+    try:
+        session.close()
+    except lumapi.LumApiError:
+        pass
+
+
+class SessionPool:
+    """Pool of pre-started sessions of one Lumerical product.
+
+    Starting a product and checking out a license dominates the cost of short jobs.
+    The pool keeps sessions open and hands them out one at a time. Each session is
+    reset when it is returned and health-checked with
+    :func:`ansys.api.lumerical.lumapi.verifyConnection` before it is handed out again,
+    so a session that died while idle is replaced transparently.
+
+    Parameters
+    ----------
+    product : str, default: "fdtd"
+        Product to start. Options are ``"fdtd"``, ``"mode"``, ``"device"``, and ``"interconnect"``.
+    size : int, default: 1
+        Maximum number of sessions that the pool keeps open.
+    hide : bool, default: True
+        Whether to hide the product GUI.
+    prestart : bool, default: True
+        Whether to start all ``size`` sessions when the pool is created. When ``False``,
+        sessions are started on demand.
+    reset_script : str, optional
+        Lumerical script evaluated when a session is returned to the pool. The default
+        switches to layout mode, deletes all objects, and clears script workspace variables.
+    **session_kwargs : dict, optional
+        Additional keyword arguments passed to the session constructor, for example
+        ``serverArgs`` or ``remoteArgs``.
+
+    Examples
+    --------
+    >>> import ansys.lumerical.core as lumapi
+    >>> with lumapi.SessionPool("fdtd", size=2) as pool:
+    ...     for radius in [100e-9, 120e-9, 140e-9]:
+    ...         with pool.session() as fdtd:
+    ...             fdtd.addcircle(radius=radius)
+    """
+
+    def __init__(self, product="fdtd", size=1, hide=True, prestart=True, reset_script=None, **session_kwargs):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1.")
+        self._product_class = _get_product_class(product)
+        self.product = product
+        self.size = size
+        self._hide = hide
+        self._session_kwargs = session_kwargs
+        self._reset_script = _DEFAULT_RESET_SCRIPTS[product] if reset_script is None else reset_script
+
+        self._condition = threading.Condition()
+        self._idle = []
+        self._leased = set()
+        self._starting = 0
+        self._closed = False
+
+        if prestart:
+            try:
+                for _ in range(size):
+                    self._idle.append(self._start_session())
+            except Exception:
+                self.close()
+                raise
+
+    def __enter__(self):
+        """Return the pool for use in a ``with`` statement."""
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """Close the pool when leaving a ``with`` statement."""
+        self.close()
+
+    def __len__(self):
+        """Return the number of sessions that are open or starting."""
+        with self._condition:
+            return len(self._idle) + len(self._leased) + self._starting
+
+    @property
+    def closed(self):
+        """Whether the pool has been closed."""
+        return self._closed
+
+    def _start_session(self):
+        """Start a new session of the pool's product."""
+        return self._product_class(hide=self._hide, **self._session_kwargs)
+
+    def _reset_session(self, session):
+        """Reset a returned session, returning ``False`` if it cannot be reused."""
+        if not self._reset_script:
+            return _is_session_alive(session)
+        try:
+            session.eval(self._reset_script)
+        except lumapi.LumApiError:
+            return False
+        return True
+
+    def acquire(self, timeout=None):
+        """Lease a session from the pool.
+
+        Prefer :meth:`session`, which returns the session to the pool automatically.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait for a session to become available.
+            By default, wait indefinitely.
+
+        Returns
+        -------
+        :class:`ansys.api.lumerical.lumapi.Lumerical`
+            A live session of the pool's product.
+
+        Raises
+        ------
+        TimeoutError
+            If no session becomes available within ``timeout`` seconds.
+        RuntimeError
+            If the pool is closed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Session pool is closed.")
+                    if self._idle or len(self._idle) + len(self._leased) + self._starting < self.size:
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("No session became available within %s seconds." % timeout)
+                    self._condition.wait(remaining)
+
+                session = self._idle.pop() if self._idle else None
+                self._starting += 1
+
+            # Health checks and product startup happen outside the lock so other
+            # threads can return sessions in the meantime.
+            try:
+                if session is not None and not _is_session_alive(session):
+                    _close_quietly(session)
+                    session = None
+                if session is None:
+                    session = self._start_session()
+            except BaseException:
+                with self._condition:
+                    self._starting -= 1
+                    self._condition.notify()
+                raise
+
+            with self._condition:
+                self._starting -= 1
+                if not self._closed:
+                    self._leased.add(session)
+                    return session
+            _close_quietly(session)
+
+    def release(self, session, discard=False):
+        """Return a leased session to the pool.
+
+        Parameters
+        ----------
+        session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+            Session obtained from :meth:`acquire`.
+        discard : bool, default: False
+            Whether to close the session instead of resetting it for reuse. A
+            replacement is started the next time a session is requested.
+        """
+        with self._condition:
+            if session not in self._leased:
+                raise ValueError("Session was not leased from this pool.")
+
+        reusable = not discard and not self._closed and self._reset_session(session)
+
+        with self._condition:
+            self._leased.discard(session)
+            if reusable and not self._closed:
+                self._idle.append(session)
+                session = None
+            self._condition.notify()
+        if session is not None:
+            _close_quietly(session)
+
+    @contextmanager
+    def session(self, timeout=None):
+        """Lease a session for the duration of a ``with`` block.
+
+        The session is reset and returned to the pool when the block exits. If the
+        block raises :class:`ansys.api.lumerical.lumapi.LumApiError` and the connection
+        to the product is lost, the session is discarded instead.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait for a session to become available.
+
+        Yields
+        ------
+        :class:`ansys.api.lumerical.lumapi.Lumerical`
+            A live session of the pool's product.
+        """
+        session = self.acquire(timeout)
+        try:
+            yield session
+        except lumapi.LumApiError:
+            self.release(session, discard=not _is_session_alive(session))
+            raise
+        except BaseException:
+            self.release(session)
+            raise
+        else:
+            self.release(session)
+
+    def close(self):
+        """Close all idle sessions and stop handing out new ones.
+
+        Leased sessions are closed when they are returned.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for session in idle:
+            _close_quietly(session)
@@ -0,0 +1,532 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Measure the time and data transferred by each call to a Lumerical session."""
+
+import functools
+import itertools
+import json
+import os
+from pathlib import Path
+import secrets
+import threading
+import time
+import types
+
+import numpy as np
+
+import ansys.api.lumerical.lumapi as lumapi
+
+_VARIABLE_METHODS = ("eval", "getv", "putv")
+"""Session methods that access the script workspace directly. Every script command is instrumented as well."""
+
+_TRANSLATORS = (
+    (lumapi, "packMatrix"),
+    (lumapi, "unpackMatrix"),
+    (lumapi.PutTranslator, "putStructMembers"),
+    (lumapi.PutTranslator, "putListMembers"),
+    (lumapi.GetTranslator, "getStructMembers"),
+    (lumapi.GetTranslator, "getListMembers"),
+)
+"""Functions of ``lumapi`` that convert values between Python and the interop structures."""
+
+_local = threading.local()
+_hooks_lock = threading.Lock()
+_hooks_users = 0
+_original_translators = {}
+_span_ids = itertools.count(1)
+
+
+_OTLP_SPAN_KIND_CLIENT = 3
+_OTLP_STATUS_CODE_OK = 1
+_OTLP_STATUS_CODE_ERROR = 2
+
+
+def _otlp_value(value):
+    """Return an attribute value in the OTLP JSON encoding, where 64-bit integers are strings."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _is_script_command(function):
+    """Return whether a session method calls a script command through ``lumapi.appCall``."""
+    return getattr(function, "__qualname__", "").startswith("Lumerical.__init__.<locals>")
+
+
+def _payload_size(value):
+    """Return the approximate number of bytes needed to transfer a value to or from a session."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (int, float, complex, np.number)):
+        return 16 if isinstance(value, (complex, np.complexfloating)) else 8
+    if isinstance(value, dict):
+        return sum(len(str(key).encode()) + _payload_size(member) for key, member in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_payload_size(member) for member in value)
+    return 0
+
+
+def _stack():
+    """Return the spans that are open in the calling thread, innermost last."""
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _timed_translator(function):
+    """Wrap a translation function so that its time is added to the innermost open span."""
+
+    @functools.wraps(function)
+    def translator(*args, **kwargs):
+        stack = _stack()
+        # Translators call each other for nested values; only the outermost call is timed.
+        if not stack or getattr(_local, "translating", False):
+            return function(*args, **kwargs)
+        _local.translating = True
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _local.translating = False
+            stack[-1].translations.append((start, time.perf_counter_ns()))
+
+    return translator
+
+
+def _acquire_translator_hooks():
+    """Time the translation functions of ``lumapi`` while at least one profiler is running."""
+    global _hooks_users
+    with _hooks_lock:
+        if _hooks_users == 0:
+            for owner, name in _TRANSLATORS:
+                function = owner.__dict__[name]
+                _original_translators[owner, name] = function
+                if isinstance(function, staticmethod):
+                    setattr(owner, name, staticmethod(_timed_translator(function.__func__)))
+                else:
+                    setattr(owner, name, _timed_translator(function))
+        _hooks_users += 1
+
+
+def _release_translator_hooks():
+    """Restore the translation functions of ``lumapi`` once no profiler is running."""
+    global _hooks_users
+    with _hooks_lock:
+        _hooks_users -= 1
+        if _hooks_users == 0:
+            for (owner, name), function in _original_translators.items():
+                setattr(owner, name, function)
+            _original_translators.clear()
+
+
+class Span:
+    """Single call to a session recorded by a :class:`Profiler`.
+
+    Times are measured with :func:`time.perf_counter_ns`, in nanoseconds.
+    """
+
+    def __init__(self, name, session, parent):
+        self.name = name
+        """Name of the session method."""
+        self.session = session
+        """Label of the session that was called."""
+        self.span_id = next(_span_ids)
+        """Identifier of the span, unique in the process."""
+        self.parent_id = None if parent is None else parent.span_id
+        """Identifier of the enclosing span, or ``None`` for a top-level call."""
+        self.thread_id = threading.get_ident()
+        """Identifier of the thread that made the call."""
+        self.start = time.perf_counter_ns()
+        self.end = None
+        self.bytes_sent = 0
+        """Approximate number of bytes sent to the session."""
+        self.bytes_received = 0
+        """Approximate number of bytes received from the session."""
+        self.translations = []
+        """Start and end times of the conversions between Python values and interop structures."""
+        self.error = None
+        """Message of the error raised by the call, or ``None``."""
+
+    @property
+    def duration(self):
+        """Wall time of the call, in seconds."""
+        return (self.end - self.start) / 1e9
+
+    @property
+    def translation_time(self):
+        """Time spent converting values between Python and interop structures, in seconds."""
+        return sum(end - start for start, end in self.translations) / 1e9
+
+    def __repr__(self):
+        """Return a short description of the span."""
+        return "<Span %s on %s: %.3f ms>" % (self.name, self.session, self.duration * 1e3)
+
+
+class CallStats:
+    """Aggregated statistics of the calls to one session method."""
+
+    def __init__(self, name):
+        self.name = name
+        """Name of the session method."""
+        self.count = 0
+        """Number of calls."""
+        self.errors = 0
+        """Number of calls that raised an error."""
+        self.total_time = 0.0
+        """Total wall time of the calls, in seconds."""
+        self.max_time = 0.0
+        """Longest wall time of a single call, in seconds."""
+        self.translation_time = 0.0
+        """Total time spent converting values, in seconds."""
+        self.bytes_sent = 0
+        """Total number of bytes sent to the sessions."""
+        self.bytes_received = 0
+        """Total number of bytes received from the sessions."""
+
+    @property
+    def mean_time(self):
+        """Mean wall time of a call, in seconds."""
+        return self.total_time / self.count if self.count else 0.0
+
+    def _add(self, span):
+        self.count += 1
+        self.errors += span.error is not None
+        self.total_time += span.duration
+        self.max_time = max(self.max_time, span.duration)
+        self.translation_time += span.translation_time
+        self.bytes_sent += span.bytes_sent
+        self.bytes_received += span.bytes_received
+
+
+class Profiler:
+    """Record every call to the methods of Lumerical sessions.
+
+    While the profiler is running, each call to ``eval``, ``getv``, ``putv``, and to the
+    script commands of the attached sessions, such as ``getresult``, ``set``, ``get``, or
+    ``run``, is recorded as a :class:`Span`. A span holds the wall time of the call, the
+    time spent converting values between Python and the interop structures, and the
+    approximate number of bytes transferred. Property access through
+    :class:`ansys.api.lumerical.lumapi.SimObject` is recorded as calls to ``getnamed``
+    and ``setnamed``.
+
+    The spans can be summarized in a table, or exported as a Chrome trace or as
+    OpenTelemetry spans. Sessions run at full speed when no profiler is attached.
+
+    Parameters
+    ----------
+    *sessions : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Sessions to profile. More sessions can be attached with :meth:`attach`.
+
+    Examples
+    --------
+    Find the calls that dominate a script.
+
+    >>> from ansys.lumerical.core.profiling import Profiler
+    >>> with Profiler(fdtd) as profiler:
+    ...     fdtd.run()
+    ...     E = fdtd.getresult("monitor", "E")
+    >>> print(profiler.summary())
+    >>> profiler.save_chrome_trace("trace.json")
+    """
+
+    def __init__(self, *sessions):
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._spans = []
+        self._running = False
+        self._trace_id = secrets.token_hex(16)
+        # Offset between the performance counter and the Unix epoch, to export absolute times.
+        self._epoch_offset = time.time_ns() - time.perf_counter_ns()
+        for session in sessions:
+            self.attach(session)
+
+    @property
+    def running(self):
+        """Whether calls are being recorded."""
+        return self._running
+
+    @property
+    def spans(self):
+        """Recorded calls, in the order in which they finished."""
+        with self._lock:
+            return list(self._spans)
+
+    def attach(self, session, label=None):
+        """Record the calls to a session.
+
+        Parameters
+        ----------
+        session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+            Session to profile.
+        label : str, optional
+            Name of the session in the recorded spans. The default is the product name
+            followed by a number, such as ``FDTD-1``.
+        """
+        if session in self._sessions:
+            return
+        if label is None:
+            label = "%s-%d" % (type(session).__name__, len(self._sessions) + 1)
+        wrappers = {}
+        for name in dir(type(session)):
+            function = getattr(type(session), name, None)
+            if callable(function) and not name.startswith("_") and (name in _VARIABLE_METHODS or _is_script_command(function)):
+                wrappers[name] = (session.__dict__.get(name), types.MethodType(self._instrument(getattr(session, name), name, label), session))
+        for name, (_, wrapper) in wrappers.items():
+            setattr(session, name, wrapper)
+        self._sessions[session] = wrappers
+
+    def detach(self, session):
+        """Stop recording the calls to a session and restore its methods.
+
+        Parameters
+        ----------
+        session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+            Session attached with :meth:`attach`.
+        """
+        wrappers = self._sessions.pop(session, {})
+        for name, (previous, wrapper) in wrappers.items():
+            # Leave methods alone if another helper replaced them after the profiler did.
+            if session.__dict__.get(name) is not wrapper:
+                continue
+            if previous is None:
+                del session.__dict__[name]
+            else:
+                setattr(session, name, previous)
+
+    def _instrument(self, method, name, label):
+        """Wrap a bound session method so that its calls are recorded while the profiler is running."""
+
+        @functools.wraps(method)
+        def instrumented(session, *args, **kwargs):
+            if not self._running:
+                return method(*args, **kwargs)
+            stack = _stack()
+            span = Span(name, label, stack[-1] if stack else None)
+            span.bytes_sent = _payload_size(args) + _payload_size(kwargs)
+            stack.append(span)
+            try:
+                result = method(*args, **kwargs)
+                span.bytes_received = _payload_size(result)
+                return result
+            except Exception as error:
+                span.error = str(error)
+                raise
+            finally:
+                span.end = time.perf_counter_ns()
+                stack.pop()
+                with self._lock:
+                    self._spans.append(span)
+
+        return instrumented
+
+    def start(self):
+        """Start recording calls."""
+        if not self._running:
+            _acquire_translator_hooks()
+            self._running = True
+
+    def stop(self):
+        """Stop recording calls. The recorded spans are kept."""
+        if self._running:
+            self._running = False
+            _release_translator_hooks()
+
+    def reset(self):
+        """Discard the recorded spans."""
+        with self._lock:
+            self._spans = []
+
+    def close(self):
+        """Stop recording calls and detach all sessions."""
+        self.stop()
+        for session in list(self._sessions):
+            self.detach(session)
+
+    def __enter__(self):
+        """Start recording calls."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop recording calls and detach all sessions."""
+        self.close()
+
+    def stats(self):
+        """Return statistics of the recorded calls for each session method.
+
+        Calls made by other calls, such as the ``getid`` call of ``addrect``, are counted
+        separately, and their time is also part of the time of the enclosing call.
+
+        Returns
+        -------
+        dict of str to CallStats
+            Statistics keyed by the method name, sorted by decreasing total time.
+        """
+        stats = {}
+        for span in self.spans:
+            stats.setdefault(span.name, CallStats(span.name))._add(span)
+        return dict(sorted(stats.items(), key=lambda item: -item[1].total_time))
+
+    def summary(self, limit=None):
+        """Return a table of the recorded calls, slowest first.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Maximum number of methods to list.
+
+        Returns
+        -------
+        str
+            Table with the number of calls, the total, mean, and longest wall time, the
+            translation time, and the data transferred for each session method.
+        """
+        rows = list(self.stats().values())[:limit]
+        width = max([len(row.name) for row in rows] + [len("Call")])
+        lines = [
+            "%-*s %8s %6s %11s %10s %10s %15s %10s %13s"
+            % (width, "Call", "Count", "Errors", "Total (s)", "Mean (ms)", "Max (ms)", "Translation (s)", "Sent (MB)", "Received (MB)")
+        ]
+        for row in rows:
+            lines.append(
+                "%-*s %8d %6d %11.4f %10.3f %10.3f %15.4f %10.3f %13.3f"
+                % (
+                    width,
+                    row.name,
+                    row.count,
+                    row.errors,
+                    row.total_time,
+                    row.mean_time * 1e3,
+                    row.max_time * 1e3,
+                    row.translation_time,
+                    row.bytes_sent / 1e6,
+                    row.bytes_received / 1e6,
+                )
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """Return the recorded calls in the Chrome trace event format.
+
+        The trace can be opened in ``chrome://tracing`` or `Perfetto`_. Each call is a
+        complete event on the track of its thread, and the conversions of values are
+        nested events in the ``translation`` category.
+
+        .. _Perfetto: https://ui.perfetto.dev/
+
+        Returns
+        -------
+        dict
+            JSON-serializable trace with a ``traceEvents`` list.
+        """
+        pid = os.getpid()
+        events = []
+        for span in self.spans:
+            args = {"session": span.session, "bytes_sent": span.bytes_sent, "bytes_received": span.bytes_received}
+            if span.error is not None:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "lumerical",
+                    "ph": "X",
+                    "ts": span.start / 1e3,
+                    "dur": (span.end - span.start) / 1e3,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": args,
+                }
+            )
+            for start, end in span.translations:
+                events.append(
+                    {
+                        "name": "translate",
+                        "cat": "translation",
+                        "ph": "X",
+                        "ts": start / 1e3,
+                        "dur": (end - start) / 1e3,
+                        "pid": pid,
+                        "tid": span.thread_id,
+                    }
+                )
+        events.sort(key=lambda event: (event["ts"], -event["dur"]))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path):
+        """Write the recorded calls to a file in the Chrome trace event format.
+
+        Parameters
+        ----------
+        path : str or Path
+            File to write.
+        """
+        with Path(path).open("w") as file:
+            json.dump(self.chrome_trace(), file)
+
+    def otel_spans(self):
+        """Return the recorded calls as spans in the OTLP JSON encoding of OpenTelemetry.
+
+        Each span has the keys of the OTLP JSON ``Span`` message, such as ``traceId``,
+        ``spanId``, ``parentSpanId``, and ``startTimeUnixNano``, with times as strings
+        and attributes as a list of ``key`` and ``value`` pairs. The spans can be sent to
+        a tracing backend in the ``spans`` list of a ``scopeSpans`` entry. All spans
+        recorded by a profiler share a trace ID.
+
+        Returns
+        -------
+        list of dict
+            One span per call, in the order in which the calls finished.
+        """
+        spans = []
+        for span in self.spans:
+            attributes = {
+                "lumerical.session": span.session,
+                "lumerical.bytes_sent": span.bytes_sent,
+                "lumerical.bytes_received": span.bytes_received,
+                "lumerical.translation_time_ns": sum(end - start for start, end in span.translations),
+                "thread.id": span.thread_id,
+            }
+            status = {"code": _OTLP_STATUS_CODE_OK} if span.error is None else {"code": _OTLP_STATUS_CODE_ERROR, "message": span.error}
+            spans.append(
+                {
+                    "traceId": self._trace_id,
+                    "spanId": "%016x" % span.span_id,
+                    "parentSpanId": "" if span.parent_id is None else "%016x" % span.parent_id,
+                    "name": span.name,
+                    "kind": _OTLP_SPAN_KIND_CLIENT,
+                    "startTimeUnixNano": str(self._epoch_offset + span.start),
+                    "endTimeUnixNano": str(self._epoch_offset + span.end),
+                    "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()],
+                    "status": status,
+                }
+            )
+        return spans
@@ -0,0 +1,315 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Cache simulation results on disk, keyed by the content of the simulated project."""
+
+import contextlib
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+
+import numpy as np
+
+import ansys.api.lumerical.lumapi as lumapi
+
+_PROJECT_EXTENSIONS = {"FDTD": ".fsp", "MODE": ".lms", "DEVICE": ".ldev", "INTERCONNECT": ".icp"}
+
+_MANIFEST_KEY = "manifest"
+_ENTRY_SUFFIX = ".npz"
+
+
+def _project_extension(session):
+    """Return the project file extension of a session."""
+    for session_class in type(session).__mro__:
+        if session_class.__name__ in _PROJECT_EXTENSIONS:
+            return _PROJECT_EXTENSIONS[session_class.__name__]
+    suffix = Path(session.currentfilename()).suffix
+    if not suffix:
+        raise lumapi.LumApiError("Cannot determine the project file type of the session")
+    return suffix
+
+
+@contextlib.contextmanager
+def _project_copy(session):
+    """Save a copy of the project of a session to a temporary directory and yield its path.
+
+    Saving a project makes the saved file the current project file of the session. The
+    original project file is not written, so unsaved changes never reach it, and the
+    session keeps the name of the copy, which is deleted on exit.
+    """
+    extension = _project_extension(session)
+    with tempfile.TemporaryDirectory(prefix="lumerical_cache_") as directory:
+        project = Path(directory, "project" + extension)
+        session.save(str(project))
+        yield project
+
+
+def _digest(project, results, extra):
+    """Return the cache key of a saved project and the requested results."""
+    digest = hashlib.sha256()
+    with project.open("rb") as file:
+        for block in iter(lambda: file.read(2**20), b""):
+            digest.update(block)
+    digest.update(json.dumps([[list(pair) for pair in results], extra], sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def _flatten(value, arrays):
+    """Return a JSON-compatible description of a result, moving its arrays into ``arrays``."""
+    if isinstance(value, np.ndarray):
+        key = "array_%d" % len(arrays)
+        arrays[key] = value
+        return {"array": key}
+    if isinstance(value, dict):
+        return {"dict": [[key, _flatten(item, arrays)] for key, item in value.items()]}
+    if isinstance(value, list):
+        return {"list": [_flatten(item, arrays) for item in value]}
+    if isinstance(value, tuple):
+        return {"tuple": [_flatten(item, arrays) for item in value]}
+    if isinstance(value, np.generic):
+        return {"value": value.item()}
+    return {"value": value}
+
+
+def _unflatten(description, arrays):
+    """Rebuild a result from the description returned by ``_flatten``."""
+    if "array" in description:
+        return arrays[description["array"]]
+    if "dict" in description:
+        return {key: _unflatten(item, arrays) for key, item in description["dict"]}
+    if "list" in description:
+        return [_unflatten(item, arrays) for item in description["list"]]
+    if "tuple" in description:
+        return tuple(_unflatten(item, arrays) for item in description["tuple"])
+    return description["value"]
+
+
+def _write_entry(path, manifest, arrays):
+    """Atomically write a JSON manifest and its arrays to a compressed ``.npz`` file."""
+    arrays = dict(arrays, **{_MANIFEST_KEY: np.array(json.dumps(manifest))})
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            np.savez_compressed(file, **arrays)
+        Path(temporary).replace(path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+def _read_entry(path):
+    """Read the JSON manifest and the arrays written by ``_write_entry``."""
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    return json.loads(str(arrays.pop(_MANIFEST_KEY))), arrays
+
+
+class ResultCache:
+    """On-disk cache of simulation results, keyed by the saved project and the requested results.
+
+    Before a simulation runs, the project is saved and hashed together with the names
+    of the requested results. If the cache already holds results for the same hash, they
+    are returned without running the solver. Otherwise, the simulation runs and the
+    results are stored as a compressed ``.npz`` file. When the cache grows beyond its
+    limits, the least recently used entries are evicted.
+
+    The cache directory can be shared by several processes. Entries are written
+    atomically.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory to store the cache in. It is created if it does not exist.
+    max_bytes : int, default: 10737418240
+        Maximum total size of the cached results on disk.
+    max_entries : int, optional
+        Maximum number of cached simulations.
+
+    Examples
+    --------
+    Skip repeated simulations of identical designs in an optimization loop.
+
+    >>> from ansys.lumerical.core.result_cache import ResultCache
+    >>> cache = ResultCache("result_cache", max_bytes=2**30)
+    >>> def figure_of_merit(fdtd, width):
+    ...     fdtd.switchtolayout()
+    ...     fdtd.setnamed("waveguide", "y span", width)
+    ...     results = cache.run(fdtd, [("output", "T")])
+    ...     return results["output", "T"]["T"].max()
+    """
+
+    def __init__(self, directory, max_bytes=10 * 2**30, max_entries=None):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory(self):
+        """Directory that stores the cache."""
+        return self._directory
+
+    def _entries(self):
+        """Return the cached entry files."""
+        return list(self._directory.glob("*" + _ENTRY_SUFFIX))
+
+    def __len__(self):
+        """Return the number of cached simulations."""
+        return len(self._entries())
+
+    @property
+    def size(self):
+        """Total size of the cached results on disk, in bytes."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def key(self, session, results, extra=None):
+        """Return the cache key of a simulation.
+
+        A copy of the project is saved to a temporary directory, hashed, and deleted.
+        The project file of the session is not written. Afterwards, the current project
+        file of the session is the deleted copy, so pass a file name to ``save`` to save
+        the project again.
+
+        Parameters
+        ----------
+        session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+            Session with the project to simulate.
+        results : list of tuple of str
+            Pairs of object name and result name to get after the simulation.
+        extra : any, optional
+            Additional JSON-serializable data that affects the results, for example the
+            arguments of ``run``.
+
+        Returns
+        -------
+        str
+            Hexadecimal SHA-256 digest.
+        """
+        with _project_copy(session) as project:
+            return _digest(project, results, extra)
+
+    def get(self, key):
+        """Return the cached results for a key, or ``None`` if they are not cached.
+
+        Parameters
+        ----------
+        key : str
+            Key returned by :meth:`key`.
+
+        Returns
+        -------
+        dict or None
+            Results keyed by pairs of object name and result name.
+        """
+        path = Path(self._directory, key + _ENTRY_SUFFIX)
+        try:
+            manifest, arrays = _read_entry(path)
+            # Record the access time for the least recently used eviction.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return {tuple(pair): _unflatten(description, arrays) for pair, description in manifest}
+
+    def put(self, key, results):
+        """Store results in the cache and evict the least recently used entries if needed.
+
+        Parameters
+        ----------
+        key : str
+            Key returned by :meth:`key`.
+        results : dict
+            Results keyed by pairs of object name and result name.
+        """
+        arrays = {}
+        manifest = [[list(pair), _flatten(value, arrays)] for pair, value in results.items()]
+        _write_entry(Path(self._directory, key + _ENTRY_SUFFIX), manifest, arrays)
+        self._evict()
+
+    def _evict(self):
+        """Remove the least recently used entries until the cache is within its limits."""
+        with self._lock:
+            entries = []
+            for entry in self._entries():
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry))
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            while entries and (total > self._max_bytes or (self._max_entries is not None and len(entries) > self._max_entries)):
+                _, size, entry = entries.pop(0)
+                entry.unlink(missing_ok=True)
+                total -= size
+
+    def run(self, session, results, *args, extra=None):
+        """Run a simulation unless its results are cached, and return the requested results.
+
+        Parameters
+        ----------
+        session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+            Session with the project to simulate, in layout mode.
+        results : list of tuple of str
+            Pairs of object name and result name to get, for example ``[("monitor", "T")]``.
+        *args : any
+            Arguments of the ``run`` script command.
+        extra : any, optional
+            Additional JSON-serializable data that affects the results.
+
+        Returns
+        -------
+        dict
+            Results returned by ``getresult``, keyed by pairs of object name and result name.
+            On a cache hit the simulation does not run, so the results are not available in
+            the session. As for :meth:`key`, the current project file of the session is a
+            deleted copy afterwards.
+        """
+        results = [tuple(pair) for pair in results]
+        with _project_copy(session) as project:
+            key = _digest(project, results, [list(args), extra])
+            cached = self.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            # The simulation runs on the copy, so the results are not written to the
+            # project file of the session either.
+            self.misses += 1
+            values = self._simulate(session, results, args)
+        self.put(key, values)
+        return values
+
+    @staticmethod
+    def _simulate(session, results, args):
+        """Run a simulation and return the requested results."""
+        session.run(*args)
+        return {pair: session.getresult(*pair) for pair in results}
+
+    def clear(self):
+        """Remove all cached results."""
+        for entry in self._entries():
+            entry.unlink(missing_ok=True)
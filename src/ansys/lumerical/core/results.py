@@ -0,0 +1,445 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Retrieve simulation results that are too large to hold in memory, or in columnar form."""
+
+import itertools
+import json
+import math
+from pathlib import Path
+import re
+import tempfile
+
+import numpy as np
+
+import ansys.api.lumerical.lumapi as lumapi
+
+from . import transfer
+from .script_batch import _remove_prompt_line
+from .transfer import _GEOMETRY_DIMS, _dataset_layout, _internal_name, _reshape_view, _script_string
+
+_DEFAULT_CHUNK_BYTES = 256 * 2**20
+"""Default upper bound on the size of each chunk transferred from the session."""
+
+_GEOMETRY_AXES = ("x", "y", "z")
+
+_RESULT_FORMATS = ("dict", "arrow")
+
+
+def _split_names(names):
+    """Split a newline-separated list of names returned by a script command."""
+    return [name for name in str(names).split("\n") if name]
+
+
+def _file_name(name):
+    """Return a file name for a dataset member."""
+    return re.sub(r"[^\w.-]", "_", name) + ".npy"
+
+
+def _get_member(session, expression):
+    """Evaluate a script expression and return its value."""
+    member = _internal_name("member")
+    session.eval("%s = %s;" % (member, expression))
+    try:
+        return session.getv(member)
+    finally:
+        session.eval("clear(%s);" % member)
+
+
+def _stream_matrix(session, expression, path, chunk_bytes):
+    """Stream a matrix to an ``.npy`` file in chunks and return it as a read-only memmap.
+
+    Each chunk is a range of elements in Fortran order, which is contiguous in the file,
+    so chunks respect ``chunk_bytes`` whatever the shape of the matrix.
+    """
+    matrix = _internal_name("matrix")
+    chunk = matrix + "_chunk"
+    session.eval("%s = %s;\n%s_size = size(%s);" % (matrix, expression, matrix, matrix))
+    try:
+        shape = tuple(int(n) for n in np.ravel(session.getv(matrix + "_size")))
+        size = math.prod(shape)
+        # Size chunks for complex data so that they never exceed the limit. A chunk of
+        # one element is a scalar in the session, so a last chunk of one element is
+        # extended backwards by one element.
+        chunk_len = max(2, chunk_bytes // 16)
+
+        array = flat = None
+        for start in range(0, size, chunk_len):
+            stop = min(start + chunk_len, size)
+            if stop - start == 1 and start > 0:
+                start -= 1
+            session.eval("%s = %s(%d:%d);" % (chunk, matrix, start + 1, stop))
+            if array is None:
+                # The first chunk determines whether the file stores real or complex data.
+                first = np.asarray(transfer.getv(session, chunk))
+                array = np.lib.format.open_memmap(path, mode="w+", dtype=first.dtype, shape=shape, fortran_order=True)
+                flat = array.reshape(-1, order="F")
+                flat[start:stop] = first.ravel(order="F")
+                del first
+            else:
+                # The chunk is copied straight from the interop buffer into the file.
+                transfer.getv(session, chunk, out=flat[start:stop].reshape(-1, 1))
+    finally:
+        session.eval("clear(%s, %s_size, %s);" % (matrix, matrix, chunk))
+
+    if array is None:
+        array = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=shape, fortran_order=True)
+    array.flush()
+    del array, flat
+    return np.load(path, mmap_mode="r")
+
+
+def _member_sizes(session, vname, attribute_names, parameter_names):
+    """Return the shape of each attribute and the length of each parameter of a dataset in the session."""
+    sizes = vname + "_sizes"
+    expressions = ["size(getattribute(%s, %s))" % (vname, _script_string(name)) for name in attribute_names]
+    expressions += ["length(getparameter(%s, %s))" % (vname, _script_string(name)) for name in parameter_names]
+    if not expressions:
+        return [], []
+    session.eval("%s = cell(%d);\n" % (sizes, len(expressions)) + "".join("%s{%d} = %s;\n" % (sizes, i + 1, e) for i, e in enumerate(expressions)))
+    try:
+        values = session.getv(sizes)
+    finally:
+        session.eval("clear(%s);" % sizes)
+    shapes = [tuple(int(n) for n in np.ravel(value)) for value in values[: len(attribute_names)]]
+    return shapes, [int(np.ravel(value)[0]) for value in values[len(attribute_names) :]]
+
+
+def _parameter_groups(names, lengths, attribute_shapes, geometry_dims):
+    """Group the parameters of a dataset the same way as its ``Lumerical_dataset`` metadata.
+
+    Interdependent parameters, such as ``lambda`` and ``f``, share one dimension of the
+    attributes. The session lists the parameters group by group, so the groups are the
+    partition of that list into runs of parameters of equal length that is consistent
+    with the shape of every attribute: one dimension per group after the geometry, then
+    at most one dimension for the components. The partition with the fewest groups is
+    preferred when several are consistent.
+    """
+    if not names:
+        return []
+    for count in range(1, len(names) + 1):
+        for cuts in itertools.combinations(range(1, len(names)), count - 1):
+            bounds = (0, *cuts, len(names))
+            groups = [list(range(start, stop)) for start, stop in zip(bounds, bounds[1:])]
+            if any(len({lengths[i] for i in group}) > 1 for group in groups):
+                continue
+            group_lengths = [lengths[group[0]] for group in groups]
+            if all(_fits_parameters(shape[geometry_dims:], group_lengths) for shape in attribute_shapes):
+                return [[names[i] for i in group] for group in groups]
+    raise lumapi.LumApiError("Inconsistency between dataset parameters and attribute data shape")
+
+
+def _fits_parameters(dimensions, group_lengths):
+    """Return whether attribute dimensions after the geometry match the parameter groups."""
+    # The session drops trailing singleton dimensions, so pad them back.
+    dimensions = list(dimensions) + [1] * (len(group_lengths) - len(dimensions))
+    return dimensions[: len(group_lengths)] == group_lengths and len(dimensions) <= len(group_lengths) + 1
+
+
+def getresult_mmap(session, object_name, result_name, path=None, chunk_bytes=_DEFAULT_CHUNK_BYTES):
+    """Get a dataset result and store its attributes on disk as memory-mapped arrays.
+
+    The ``getresult`` method of a session transfers a whole dataset into memory at once.
+    This function transfers each attribute in chunks of at most ``chunk_bytes`` bytes,
+    writes it to an ``.npy`` file, and returns the attribute as a read-only
+    :class:`numpy.memmap`, so only the slices that are accessed are paged into memory.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to get the result from.
+    object_name : str
+        Name of the simulation object, for example a monitor.
+    result_name : str
+        Name of the result, for example ``"E"``.
+    path : str or Path, optional
+        Directory to store the ``.npy`` files in. It is created if it does not exist. By
+        default, a new temporary directory is created. The files are not deleted
+        automatically.
+    chunk_bytes : int, default: 268435456
+        Upper bound on the amount of data transferred from the session at once.
+
+    Returns
+    -------
+    dict
+        Dictionary with the same keys as the dataset returned by ``getresult``. Attributes
+        are :class:`numpy.memmap` arrays in the shape reported by the session, which can
+        omit trailing dimensions of length 1. Parameters, the ``x``, ``y``, and ``z``
+        axes of rectilinear and unstructured datasets, and the ``connectivity`` of
+        unstructured datasets are regular arrays. The ``Lumerical_dataset`` metadata
+        groups interdependent parameters, such as ``lambda`` and ``f``, the same way as
+        ``getresult``. Results that are not datasets are returned the same way as by
+        ``getresult``.
+
+    Examples
+    --------
+    Store the electric field of a 3D monitor on disk and read one frequency.
+
+    >>> from ansys.lumerical.core import results
+    >>> field = results.getresult_mmap(fdtd, "field_monitor", "E", path="field_data")
+    >>> first_frequency = np.array(field["E"][:, :, :, 0, :])
+    """
+    vname = _internal_name("mmap")
+    info = vname + "_info"
+    session.eval(
+        '%(info)s = cell(6);\n%(info)s{1} = 0;\n%(info)s{2} = "";\n%(info)s{3} = "";\n%(info)s{4} = 0;\n%(info)s{5} = "";\n%(info)s{6} = 0;\n'
+        "try{ %(v)s = getresult(%(obj)s, %(res)s); } catch(%(info)s{5});\n"
+        "try{ %(info)s{2} = getattribute(%(v)s); %(info)s{1} = 1; } catch(%(v)s_err);\n"
+        "if(%(info)s{1} == 1){\n"
+        "  try{ %(info)s{3} = getparameter(%(v)s); } catch(%(v)s_err);\n"
+        "  try{ %(v)s_x = %(v)s.x; %(info)s{4} = 1; } catch(%(v)s_err);\n"
+        "  try{ %(v)s_x = %(v)s.connectivity; %(info)s{6} = 1; } catch(%(v)s_err);\n"
+        "}\n" % {"v": vname, "info": info, "obj": _script_string(object_name), "res": _script_string(result_name)}
+    )
+    try:
+        is_dataset, attribute_names, parameter_names, has_geometry, error, is_unstructured = session.getv(info)
+        if error:
+            raise lumapi.LumApiError(_remove_prompt_line(error))
+        if is_dataset < 0.5:
+            return session.getv(vname)
+
+        directory = Path(tempfile.mkdtemp(prefix="lumerical_result_") if path is None else path)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        geometry = ("unstructured" if is_unstructured else "rectilinear") if has_geometry else None
+        attribute_names = _split_names(attribute_names)
+        parameter_names = [name for name in _split_names(parameter_names) if not (geometry and name in _GEOMETRY_AXES)]
+        attribute_shapes, parameter_lengths = _member_sizes(session, vname, attribute_names, parameter_names)
+
+        dataset = {}
+        metadata = {}
+        if geometry == "rectilinear":
+            metadata["geometry"] = geometry
+            for axis in _GEOMETRY_AXES:
+                dataset[axis] = _get_member(session, "%s.%s" % (vname, axis))
+        elif geometry == "unstructured":
+            metadata["geometry"] = geometry
+            for axis in (*_GEOMETRY_AXES, "connectivity"):
+                dataset[axis] = _get_member(session, "%s.%s" % (vname, axis))
+            # Attributes defined on the cells instead of the points have one row per cell.
+            points = np.size(dataset["x"])
+            cell_attributes = [name for name, shape in zip(attribute_names, attribute_shapes) if shape[0] != points]
+            if cell_attributes:
+                metadata["cell_attributes"] = cell_attributes
+                attribute_names = [name for name in attribute_names if name not in cell_attributes]
+        metadata["parameters"] = _parameter_groups(parameter_names, parameter_lengths, attribute_shapes, _GEOMETRY_DIMS[geometry])
+        metadata["attributes"] = attribute_names
+        dataset = {"Lumerical_dataset": metadata, **dataset}
+
+        for name in parameter_names:
+            dataset[name] = _get_member(session, "getparameter(%s, %s)" % (vname, _script_string(name)))
+        for name in attribute_names + metadata.get("cell_attributes", []):
+            expression = "getattribute(%s, %s)" % (vname, _script_string(name))
+            dataset[name] = _stream_matrix(session, expression, Path(directory, _file_name(name)), chunk_bytes)
+        return dataset
+    finally:
+        session.eval("clear(%s, %s, %s_x, %s_err);" % (vname, info, vname, vname))
+
+
+def _import_pyarrow():
+    """Import the optional ``pyarrow`` dependency."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Converting datasets to Arrow tables requires pyarrow. Install it with 'pip install ansys-lumerical-core[arrow]'."
+        ) from None
+    return pyarrow
+
+
+def _arrow_array(pa, values):
+    """Return an Arrow array over a one-dimensional NumPy array, without a copy if it is contiguous.
+
+    Complex values are stored as fixed-size lists of their real and imaginary parts.
+    """
+    if np.iscomplexobj(values):
+        parts = np.ascontiguousarray(values, dtype=complex).view(np.float64)
+        return pa.FixedSizeListArray.from_arrays(pa.array(parts), 2)
+    return pa.array(values)
+
+
+def _attribute_column(pa, block, points):
+    """Return the Arrow column of one component of an attribute, given as a ``[npts, npar_1, npar_2, ...]`` array.
+
+    Rows run over the points first, then over the parameters in Fortran order.
+    """
+    try:
+        return _arrow_array(pa, _reshape_view(block, (block.size,)))
+    except ValueError:
+        pass
+    if points == 1:
+        return _arrow_array(pa, block.ravel(order="F"))
+    # Every parameter combination is a contiguous run of points in the interop layout.
+    combinations = [np.unravel_index(index, block.shape[1:], order="F") for index in range(block.size // points)]
+    return pa.chunked_array([_arrow_array(pa, block[(slice(None), *combination)]) for combination in combinations])
+
+
+def _cell_table(pa, dataset):
+    """Return the cell attributes of an unstructured dataset as columns with one row per cell."""
+    columns = {}
+    for name in dataset["Lumerical_dataset"].get("cell_attributes", []):
+        value = np.asarray(dataset[name])
+        value = value.reshape(value.shape[0], -1, order="F")
+        for component in range(value.shape[1]):
+            columns[name if value.shape[1] == 1 else "%s_%d" % (name, component)] = _arrow_array(pa, value[:, component])
+    return pa.table(columns)
+
+
+def to_arrow(dataset, cells=False):
+    """Convert a dataset to an Arrow table with one row per point and parameter value.
+
+    The table has one column for each geometry axis, each parameter, and each component of
+    each attribute. Rows run over the points of the geometry first, in Fortran order, then
+    over the parameters. The columns of real attributes are views of the attribute
+    buffers when the attributes are laid out like the datasets returned by
+    :func:`ansys.lumerical.core.transfer.getv`, so converting large results does not copy them.
+    Geometry and parameter columns are built from the axes. Complex attributes are stored as
+    fixed-size lists of their real and imaginary parts. The dataset metadata is stored in the
+    ``Lumerical_dataset`` key of the schema metadata, as JSON.
+
+    This function requires the optional `pyarrow <https://arrow.apache.org/docs/python/>`_ package.
+
+    Parameters
+    ----------
+    dataset : dict
+        Dataset returned by the ``getv`` or ``getresult`` methods of a session, or by
+        :func:`ansys.lumerical.core.transfer.getv`.
+    cells : bool, default: False
+        Whether to convert the cell attributes of an unstructured dataset, with one row per
+        cell, instead of the attributes defined on its points.
+
+    Returns
+    -------
+    pyarrow.Table
+        Columns of the dataset. Attributes with more than one component have one column
+        per component, named ``<attribute>_<index>``.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    LumApiError
+        If the value is not a dataset, or if its attributes do not match its metadata.
+
+    Examples
+    --------
+    Write the transmission of a monitor to a Parquet file.
+
+    >>> import pyarrow.parquet as pq
+    >>> from ansys.lumerical.core import results
+    >>> table = results.to_arrow(fdtd.getresult("monitor", "T"))
+    >>> pq.write_table(table, "transmission.parquet")
+    """
+    pa = _import_pyarrow()
+    if not isinstance(dataset, dict) or not isinstance(dataset.get("Lumerical_dataset"), dict):
+        raise lumapi.LumApiError("The value is not a dataset")
+    metadata = dataset["Lumerical_dataset"]
+    if cells:
+        table = _cell_table(pa, dataset)
+    else:
+        geometry_shape, parameter_shape, _ = _dataset_layout(dataset)
+        points = math.prod(geometry_shape or ())
+        combinations = math.prod(parameter_shape)
+
+        columns = {}
+        if geometry_shape is not None:
+            if metadata.get("geometry") == "rectilinear":
+                axes = np.meshgrid(*(np.ravel(dataset[axis]) for axis in _GEOMETRY_AXES), indexing="ij")
+            else:
+                axes = [dataset[axis] for axis in _GEOMETRY_AXES]
+            for axis, values in zip(_GEOMETRY_AXES, axes):
+                column = _arrow_array(pa, np.ravel(values, order="F"))
+                # The same points repeat for every parameter value, so the chunks share one buffer.
+                columns[axis] = pa.chunked_array([column] * combinations) if combinations > 1 else column
+
+        indices = np.unravel_index(np.arange(combinations), parameter_shape, order="F") if parameter_shape else ()
+        for group, index in zip(metadata.get("parameters", []), indices):
+            for name in group:
+                columns[name] = pa.array(np.repeat(np.asarray(dataset[name]).ravel(order="F")[index], points))
+
+        for name in metadata.get("attributes", []):
+            value = np.asarray(dataset[name])
+            components = value.size // max(points * combinations, 1)
+            try:
+                shape = [points, *parameter_shape, components]
+                try:
+                    raw = np.moveaxis(_reshape_view(value, shape), -1, 1)
+                except ValueError:
+                    raw = np.moveaxis(value.reshape(shape, order="F"), -1, 1)
+            except ValueError:
+                raise lumapi.LumApiError("Inconsistency between dataset metadata and attribute data shape") from None
+            for component in range(components):
+                columns[name if components == 1 else "%s_%d" % (name, component)] = _attribute_column(pa, raw[:, component], points)
+        table = pa.table(columns)
+    return table.replace_schema_metadata({"Lumerical_dataset": json.dumps(metadata)})
+
+
+def getresult(session, object_name, result_name, format="dict"):
+    """Get a result of a simulation object, optionally as an Arrow table.
+
+    The result is read with :func:`ansys.lumerical.core.transfer.getv`, so the attributes of a
+    dataset share one contiguous buffer, which :func:`to_arrow` exposes without copying it.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to get the result from.
+    object_name : str
+        Name of the simulation object, for example a monitor.
+    result_name : str
+        Name of the result, for example ``"E"``.
+    format : str, default: "dict"
+        ``"dict"`` returns the result the same way as the ``getresult`` method of a session.
+        ``"arrow"`` converts a dataset result with :func:`to_arrow`.
+
+    Returns
+    -------
+    any
+        The result, or a ``pyarrow.Table`` if ``format`` is ``"arrow"``.
+
+    Raises
+    ------
+    ValueError
+        If ``format`` is unknown, or if ``format`` is ``"arrow"`` and the result is not a dataset.
+    LumApiError
+        If the result cannot be read.
+
+    Examples
+    --------
+    Load the field of a monitor into a DataFrame.
+
+    >>> from ansys.lumerical.core import results
+    >>> frame = results.getresult(fdtd, "field_monitor", "E", format="arrow").to_pandas()
+    """
+    if format not in _RESULT_FORMATS:
+        raise ValueError("Format must be one of %s, not '%s'." % (", ".join(_RESULT_FORMATS), format))
+    vname = _internal_name("result")
+    session.eval("%s = getresult(%s, %s);" % (vname, _script_string(object_name), _script_string(result_name)))
+    try:
+        result = transfer.getv(session, vname)
+    finally:
+        session.eval("clear(%s);" % vname)
+    if format == "dict":
+        return result
+    if not isinstance(result, dict) or "Lumerical_dataset" not in result:
+        raise ValueError("Result '%s' of '%s' is not a dataset and cannot be converted to an Arrow table." % (result_name, object_name))
+    return to_arrow(result)
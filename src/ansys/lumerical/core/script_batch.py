@@ -0,0 +1,230 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Record script commands and send them to a Lumerical session in a single round-trip."""
+
+import re
+
+import numpy as np
+
+import ansys.api.lumerical.lumapi as lumapi
+
+from .transfer import _script_string
+
+
+def _remove_prompt_line(message):
+    """Remove the ``prompt line N:`` prefix from a Lumerical script error message."""
+    return re.sub(r"^(Error:)\s(prompt line)\s[0-9]+:", "", str(message)).strip()
+
+
+class ScriptBatch:
+    """Record script commands and evaluate them in a single round-trip.
+
+    Each script command called as a method of a session, for example ``set``,
+    ``setnamed``, or ``addrect``, is a separate round-trip between Python and the
+    product that transfers its arguments, evaluates the command, and reads back the
+    result. A batch records the calls instead and, when flushed, transfers all
+    arguments at once and evaluates the recorded commands as one generated script.
+
+    Recorded calls do not return values, so use a batch for commands whose return
+    value is not needed, such as setting up geometry and properties.
+
+    .. warning::
+
+        Don't initialize this class directly. Use :func:`ansys.lumerical.core.batch`.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session the commands are evaluated in.
+    """
+
+    def __init__(self, session):
+        self._session = session
+        vname = "internal_lum_batch_" + str(np.random.randint(10000, 100000))
+        self._vin = vname + "i"
+        self._vout = vname + "o"
+        self.discard()
+
+    def __len__(self):
+        """Return the number of recorded commands."""
+        return len(self._statements)
+
+    def __getattr__(self, name):
+        """Return a function that records the script command ``name``."""
+        if name.startswith("_"):
+            raise AttributeError("'ScriptBatch' object has no attribute '%s'" % name)
+        return lambda *args, **kwargs: self.call(name, *args, **kwargs)
+
+    def _value(self, value):
+        """Queue a value for transfer and return the script expression that refers to it."""
+        self._values.append(value)
+        return "%s{%d}" % (self._vin, len(self._values))
+
+    def _set_property(self, key, value, fallback_key=None):
+        """Return the script that sets a property of the selected object."""
+        ref = self._value(value)
+        code = "set(%s, %s);" % (_script_string(key), ref)
+        if fallback_key is not None and fallback_key != key:
+            # Mirror the keyword argument handling of constructor methods such as
+            # ``addrect(x_span=...)``: try the name with spaces, then the name as given.
+            vout = self._vout
+            code = "%s{4} = 0;\ntry{ %s %s{4} = 1; } catch(%s{5});\nif(%s{4} == 0){ set(%s, %s); }" % (
+                vout,
+                code,
+                vout,
+                vout,
+                vout,
+                _script_string(fallback_key),
+                ref,
+            )
+        return code
+
+    def call(self, command, /, *args, **kwargs):
+        """Record a call of a script command.
+
+        Parameters
+        ----------
+        command : str
+            Name of the script command.
+        *args : optional
+            Positional arguments of the command.
+        **kwargs : optional
+            Properties to set on the object that the command selects, for example the
+            object added by ``addrect``. As with constructor methods of a session,
+            underscores in property names are replaced with spaces, and a ``properties``
+            dictionary sets properties by their exact names.
+        """
+        arg_refs = [self._value(arg) for arg in args]
+        statements = [command + ("(" + ", ".join(arg_refs) + ")" if arg_refs else "") + ";"]
+        properties = kwargs.pop("properties", {})
+        for key, value in properties.items():
+            statements.append(self._set_property(key, value))
+        for key, value in kwargs.items():
+            statements.append(self._set_property(key.replace("_", " "), value, fallback_key=key))
+        self._statements.append("\n".join(statements))
+        self._labels.append(command)
+
+    def eval(self, code):
+        """Record raw Lumerical script code.
+
+        Parameters
+        ----------
+        code : str
+            Lumerical script code evaluated in order with the other recorded commands.
+        """
+        self._statements.append(code)
+        self._labels.append("eval")
+
+    def discard(self):
+        """Discard all recorded commands without evaluating them."""
+        self._values = []
+        self._statements = []
+        self._labels = []
+
+    def script(self):
+        """Return the script that :meth:`flush` evaluates for the recorded commands.
+
+        Returns
+        -------
+        str
+            Generated Lumerical script code.
+        """
+        vout = self._vout
+        code = '%s = cell(5);\n%s{1} = 0;\n%s{2} = "";\n%s{3} = 0;\ntry{\n' % (vout, vout, vout, vout)
+        for index, statement in enumerate(self._statements):
+            code += "%s\n%s{3} = %d;\n" % (statement, vout, index + 1)
+        code += "%s{1} = 1;\n} catch(%s{2});\n" % (vout, vout)
+        return code
+
+    def flush(self):
+        """Evaluate all recorded commands in the session and clear the batch.
+
+        Raises
+        ------
+        LumApiError
+            If a recorded command fails. Commands recorded before the failing one
+            have already been applied to the session.
+        """
+        if not self._statements:
+            return
+
+        code = self.script()
+        values, labels = self._values, self._labels
+        self.discard()
+
+        session = self._session
+        if values:
+            session.putv(self._vin, values)
+        try:
+            session.eval(code)
+            rvals = session.getv(self._vout)
+        finally:
+            session.eval("clear(%s);" % (self._vin + ", " + self._vout if values else self._vout))
+
+        if rvals[0] < 0.9:
+            completed = int(rvals[2])
+            raise lumapi.LumApiError("%s (batched call %d: %s)" % (_remove_prompt_line(rvals[1]), completed + 1, labels[completed]))
+
+    def __enter__(self):
+        """Return the batch for use in a ``with`` statement."""
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """Flush the batch, or discard it if the ``with`` block raised an exception."""
+        if type is None:
+            self.flush()
+        else:
+            self.discard()
+
+
+def batch(session):
+    """Create a batch that records script commands and evaluates them in a single round-trip.
+
+    Use the returned :class:`ScriptBatch` in a ``with`` statement. Call script commands
+    on it the same way as on the session. The commands are evaluated when the ``with``
+    block exits, using one transfer for all arguments and one generated script.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session the commands are evaluated in.
+
+    Returns
+    -------
+    :class:`ansys.lumerical.core.script_batch.ScriptBatch`
+        Batch that records script commands.
+
+    Examples
+    --------
+    Set up an RCWA solver with one round-trip instead of one per property.
+
+    >>> import ansys.lumerical.core as lumapi
+    >>> fdtd = lumapi.FDTD(hide=True)
+    >>> fdtd.addrcwa(name="RCWA")
+    >>> with lumapi.batch(fdtd) as b:
+    ...     b.addcircle(name="pillar", radius=100e-9, z_min=0, z_max=1e-6)
+    ...     b.setnamed("RCWA", "x span", 500e-9)
+    ...     b.setnamed("RCWA", "y span", 500e-9)
+    ...     b.setnamed("RCWA", "frequency points", 1)
+    """
+    return ScriptBatch(session)
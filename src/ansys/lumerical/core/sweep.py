@@ -0,0 +1,292 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Run parameter sweeps across several Lumerical sessions in parallel."""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+from multiprocessing import util
+
+import ansys.api.lumerical.lumapi as lumapi
+
+from . import _normalize_path, autodiscovery
+from .pool import SessionPool, _is_session_alive
+from .workers import capture_state, initialize
+
+_EXECUTOR_KINDS = ("thread", "process")
+
+_worker_pool = None
+"""Session pool owned by the current worker process in ``"process"`` mode."""
+
+
+def _call_with_retry(pool, fn, param, retries):
+    """Call ``fn(session, param)`` on a leased session, retrying on a fresh session if the connection is lost."""
+    attempt = 0
+    while True:
+        session = pool.acquire()
+        try:
+            result = fn(session, param)
+        except lumapi.LumApiError:
+            alive = _is_session_alive(session)
+            pool.release(session, discard=not alive)
+            if alive or attempt >= retries:
+                raise
+            attempt += 1
+        except BaseException:
+            pool.release(session)
+            raise
+        else:
+            pool.release(session)
+            return result
+
+
+def _resolve_install(version):
+    """Return the installation of a Lumerical version, given as a version or a :class:`LumericalInstall`."""
+    if isinstance(version, autodiscovery.LumericalInstall):
+        return version
+    install = autodiscovery.get_lumerical_install(version)
+    if install is None:
+        raise ValueError("Lumerical %s is not installed." % version)
+    return install
+
+
+def _is_current_install(install):
+    """Return whether an installation is the one configured in the current process."""
+    return _normalize_path(install.path) == _normalize_path(lumapi.InteropPaths.LUMERICALINSTALLDIR or ".")
+
+
+def _init_worker_process(product, hide, reset_script, session_kwargs, state):
+    """Configure a worker process from the state of its parent and start its single session."""
+    global _worker_pool
+    initialize(state)
+    _worker_pool = SessionPool(product, size=1, hide=hide, reset_script=reset_script, **session_kwargs)
+    # Worker processes can exit without running atexit hooks, but they always run the
+    # multiprocessing finalizers, so close the session there.
+    util.Finalize(_worker_pool, _worker_pool.close, exitpriority=10)
+
+
+def _call_in_worker_process(fn, param, retries):
+    """Run one job on the worker process session."""
+    return _call_with_retry(_worker_pool, fn, param, retries)
+
+
+def map_sessions(
+    fn, params, product="fdtd", workers=1, executor="thread", retries=1, hide=True, reset_script=None, pool=None, version=None, **session_kwargs
+):
+    """Apply a function to each parameter, spreading the calls across several open sessions.
+
+    Each call receives a session that is leased from a :class:`ansys.lumerical.core.SessionPool`
+    and reset before it is handed to the next call, so ``fn`` always starts from an empty
+    project. If a call raises :class:`ansys.api.lumerical.lumapi.LumApiError` because the
+    connection to the product was lost, the session is discarded and the call is retried on
+    a freshly started session.
+
+    Parameters
+    ----------
+    fn : callable
+        Function called as ``fn(session, param)`` for each parameter. Use
+        :func:`functools.partial` to bind additional arguments.
+    params : iterable
+        Parameters to pass to ``fn``.
+    product : str, default: "fdtd"
+        Product to start. Options are ``"fdtd"``, ``"mode"``, ``"device"``, and ``"interconnect"``.
+    workers : int, default: 1
+        Number of sessions, and calls, that run concurrently.
+    executor : str, default: "thread"
+        ``"thread"`` runs the calls in threads of the current process, which share one
+        session pool. ``"process"`` runs the calls in worker processes that each open
+        their own session, in which case ``fn`` and its parameters and results must be
+        picklable.
+    retries : int, default: 1
+        Number of times a call is retried on a fresh session after a lost connection.
+    hide : bool, default: True
+        Whether to hide the product GUI.
+    reset_script : str, optional
+        Lumerical script that resets a session between calls. See :class:`ansys.lumerical.core.SessionPool`.
+    pool : :class:`ansys.lumerical.core.SessionPool`, optional
+        Existing pool to lease sessions from in ``"thread"`` mode. The pool is not closed
+        when the sweep finishes, so its sessions can be reused by later sweeps. When given,
+        ``product``, ``hide``, ``reset_script``, and ``session_kwargs`` are ignored.
+    version : str or :class:`ansys.lumerical.core.autodiscovery.LumericalInstall`, optional
+        Lumerical release to run the sessions on, for example ``"2025 R2"`` or ``"v252"``.
+        The installation path is global to a process, so a release other than the one
+        configured in the current process requires ``executor="process"``, whose worker
+        processes are then spawned instead of forked, so ``fn`` must be importable from
+        them. The default is the installation configured in the current process.
+    **session_kwargs : dict, optional
+        Additional keyword arguments passed to the session constructor.
+
+    Returns
+    -------
+    list
+        Return values of ``fn``, in the same order as ``params``.
+
+    Raises
+    ------
+    ValueError
+        If ``executor`` is not ``"thread"`` or ``"process"``, if ``pool`` is given in ``"process"`` mode,
+        or if ``version`` is not installed or requires ``"process"`` mode.
+
+    Examples
+    --------
+    Compute the transmission of a unit cell for several pillar radii on four sessions.
+
+    >>> import numpy as np
+    >>> import ansys.lumerical.core as lumapi
+    >>> def unit_cell(fdtd, radius):
+    ...     fdtd.addcircle(name="pillar", radius=radius, z_min=0, z_max=1e-6)
+    ...     fdtd.addrcwa(name="RCWA")
+    ...     fdtd.run()
+    ...     return fdtd.getresult("RCWA", "total_energy")
+    >>> results = lumapi.map_sessions(unit_cell, np.linspace(50e-9, 150e-9, 50), workers=4)
+    """
+    if executor not in _EXECUTOR_KINDS:
+        raise ValueError("Executor must be one of %s, not '%s'." % (", ".join(_EXECUTOR_KINDS), executor))
+    if workers < 1:
+        raise ValueError("At least one worker is required.")
+    params = list(params)
+    workers = min(workers, max(len(params), 1))
+    install = None if version is None else _resolve_install(version)
+
+    if executor == "process":
+        if pool is not None:
+            raise ValueError("A session pool cannot be shared with worker processes.")
+        process_executor = _start_process_executor(workers, product, hide, reset_script, session_kwargs, install)
+        with process_executor:
+            futures = [process_executor.submit(_call_in_worker_process, fn, param, retries) for param in params]
+            return _collect_in_order(futures)
+
+    if install is not None and not _is_current_install(install):
+        raise ValueError(
+            "Lumerical %s is not the installation of this process (%s). Use executor='process' to run it in worker processes."
+            % (install.release, lumapi.InteropPaths.LUMERICALINSTALLDIR or "not configured")
+        )
+    own_pool = pool is None
+    if own_pool:
+        pool = SessionPool(product, size=workers, hide=hide, reset_script=reset_script, **session_kwargs)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as thread_executor:
+            futures = [thread_executor.submit(_call_with_retry, pool, fn, param, retries) for param in params]
+            return _collect_in_order(futures)
+    finally:
+        if own_pool:
+            pool.close()
+
+
+def map_versions(fn, params, versions, product="fdtd", workers=1, retries=1, hide=True, reset_script=None, **session_kwargs):
+    """Apply a function to each parameter on each of several Lumerical releases.
+
+    The installation path of the interop library is global to a process, so each release
+    runs in its own worker processes. Workers of a release other than the one configured
+    in the current process are spawned instead of forked, so that they do not inherit its
+    interop library, and ``fn`` must be importable from them. All releases run at the
+    same time, which keeps A/B comparisons between releases in a single script.
+
+    Parameters
+    ----------
+    fn : callable
+        Function called as ``fn(session, param)`` for each parameter and release. ``fn``
+        and its parameters and results must be picklable, and ``fn`` must be defined at
+        the top level of a module.
+    params : iterable
+        Parameters to pass to ``fn``.
+    versions : iterable of str or :class:`ansys.lumerical.core.autodiscovery.LumericalInstall`
+        Releases to run, for example ``["2025 R1", "2025 R2"]``. Use
+        :func:`ansys.lumerical.core.autodiscovery.find_lumerical_installs` to list the
+        installed releases.
+    product : str, default: "fdtd"
+        Product to start. Options are ``"fdtd"``, ``"mode"``, ``"device"``, and ``"interconnect"``.
+    workers : int, default: 1
+        Number of worker processes, and sessions, for each release.
+    retries : int, default: 1
+        Number of times a call is retried on a fresh session after a lost connection.
+    hide : bool, default: True
+        Whether to hide the product GUI.
+    reset_script : str, optional
+        Lumerical script that resets a session between calls. See :class:`ansys.lumerical.core.SessionPool`.
+    **session_kwargs : dict, optional
+        Additional keyword arguments passed to the session constructor.
+
+    Returns
+    -------
+    dict
+        Return values of ``fn`` in the same order as ``params``, keyed by the entries of ``versions``.
+
+    Raises
+    ------
+    ValueError
+        If a release is not installed or if ``workers`` is less than one.
+
+    Examples
+    --------
+    Compare the transmission of a unit cell between two releases, with the ``unit_cell``
+    function of the :func:`map_sessions` example.
+
+    >>> import numpy as np
+    >>> import ansys.lumerical.core as lumapi
+    >>> radii = np.linspace(50e-9, 150e-9, 50)
+    >>> results = lumapi.map_versions(unit_cell, radii, ["2025 R1", "2025 R2"], workers=2)
+    >>> max(abs(a - b) for a, b in zip(results["2025 R1"], results["2025 R2"]))
+    """
+    if workers < 1:
+        raise ValueError("At least one worker is required.")
+    params = list(params)
+    workers = min(workers, max(len(params), 1))
+    installs = {version: _resolve_install(version) for version in versions}
+
+    executors = {}
+    try:
+        for version, install in installs.items():
+            executors[version] = _start_process_executor(workers, product, hide, reset_script, session_kwargs, install)
+        futures = {
+            version: [process_executor.submit(_call_in_worker_process, fn, param, retries) for param in params]
+            for version, process_executor in executors.items()
+        }
+        return {version: _collect_in_order(version_futures) for version, version_futures in futures.items()}
+    finally:
+        for process_executor in executors.values():
+            process_executor.shutdown(cancel_futures=True)
+
+
+def _start_process_executor(workers, product, hide, reset_script, session_kwargs, install):
+    """Return a process pool whose workers each open one session of ``install``, or of the default installation."""
+    mp_context = None
+    if install is not None and not _is_current_install(install):
+        # Forked workers would inherit the interop library and the lumopt2 package of this
+        # process, which belong to another release, so start them from a new interpreter.
+        mp_context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_init_worker_process,
+        initargs=(product, hide, reset_script, session_kwargs, capture_state(install)),
+    )
+
+
+def _collect_in_order(futures):
+    """Return future results in submission order, cancelling pending futures on the first failure."""
+    try:
+        return [future.result() for future in futures]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
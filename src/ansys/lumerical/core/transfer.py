@@ -0,0 +1,593 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Transfer large arrays to and from a Lumerical session without intermediate copies.
+
+The ``getv`` and ``putv`` methods of a session build a new NumPy array for every
+matrix they read and convert every array they write to a Fortran-ordered
+``float64`` or ``complex128`` copy before packing it. For multi-gigabyte field data
+these temporaries dominate peak memory. The functions in this module copy matrix
+data directly between the interop buffer and the caller's array in a single pass,
+and can read large variables one block at a time.
+"""
+
+from contextlib import contextmanager
+from ctypes import POINTER, addressof, byref, c_double, c_ulonglong
+import math
+import operator
+
+import numpy as np
+
+import ansys.api.lumerical.lumapi as lumapi
+
+_MATRIX_TYPE = 2
+_STRUCT_TYPE = 4
+_REAL_MATRIX_MODE = 1
+
+_GEOMETRY_DIMS = {None: 0, "rectilinear": 3, "unstructured": 1}
+"""Number of geometry axes of the attributes of each dataset geometry."""
+
+
+def _internal_name(prefix):
+    """Return a random name for a temporary script workspace variable."""
+    return "internal_lum_%s_%d" % (prefix, np.random.randint(10000, 100000))
+
+
+def _script_string(text):
+    """Return a script expression that evaluates to a string.
+
+    Script strings have no escape sequences, so double quotes are concatenated from
+    strings delimited by single quotes.
+    """
+    return " + '\"' + ".join('"%s"' % part for part in str(text).split('"'))
+
+
+def _get_session_handle(session):
+    """Return the verified ``LumApiSession`` of a session."""
+    handle = session if isinstance(session, lumapi.LumApiSession) else session.handle
+    lumapi.verifyConnection(handle)
+    return handle
+
+
+def _matrix_buffer(lumatrix, shape):
+    """Return a Fortran-ordered NumPy view over the data of a real ``LumMat``."""
+    size = math.prod(shape)
+    if size == 0:
+        return np.empty(shape, dtype=np.float64, order="F")
+    return np.ctypeslib.as_array(lumatrix.data, shape=(size,)).reshape(shape, order="F")
+
+
+def _unpack_matrix(handle, lumatrix, out):
+    """Copy a ``LumMat`` into ``out``, allocating it if necessary."""
+    shape = tuple(int(lumatrix.dimlst[i]) for i in range(lumatrix.dim))
+    is_complex = lumatrix.mode != _REAL_MATRIX_MODE
+
+    if out is None:
+        out = np.empty(shape, dtype=complex if is_complex else np.float64, order="F")
+    elif out.shape != shape:
+        raise ValueError("Output array has shape %s, but the variable has shape %s." % (out.shape, shape))
+
+    if not is_complex:
+        np.copyto(out, _matrix_buffer(lumatrix, shape), casting="same_kind")
+        return out
+
+    # Complex matrices are stored in a layout that only the interop library can unpack,
+    # so only Fortran-ordered complex128 outputs can be filled in place.
+    if out.dtype == complex and out.flags.f_contiguous:
+        target = out
+    else:
+        target = np.empty(shape, dtype=complex, order="F")
+    if target.size:
+        handle.iapi.memmoveUnpackComplexLumMatrix(target.ctypes.data_as(POINTER(c_double)), lumatrix.data, target.size)
+    if target is not out:
+        np.copyto(out, target, casting="same_kind")
+    return out
+
+
+def _pack_matrix(handle, value):
+    """Allocate a ``LumMat`` and copy an array into it in a single pass."""
+    dims = (c_ulonglong * value.ndim)(*value.shape)
+
+    if np.iscomplexobj(value):
+        # The interop library packs complex data from a Fortran-ordered complex128 buffer.
+        source = np.asfortranarray(value, dtype=complex)
+        matrix = handle.iapi.allocateComplexLumMatrix(c_ulonglong(value.ndim), dims)
+        if source.size:
+            handle.iapi.memmovePackComplexLumMatrix(matrix[0].val.matrixVal.data, source.ctypes.data_as(POINTER(c_double)), source.size)
+        return matrix
+
+    matrix = handle.iapi.allocateLumMatrix(c_ulonglong(value.ndim), dims)
+    if value.size:
+        np.copyto(_matrix_buffer(matrix[0].val.matrixVal, value.shape), value, casting="unsafe")
+    return matrix
+
+
+def _reshape_view(array, shape):
+    """Reshape an array in Fortran order, raising if the result would be a copy."""
+    # Reshaping the transpose in place in C order reshapes the array in Fortran order,
+    # and raises instead of silently copying like ``reshape``.
+    view = array.T.view()
+    try:
+        view.shape = tuple(reversed(shape))
+    except AttributeError:
+        raise ValueError("The array cannot be reshaped without a copy.") from None
+    return view.T
+
+
+def _dataset_layout(dataset):
+    """Return the geometry shape, parameter shape, and whether scalar attributes drop their component axis.
+
+    The geometry shape is ``None`` for matrix datasets, whose attributes carry a single point.
+    """
+    metadata = dataset["Lumerical_dataset"]
+    geometry = metadata.get("geometry")
+    # Parameters can be cell arrays, which are translated to lists.
+    parameters = [dataset[names[0]] for names in metadata.get("parameters", [])]
+    parameter_shape = [len(values) if isinstance(values, list) else np.size(values) for values in parameters]
+    if geometry is None:
+        return None, parameter_shape, True
+    if geometry == "rectilinear":
+        return [np.size(dataset["x"]), np.size(dataset["y"]), np.size(dataset["z"])], parameter_shape, True
+    if geometry == "unstructured":
+        return [np.size(dataset["x"])], parameter_shape, False
+    raise lumapi.LumApiError("Unsupported dataset geometry")
+
+
+def _attribute_view(raw, geometry_shape, parameter_shape, remove_scalar_dim):
+    """Return a view of an attribute in the interop layout with the shape conventions of ``lumapi``.
+
+    The interop layout of an attribute is ``[npts, ncomp, npar_1, npar_2, ...]`` and ``lumapi``
+    presents it as ``[npts_x, npts_y, npts_z, npar_1, npar_2, ..., ncomp]``.
+    """
+    if geometry_shape is None:
+        # Matrix datasets: [1, ncomp, npar_1, ...] -> [npar_1, ..., ncomp]
+        if raw.ndim < 2 or raw.shape[0] != 1:
+            raise lumapi.LumApiError("Inconsistency between dataset metadata and attribute dimension")
+        geometry_shape, parameter_shape = [], list(raw.shape[2:])
+    components = raw.shape[1] if raw.ndim > 1 else 1
+    interim = np.moveaxis(_reshape_view(raw, [raw.shape[0], components, *parameter_shape]), 1, -1)
+    shape = [*geometry_shape, *parameter_shape] + ([] if components == 1 and remove_scalar_dim else [components])
+    return _reshape_view(interim, shape)
+
+
+def _unpack_attributes(handle, matrices):
+    """Copy the attribute matrices of a dataset into one contiguous buffer and return Fortran-ordered views of it."""
+    layouts = []
+    size = 0
+    for name, lumatrix in matrices.items():
+        shape = tuple(int(lumatrix.dimlst[i]) for i in range(lumatrix.dim))
+        dtype = np.dtype(np.float64 if lumatrix.mode == _REAL_MATRIX_MODE else complex)
+        layouts.append((name, lumatrix, shape, dtype, size))
+        # Keep every attribute aligned for its widest element type.
+        size += -(-math.prod(shape) * dtype.itemsize // 16) * 16
+
+    buffer = np.empty(size, dtype=np.uint8)
+    arrays = {}
+    for name, lumatrix, shape, dtype, offset in layouts:
+        count = math.prod(shape)
+        array = buffer[offset : offset + count * dtype.itemsize].view(dtype).reshape(shape, order="F")
+        if count and dtype.kind == "c":
+            handle.iapi.memmoveUnpackComplexLumMatrix(array.ctypes.data_as(POINTER(c_double)), lumatrix.data, count)
+        elif count:
+            np.copyto(array, _matrix_buffer(lumatrix, shape))
+        arrays[name] = array
+    return arrays
+
+
+def _get_struct(handle, element):
+    """Translate a struct, copying the attributes of datasets into a single buffer."""
+    size = element.val.structVal.size
+    members = lumapi.GetTranslator.recalculateSize(size, element.val.structVal.elements)
+    struct = {}
+    matrices = {}
+    for index in range(size):
+        pair = lumapi.Any.from_address(addressof(members[index][0])).val.nameValuePairVal
+        name = lumapi.GetTranslator.translateString(pair.name)
+        value = pair.value[0]
+        if value.type == _MATRIX_TYPE:
+            matrices[name] = value.val.matrixVal
+            struct[name] = None
+        else:
+            struct[name] = _get_value(handle, value)
+
+    metadata = struct.get("Lumerical_dataset")
+    attributes = set(metadata.get("attributes", [])) if isinstance(metadata, dict) else set()
+    cell_attributes = set(metadata.get("cell_attributes", [])) if isinstance(metadata, dict) else set()
+    batched = {name: matrices.pop(name) for name in list(matrices) if name in attributes or name in cell_attributes}
+    for name, lumatrix in matrices.items():
+        struct[name] = _unpack_matrix(handle, lumatrix, None)
+    if not batched:
+        lumapi.GetTranslator.applyLumDatasetConventions(struct)
+        return struct
+
+    raw_attributes = _unpack_attributes(handle, batched)
+    try:
+        geometry_shape, parameter_shape, remove_scalar_dim = _dataset_layout(struct)
+        for name, raw in raw_attributes.items():
+            if name in cell_attributes:
+                # [ncell, ncomp, 1] -> [ncell, ncomp]
+                struct[name] = _reshape_view(raw, raw.shape[:2])
+            else:
+                struct[name] = _attribute_view(raw, geometry_shape, parameter_shape, remove_scalar_dim)
+    except (AttributeError, KeyError):
+        raise lumapi.LumApiError("Inconsistency between dataset metadata and available attributes") from None
+    except (IndexError, ValueError):
+        raise lumapi.LumApiError("Inconsistency between dataset metadata and attribute data") from None
+    return struct
+
+
+def _get_value(handle, element):
+    """Translate a value, using the batched translation for structs."""
+    if element.type == _STRUCT_TYPE:
+        return _get_struct(handle, element)
+    return lumapi.GetTranslator.translate(handle, {}, element)
+
+
+def _pack_attribute(handle, value, raw_shape, view, raw_view):
+    """Allocate a ``LumMat`` with the interop layout of an attribute and copy the attribute into it in a single pass.
+
+    ``view`` maps an array in the interop layout to the layout of ``value``, and ``raw_view``
+    maps ``value`` to the interop layout.
+    """
+    dims = (c_ulonglong * len(raw_shape))(*raw_shape)
+    if np.iscomplexobj(value):
+        # The interop library packs complex data from a Fortran-ordered complex128 buffer,
+        # which the attribute often already is once it is viewed in the interop layout.
+        try:
+            source = raw_view(value)
+        except ValueError:
+            source = None
+        if source is None or source.dtype != complex or not source.flags.f_contiguous:
+            source = np.empty(raw_shape, dtype=complex, order="F")
+            np.copyto(view(source), value)
+        matrix = handle.iapi.allocateComplexLumMatrix(c_ulonglong(len(raw_shape)), dims)
+        if source.size:
+            handle.iapi.memmovePackComplexLumMatrix(matrix[0].val.matrixVal.data, source.ctypes.data_as(POINTER(c_double)), source.size)
+        return matrix
+
+    matrix = handle.iapi.allocateLumMatrix(c_ulonglong(len(raw_shape)), dims)
+    if value.size:
+        np.copyto(view(_matrix_buffer(matrix[0].val.matrixVal, raw_shape)), value, casting="unsafe")
+    return matrix
+
+
+def _put_attribute(handle, dataset, name, value, geometry_dims, cell):
+    """Pack an attribute of a dataset into the interop layout ``[npts, ncomp, npar_1, npar_2, ...]``."""
+    value = np.asarray(value)
+    if value.dtype.kind not in "biufc":
+        raise lumapi.LumApiError("Unsupported data type")
+    if cell:
+        # [ncell, ncomp] -> [ncell, ncomp, 1]
+        if value.ndim != 2:
+            raise lumapi.LumApiError("Inconsistency between dataset metadata and attribute data shape")
+        raw_shape = [*value.shape, 1]
+        return _pack_attribute(handle, value, raw_shape, lambda raw: _reshape_view(raw, value.shape), lambda v: _reshape_view(v, raw_shape))
+
+    parameter_dims = len(dataset["Lumerical_dataset"].get("parameters", []))
+    if geometry_dims and not geometry_dims + parameter_dims <= value.ndim <= geometry_dims + parameter_dims + 1:
+        raise lumapi.LumApiError("Inconsistency between dataset metadata and attribute data shape")
+    components = value.shape[-1] if value.ndim > geometry_dims + parameter_dims else 1
+    points = math.prod(value.shape[:geometry_dims])
+    parameter_shape = list(value.shape[geometry_dims : geometry_dims + parameter_dims])
+    raw_shape = [points, components, *parameter_shape]
+    return _pack_attribute(
+        handle,
+        value,
+        raw_shape,
+        lambda raw: _reshape_view(np.moveaxis(raw, 1, -1), value.shape),
+        lambda v: np.moveaxis(_reshape_view(v, [points, *parameter_shape, components]), -1, 1),
+    )
+
+
+def _put_struct(handle, value):
+    """Allocate a struct, copying the attributes of datasets straight into the interop buffers."""
+    metadata = value.get("Lumerical_dataset")
+    attributes = cell_attributes = ()
+    if isinstance(metadata, dict):
+        geometry = metadata.get("geometry")
+        if geometry not in _GEOMETRY_DIMS:
+            raise lumapi.LumApiError("Unsupported dataset geometry")
+        attributes = metadata.get("attributes", [])
+        cell_attributes = metadata.get("cell_attributes", [])
+        missing = [name for name in [*attributes, *cell_attributes] if name not in value]
+        if missing:
+            raise lumapi.LumApiError("Inconsistency between dataset metadata and available attributes")
+
+    members = (POINTER(lumapi.Any) * len(value))()
+    for index, (name, member) in enumerate(value.items()):
+        if name in attributes or name in cell_attributes:
+            packed = _put_attribute(handle, value, name, member, _GEOMETRY_DIMS[geometry], name in cell_attributes)
+        elif type(member) is dict:
+            packed = _put_struct(handle, member)
+        else:
+            packed = lumapi.PutTranslator.translate(handle, member)
+        members[index] = handle.iapi.allocateLumNameValuePair(len(name), name.encode(), packed)
+    return lumapi.PutTranslator.translateStruct(handle, members)
+
+
+def getv(session, varname, out=None):
+    """Get a variable from a Lumerical session, optionally reading a matrix into an existing array.
+
+    Matrices are copied once, directly from the interop buffer into the returned array.
+    The attributes of datasets are copied into a single contiguous buffer, and returned as
+    views of it with the shape conventions of the ``getv`` method of a session. Other
+    variable types are translated the same way as by the ``getv`` method of a session.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to get the variable from.
+    varname : str
+        Name of the variable in the Lumerical script workspace.
+    out : numpy.ndarray, optional
+        Array to write a matrix variable into. The shape must match the variable. Reusing
+        one array across iterations avoids allocating a new array for every call. For
+        complex matrices, a Fortran-ordered ``complex128`` array is filled in place and
+        any other array needs one temporary copy.
+
+    Returns
+    -------
+    any
+        The variable. For matrices, this is ``out`` if given, otherwise a new
+        Fortran-ordered array. The attributes of a dataset share one buffer, which is
+        freed when none of them is referenced anymore.
+
+    Raises
+    ------
+    LumApiError
+        If the variable cannot be read, or if ``out`` is given and the variable is not a matrix.
+    ValueError
+        If the shape of ``out`` does not match the variable.
+
+    Examples
+    --------
+    Read one field component per iteration into the same buffer.
+
+    >>> from ansys.lumerical.core import transfer
+    >>> buffer = None
+    >>> for index in range(10):
+    ...     fdtd.eval(f'Ex = pinch(getdata("monitor_{index}", "Ex"));')
+    ...     buffer = transfer.getv(fdtd, "Ex", out=buffer)
+    """
+    handle = _get_session_handle(session)
+
+    value = POINTER(lumapi.Any)()
+    ec = handle.iapi.appGetVar(handle.handle, varname.encode(), byref(value))
+    if ec < 0:
+        raise lumapi.LumApiError("Failed to get variable")
+
+    try:
+        element = value[0]
+        if element.type < 0:
+            raise lumapi.LumApiError("Failed to get variable")
+        if element.type == _MATRIX_TYPE:
+            return _unpack_matrix(handle, element.val.matrixVal, out)
+        if out is not None:
+            raise lumapi.LumApiError("Variable '%s' is not a matrix and cannot be read into an output array" % varname)
+        return _get_value(handle, element)
+    finally:
+        handle.iapi.freeAny(value)
+
+
+def putv(session, varname, value):
+    """Put a variable into a Lumerical session, copying arrays straight into the interop buffer.
+
+    Real arrays of any dtype and memory layout are converted to ``float64`` and
+    reordered while they are copied, so no intermediate array is created. Complex arrays
+    are copied without an intermediate array if they are already Fortran-ordered
+    ``complex128``. The real attributes of datasets are copied straight into the interop
+    layout of the product, without the intermediate arrays of the ``putv`` method of a
+    session. Other values are passed to the ``putv`` method of the session.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to put the variable into.
+    varname : str
+        Name of the variable in the Lumerical script workspace.
+    value : any
+        Value to put into the session.
+
+    Raises
+    ------
+    LumApiError
+        If the variable cannot be written or the data type is unsupported.
+    """
+    if type(value) is dict:
+        handle = _get_session_handle(session)
+        try:
+            packed = _put_struct(handle, value)
+        except lumapi.LumApiError:
+            raise
+        except Exception:
+            raise lumapi.LumApiError("Unknown exception") from None
+    elif isinstance(value, np.ndarray) and value.ndim > 0 and value.dtype.kind in "biufc":
+        handle = _get_session_handle(session)
+        packed = _pack_matrix(handle, value)
+    else:
+        session.putv(varname, value)
+        return
+
+    ec = handle.iapi.appPutVar(handle.handle, varname.encode(), packed)
+    if ec < 0:
+        raise lumapi.LumApiError("Failed to put variable")
+
+
+def _script_index(index, shape):
+    """Convert a NumPy basic index into a 1-based script index and the shape NumPy would return."""
+    if not isinstance(index, tuple):
+        index = (index,)
+    if index.count(Ellipsis) > 1:
+        raise IndexError("An index can only have a single ellipsis.")
+    if Ellipsis in index:
+        position = index.index(Ellipsis)
+        index = index[:position] + (slice(None),) * (len(shape) - len(index) + 1) + index[position + 1 :]
+    if len(index) > len(shape):
+        raise IndexError("Too many indices for a variable with %d dimensions." % len(shape))
+    index = index + (slice(None),) * (len(shape) - len(index))
+
+    parts = []
+    result_shape = []
+    for item, length in zip(index, shape):
+        if isinstance(item, slice):
+            positions = range(*item.indices(length))
+            if not positions:
+                raise IndexError("Empty slices are not supported.")
+            if positions.step == 1 and len(positions) == length:
+                parts.append(":")
+            elif positions.step == 1:
+                parts.append("%d:%d" % (positions[0] + 1, positions[-1] + 1))
+            else:
+                parts.append("%d:%d:%d" % (positions[0] + 1, positions.step, positions[-1] + 1))
+            result_shape.append(len(positions))
+        else:
+            position = operator.index(item)
+            if not -length <= position < length:
+                raise IndexError("Index %d is out of bounds for an axis of length %d." % (position, length))
+            parts.append(str(position % length + 1))
+    return "(%s)" % ", ".join(parts), tuple(result_shape)
+
+
+@contextmanager
+def _session_matrix(session, varname, attribute):
+    """Yield the name and shape of a matrix in the script workspace.
+
+    Dataset attributes cannot be indexed in place, so they are first copied to a temporary variable
+    inside the session.
+    """
+    matrix = varname
+    size = _internal_name("size")
+    if attribute is None:
+        code = "%s = size(%s);" % (size, varname)
+    else:
+        matrix = _internal_name("attribute")
+        code = "%s = getattribute(%s, %s);\n%s = size(%s);" % (matrix, varname, _script_string(attribute), size, matrix)
+    try:
+        session.eval(code)
+        shape = tuple(int(n) for n in np.ravel(getv(session, size)))
+        yield matrix, shape
+    finally:
+        session.eval("clear(%s);" % (size if matrix == varname else "%s, %s" % (size, matrix)))
+
+
+def _get_block(session, matrix, shape, index):
+    """Get one block of a matrix from the script workspace."""
+    script_index, result_shape = _script_index(index, shape)
+    block = _internal_name("block")
+    session.eval("%s = %s%s;" % (block, matrix, script_index))
+    try:
+        value = getv(session, block)
+    finally:
+        session.eval("clear(%s);" % block)
+    return value.reshape(result_shape, order="F")
+
+
+def getv_slice(session, varname, index, attribute=None):
+    """Get part of a matrix variable from a Lumerical session.
+
+    The session indexes the matrix and only the selected block is transferred, so the
+    full variable is never held in Python memory.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to get the variable from.
+    varname : str
+        Name of a matrix or dataset variable in the Lumerical script workspace.
+    index : int, slice, or tuple
+        Zero-based NumPy basic index, for example ``np.s_[:, :, 3]``. Integers, slices,
+        and an ellipsis are supported. The index applies to the shape returned by the
+        ``size`` script command, which has at least two dimensions.
+    attribute : str, optional
+        Name of the attribute to index if ``varname`` is a dataset. The attribute is copied
+        to a temporary variable inside the session before it is indexed.
+
+    Returns
+    -------
+    numpy.ndarray
+        Selected block, with the same shape NumPy would return for ``index``.
+
+    Raises
+    ------
+    IndexError
+        If the index is out of bounds, selects an empty slice, or is not a basic index.
+    LumApiError
+        If the variable cannot be read.
+
+    Examples
+    --------
+    Get the field at a single frequency of a 3D field monitor.
+
+    >>> import numpy as np
+    >>> from ansys.lumerical.core import transfer
+    >>> fdtd.eval('E_data = getresult("monitor", "E");')
+    >>> Ex = transfer.getv_slice(fdtd, "E_data", np.s_[:, :, :, 10, 0], attribute="E")
+    """
+    with _session_matrix(session, varname, attribute) as (matrix, shape):
+        return _get_block(session, matrix, shape, index)
+
+
+def iter_chunks(session, varname, axis=-1, chunk=1, attribute=None):
+    """Iterate over a matrix variable of a Lumerical session in blocks along one axis.
+
+    Only one block is held in Python memory at a time, so large variables can be reduced
+    with bounded memory, for example one frequency or one z-plane at a time.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to get the variable from.
+    varname : str
+        Name of a matrix or dataset variable in the Lumerical script workspace.
+    axis : int, default: -1
+        Axis to split the variable along. It applies to the shape returned by the ``size``
+        script command, which has at least two dimensions.
+    chunk : int, default: 1
+        Number of elements along ``axis`` in each block. The last block can be shorter.
+    attribute : str, optional
+        Name of the attribute to iterate over if ``varname`` is a dataset.
+
+    Yields
+    ------
+    numpy.ndarray
+        Consecutive blocks of the variable. Each block keeps ``axis``, even if ``chunk`` is 1.
+
+    Examples
+    --------
+    Compute the field intensity integrated over each frequency of a monitor.
+
+    >>> import numpy as np
+    >>> from ansys.lumerical.core import transfer
+    >>> fdtd.eval('E_data = getresult("monitor", "E");')
+    >>> intensity = [np.sum(np.abs(E) ** 2) for E in transfer.iter_chunks(fdtd, "E_data", axis=3, attribute="E")]
+    """
+    if chunk < 1:
+        raise ValueError("The chunk size must be at least 1.")
+
+    with _session_matrix(session, varname, attribute) as (matrix, shape):
+        axis = operator.index(axis)
+        if not -len(shape) <= axis < len(shape):
+            raise ValueError("Axis %d is out of bounds for a variable with %d dimensions." % (axis, len(shape)))
+        axis %= len(shape)
+        for start in range(0, shape[axis], chunk):
+            index = (slice(None),) * axis + (slice(start, start + chunk),)
+            yield _get_block(session, matrix, shape, index)
@@ -0,0 +1,374 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Read and build large object trees with a small number of round-trips."""
+
+import collections
+import re
+
+import numpy as np
+
+import ansys.api.lumerical.lumapi as lumapi
+
+from .script_batch import _remove_prompt_line
+from .transfer import _internal_name, _script_string
+
+_NULL = "d6d8d1b2c083c251"
+"""String that represents a missing value in the script workspace, as in ``lumapi.appCall``."""
+
+_MAX_DEPTH = 100
+"""Maximum nesting depth of groups visited by ``snapshot``."""
+
+_GROUP_TYPES = ("Layout Group", "Structure Group", "Analysis Group", "Assembly Group")
+"""Types of the objects whose children ``snapshot`` visits."""
+
+_SNAPSHOT_VARIABLES = (
+    "",
+    "_scope",
+    "_selected",
+    "_err",
+    "_groups",
+    "_level",
+    "_depth",
+    "_parents",
+    "_g",
+    "_n",
+    "_total",
+    "_ids",
+    "_types",
+    "_k",
+    "_m",
+    "_type",
+    "_columns",
+)
+"""Suffixes of the temporary variables used by the ``snapshot`` script."""
+
+# The first pass collects the groups and counts their children, so that the second
+# pass can fill preallocated cells instead of concatenating strings.
+_SNAPSHOT_SCRIPT = """\
+%(v)s = cell(4);
+%(v)s{1} = 0;
+%(v)s{2} = 0;
+%(v)s{3} = 0;
+%(v)s{4} = "";
+%(v)s_columns = cell(%(count)d);
+%(v)s_scope = groupscope;
+%(v)s_selected = "";
+try{ %(v)s_selected = getid; } catch(%(v)s_err);
+try{
+  %(v)s_groups = %(root)s;
+  %(v)s_level = %(root)s;
+  %(v)s_total = 0;
+  for(%(v)s_depth = 1:%(max_depth)d){
+    if(length(%(v)s_level) == 0){ break; }
+    %(v)s_parents = splitstring(%(v)s_level, endl);
+    %(v)s_level = "";
+    for(%(v)s_g = 1:length(%(v)s_parents)){
+      groupscope(%(v)s_parents{%(v)s_g});
+      selectall;
+      %(v)s_n = getnumber;
+      %(v)s_total = %(v)s_total + %(v)s_n;
+      if(%(v)s_n > 0){
+        for(%(v)s_m = 1:%(v)s_n){
+          %(v)s_type = get("type", %(v)s_m);
+          if(%(is_group)s){
+            %(v)s_level = %(v)s_level + endl + %(v)s_parents{%(v)s_g} + "::" + get("name", %(v)s_m);
+          }
+        }
+      }
+    }
+    if(length(%(v)s_level) > 0){
+      %(v)s_level = substring(%(v)s_level, 2);
+      %(v)s_groups = %(v)s_groups + endl + %(v)s_level;
+    }
+  }
+  if(%(v)s_total > 0){
+    %(v)s_ids = cell(%(v)s_total);
+    %(v)s_types = cell(%(v)s_total);
+%(allocate)s    %(v)s_k = 0;
+    %(v)s_parents = splitstring(%(v)s_groups, endl);
+    for(%(v)s_g = 1:length(%(v)s_parents)){
+      groupscope(%(v)s_parents{%(v)s_g});
+      selectall;
+      %(v)s_n = getnumber;
+      if(%(v)s_n > 0){
+        for(%(v)s_m = 1:%(v)s_n){
+          %(v)s_k = %(v)s_k + 1;
+          %(v)s_ids{%(v)s_k} = %(v)s_parents{%(v)s_g} + "::" + get("name", %(v)s_m);
+          %(v)s_types{%(v)s_k} = get("type", %(v)s_m);
+%(read)s        }
+      }
+    }
+%(store)s    %(v)s{1} = %(v)s_ids;
+    %(v)s{2} = %(v)s_types;
+    %(v)s{3} = %(v)s_columns;
+  }
+} catch(%(v)s{4});
+groupscope(%(v)s_scope);
+unselectall;
+if(length(%(v)s_selected) > 0){
+  %(v)s_selected = splitstring(%(v)s_selected, endl);
+  select(%(v)s_selected{1});
+  for(%(v)s_m = 2:length(%(v)s_selected)){ shiftselect(%(v)s_selected{%(v)s_m}); }
+}
+"""
+
+# Properties are read from the selection by index, so objects with the same name are
+# not confused with each other.
+_PROPERTY_ALLOCATE = "    %(v)s_c%(k)d = cell(%(v)s_total);\n"
+_PROPERTY_READ = """\
+          %(v)s_c%(k)d{%(v)s_k} = "%(null)s";
+          try{ %(v)s_c%(k)d{%(v)s_k} = get(%(property)s, %(v)s_m); } catch(%(v)s_err);
+"""
+_PROPERTY_STORE = "    %(v)s_columns{%(k)d} = %(v)s_c%(k)d;\n"
+
+
+def _column(values):
+    """Convert the values of one property into a float array, or an object array for other types."""
+    values = [None if isinstance(value, str) and value == _NULL else value for value in values]
+    if all(value is None or isinstance(value, float) for value in values):
+        return np.array([np.nan if value is None else value for value in values], dtype=float)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def snapshot(session, root="::model", properties=()):
+    """Read the IDs, types, and selected properties of all objects under a group in one round-trip.
+
+    A single generated script walks the whole subtree inside the session and the result
+    is transferred at once. Walking the tree with ``getChildren`` and reading properties
+    of each :class:`ansys.lumerical.core.SimObject` instead takes several round-trips per object.
+    The group scope and the selection of the session are restored afterwards.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to read the objects from.
+    root : str, default: "::model"
+        Full ID of the group to read the children of, recursively.
+    properties : list of str, default: ()
+        Names of the properties to read for each object, for example ``["x", "material"]``.
+
+    Returns
+    -------
+    dict
+        Dictionary of arrays with one element per object, in breadth-first order. The
+        ``"id"`` and ``"type"`` keys hold the full object IDs, numbered as ``name#n``
+        among the objects with the same full name, and the types. Each property
+        has a key with its name. Properties with only numeric values are returned as
+        ``float`` arrays, where ``nan`` marks objects without the property. Other
+        properties are returned as object arrays, where ``None`` marks objects without
+        the property.
+
+    Raises
+    ------
+    LumApiError
+        If the tree cannot be read, for example because ``root`` does not exist.
+
+    Examples
+    --------
+    Check the minimum radius of all circles in a metasurface.
+
+    >>> from ansys.lumerical.core import tree
+    >>> objects = tree.snapshot(fdtd, "::model::metasurface", ["radius"])
+    >>> circles = objects["type"] == "Circle"
+    >>> print(objects["id"][circles][objects["radius"][circles] < 50e-9])
+    """
+    properties = list(dict.fromkeys(properties))
+    vname = _internal_name("snapshot")
+    fields = [{"v": vname, "k": k + 1, "property": _script_string(name), "null": _NULL} for k, name in enumerate(properties)]
+    code = _SNAPSHOT_SCRIPT % {
+        "v": vname,
+        "count": max(len(properties), 1),
+        "root": _script_string(root),
+        "max_depth": _MAX_DEPTH,
+        "is_group": " | ".join('(%s_type == "%s")' % (vname, group_type) for group_type in _GROUP_TYPES),
+        "allocate": "".join(_PROPERTY_ALLOCATE % field for field in fields),
+        "read": "".join(_PROPERTY_READ % field for field in fields),
+        "store": "".join(_PROPERTY_STORE % field for field in fields),
+    }
+
+    temporaries = [vname + suffix for suffix in _SNAPSHOT_VARIABLES] + ["%s_c%d" % (vname, k + 1) for k in range(len(properties))]
+    # Evaluate through the module function, because only the selection and group scope
+    # change and cached properties stay valid.
+    try:
+        lumapi.evalScript(session.handle, code, True)
+        ids, types, columns, error = session.getv(vname)
+    finally:
+        lumapi.evalScript(session.handle, "clear(%s);" % ", ".join(temporaries))
+    if error:
+        raise lumapi.LumApiError(_remove_prompt_line(error))
+
+    if not isinstance(ids, list):
+        ids, types, columns = [], [], [[] for _ in properties]
+    # Number the objects that share a name in tree order, as in the IDs returned by 'add_many'.
+    numbers = collections.Counter()
+    numbered = []
+    for id in ids:
+        numbers[id] += 1
+        numbered.append("%s#%d" % (id, numbers[id]))
+    result = {"id": np.array(numbered, dtype=str), "type": np.array(types, dtype=str)}
+    for name, values in zip(properties, columns):
+        result[name] = _column(values)
+    return result
+
+
+_ADD_MANY_SCRIPT = """\
+%(v)s = cell(4);
+%(v)s{1} = 0;
+%(v)s{2} = 0;
+%(v)s{3} = "";
+%(v)s{4} = 0;
+%(v)s_ids = cell(%(count)d);
+%(v)s_numbers = matrix(%(count)d);
+%(columns)stry{
+  for(%(v)s_i = 1:%(count)d){
+    %(v)s{4} = %(v)s_i;
+    %(command)s;
+%(setters)s    %(v)s_ids{%(v)s_i} = getid;
+    %(v)s_numbers(%(v)s_i) = getnamednumber(%(v)s_ids{%(v)s_i});
+  }
+} catch(%(v)s{3});
+%(v)s{1} = %(v)s_ids;
+%(v)s{2} = %(v)s_numbers;
+"""
+
+
+def _table_columns(table):
+    """Return the columns of a table as a dictionary of one-dimensional arrays of equal length."""
+    names = table.dtype.names if isinstance(table, np.ndarray) else list(table.keys())
+    if not names:
+        raise ValueError("The table has no columns.")
+    columns = {name: np.asarray(table[name]) for name in names}
+    for name, column in columns.items():
+        if column.ndim > 1:
+            raise ValueError("Column '%s' must be one-dimensional or a scalar." % name)
+    try:
+        shape = np.broadcast_shapes(*(column.shape for column in columns.values()))
+    except ValueError:
+        raise ValueError("All columns of the table must have the same length.") from None
+    return {name: np.broadcast_to(column, shape or (1,)) for name, column in columns.items()}
+
+
+def add_many(session, kind, table):
+    """Add many objects of the same type with one script evaluation and one transfer.
+
+    The table is transferred to the session as a whole and a single generated script adds
+    each object, sets its properties, and adds it to its group. Calling ``addcircle``
+    and ``addtogroup`` in a Python loop takes several round-trips per object instead.
+
+    Parameters
+    ----------
+    session : :class:`ansys.api.lumerical.lumapi.Lumerical`
+        Session to add the objects to.
+    kind : str
+        Type of the objects, as in the name of the ``add`` script command, for example
+        ``"circle"`` for ``addcircle``.
+    table : dict or numpy.ndarray
+        Columns of property values, as a dictionary of arrays, a NumPy structured array, or
+        any object with ``keys`` and column access such as a ``pandas.DataFrame``. Each
+        column holds one value per object, or a single value shared by all objects.
+        Underscores in column names are replaced by spaces, as for keyword arguments of
+        the ``add`` methods of a session. Columns with string values, such as
+        ``material``, are supported. The special ``group`` column holds the name of the
+        group to add each object to, or an empty string to leave it in the current scope.
+        Properties are set in column order.
+
+    Returns
+    -------
+    list of :class:`ansys.lumerical.core.SimObjectId`
+        IDs of the new objects, in table order.
+
+    Raises
+    ------
+    ValueError
+        If ``kind`` is not a valid command name or the columns have different lengths.
+    LumApiError
+        If an object cannot be added or a property cannot be set. The objects added
+        before the failing one are kept.
+
+    Examples
+    --------
+    Add the pillars of a metasurface to a group.
+
+    >>> import numpy as np
+    >>> from ansys.lumerical.core import tree
+    >>> x, y = np.meshgrid(np.arange(300) * 400e-9, np.arange(300) * 400e-9)
+    >>> fdtd.addstructuregroup(name="pillars")
+    >>> ids = tree.add_many(
+    ...     fdtd,
+    ...     "circle",
+    ...     {
+    ...         "x": x.ravel(),
+    ...         "y": y.ravel(),
+    ...         "radius": np.random.uniform(50e-9, 150e-9, x.size),
+    ...         "z_min": 0,
+    ...         "z_max": 600e-9,
+    ...         "material": "TiO2 (Titanium Dioxide) - Devore",
+    ...         "group": "pillars",
+    ...     },
+    ... )
+    """
+    if not re.fullmatch(r"\w+", kind):
+        raise ValueError("'%s' is not a valid object type." % kind)
+    columns = _table_columns(table)
+    count = len(next(iter(columns.values())))
+    if count == 0:
+        return []
+
+    vname = _internal_name("add_many")
+    values = []
+    column_code = ""
+    setter_code = ""
+    for k, (name, column) in enumerate(columns.items()):
+        column_name = "%s_%d" % (vname, k + 1)
+        if column.dtype.kind in "OSU":
+            values.append([str(value) for value in column])
+            value = "%s{%s_i}" % (column_name, vname)
+        else:
+            values.append(np.asarray(column, dtype=float))
+            value = "%s(%s_i)" % (column_name, vname)
+        column_code += "%s = %s_in{%d};\n" % (column_name, vname, k + 1)
+        if name == "group":
+            setter_code += "    if(length(%s) > 0){ addtogroup(%s); }\n" % (value, value)
+        else:
+            setter_code += "    set(%s, %s);\n" % (_script_string(name.replace("_", " ")), value)
+    code = _ADD_MANY_SCRIPT % {
+        "v": vname,
+        "count": count,
+        "command": "add" + kind,
+        "columns": column_code,
+        "setters": setter_code,
+    }
+
+    temporaries = [vname + suffix for suffix in ("", "_in", "_i", "_ids", "_numbers")]
+    temporaries += ["%s_%d" % (vname, k + 1) for k in range(len(columns))]
+    try:
+        session.putv(vname + "_in", values)
+        session.eval(code)
+        ids, numbers, error, failed = session.getv(vname)
+    finally:
+        session.eval("clear(%s);" % ", ".join(temporaries))
+    if error:
+        raise lumapi.LumApiError("%s (object %d)" % (_remove_prompt_line(error), int(failed)))
+    return [lumapi.SimObjectId("%s#%d" % (id, number)) for id, number in zip(ids, np.ravel(numbers))]
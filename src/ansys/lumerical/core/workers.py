@@ -0,0 +1,204 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Start worker processes from the Lumerical environment of the parent process.
+
+Each worker process of a :mod:`multiprocessing` or :mod:`concurrent.futures` pool that
+is not forked from a configured parent searches for the Lumerical installation again
+when it first imports ``lumapi``. The functions of this module capture the configuration
+of the parent once and apply it in the workers, so that they start without searching the
+file system.
+"""
+
+import importlib
+import json
+import multiprocessing
+import multiprocessing.context
+import os
+
+from . import _BOOTSTRAP_STATE_VARIABLE, _LUMAPI_MODULE_NAME, _apply_bootstrap_state, _capture_bootstrap_state, _ensure_bootstrapped
+
+STATE_VARIABLE = _BOOTSTRAP_STATE_VARIABLE
+"""Environment variable from which processes read the state of their parent, such as the forkserver started by :func:`preload`."""
+
+
+def capture_state(install=None):
+    """Return the Lumerical configuration of this process, to apply in worker processes.
+
+    Parameters
+    ----------
+    install : str or :class:`ansys.lumerical.core.autodiscovery.LumericalInstall`, optional
+        Installation for the workers to use instead of the installation of this process.
+
+    Returns
+    -------
+    dict
+        Installation directory, bundled ``lumopt2`` directory, whether ``lumapi`` is an alias
+        of ``ansys.api.lumerical.lumapi``, and the modules to import in the workers.
+        The dictionary can be pickled and serialized to JSON.
+    """
+    install_dir = getattr(install, "path", install)
+    return _capture_bootstrap_state(install_dir)
+
+
+def initialize(state=None):
+    """Configure a worker process from the state captured in its parent.
+
+    Pass this function as the ``initializer`` of a process pool, with the result of
+    :func:`capture_state` as its argument. Workers that are forked from a configured
+    parent only switch to the installation of ``state``.
+
+    Parameters
+    ----------
+    state : dict, optional
+        State returned by :func:`capture_state`. The default is the state in the
+        :data:`STATE_VARIABLE` environment variable, or a regular search for the
+        installation if there is none.
+
+    Examples
+    --------
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> from ansys.lumerical.core import workers
+    >>> executor = ProcessPoolExecutor(4, initializer=workers.initialize, initargs=(workers.capture_state(),))
+    """
+    # Read the flag at call time: it changes after this module is imported.
+    from . import _bootstrapped
+
+    if state is not None:
+        if _bootstrapped:
+            _apply_bootstrap_state(state)
+        else:
+            os.environ[STATE_VARIABLE] = json.dumps(state)
+    _ensure_bootstrapped()
+    for name in (state or {}).get("modules", ()):
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+class _ConfiguredProcess:
+    """Worker process that applies the state captured in its parent before it runs.
+
+    The state is an attribute of the process object, which the start method sends to
+    the new process, so it does not pass through the environment of the parent.
+    """
+
+    _state = None
+
+    def run(self):
+        """Apply the captured state and run the target of the process."""
+        if self._state is not None:
+            initialize(self._state)
+        super().run()
+
+
+class _ConfiguredContext:
+    """Start method context whose processes apply the state captured in the parent."""
+
+    _process_class = None
+
+    def __init__(self, state):
+        self._state = state
+
+    def Process(self, *args, **kwargs):  # noqa: N802
+        """Return a process that applies the captured state before it runs."""
+        process = self._process_class(*args, **kwargs)
+        process._state = self._state
+        return process
+
+
+class _SpawnProcess(_ConfiguredProcess, multiprocessing.context.SpawnProcess):
+    """Spawned worker process that applies the state captured in its parent."""
+
+
+class _SpawnContext(_ConfiguredContext, multiprocessing.context.SpawnContext):
+    """Spawn context whose processes apply the state captured in the parent."""
+
+    _process_class = _SpawnProcess
+
+
+_CONFIGURED_CONTEXTS = {"spawn": _SpawnContext}
+
+if hasattr(multiprocessing.context, "ForkServerContext"):
+
+    class _ForkServerProcess(_ConfiguredProcess, multiprocessing.context.ForkServerProcess):
+        """Worker process forked from the forkserver that applies the state captured in its parent."""
+
+    class _ForkServerContext(_ConfiguredContext, multiprocessing.context.ForkServerContext):
+        """Forkserver context whose processes apply the state captured in the parent."""
+
+        _process_class = _ForkServerProcess
+
+    _CONFIGURED_CONTEXTS["forkserver"] = _ForkServerContext
+
+
+def _start_forkserver(state):
+    """Start the forkserver with the state in its environment, then restore the environment of this process."""
+    from multiprocessing import forkserver
+
+    previous = os.environ.get(STATE_VARIABLE)
+    os.environ[STATE_VARIABLE] = json.dumps(state)
+    try:
+        forkserver.ensure_running()
+    finally:
+        if previous is None:
+            del os.environ[STATE_VARIABLE]
+        else:
+            os.environ[STATE_VARIABLE] = previous
+
+
+def preload(method="forkserver"):
+    """Return a start method context whose worker processes start from the Lumerical configuration of this process.
+
+    Processes started from the context apply the configuration before they run instead
+    of searching for the installation. With the ``"forkserver"`` method, the server process
+    is started with the configuration and imports ``lumapi`` and the other modules of the
+    configuration once, and every worker is forked from it with these imports done. Call
+    this function before the first process pool that uses the forkserver starts. The
+    environment of this process and of the processes it starts in other ways is not changed.
+
+    Parameters
+    ----------
+    method : str, default: "forkserver"
+        Start method of the worker processes, ``"forkserver"`` or ``"spawn"``.
+
+    Returns
+    -------
+    multiprocessing.context.BaseContext
+        Context to pass as ``mp_context`` to :class:`concurrent.futures.ProcessPoolExecutor`,
+        or to use instead of the :mod:`multiprocessing` module.
+
+    Examples
+    --------
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> from ansys.lumerical.core import workers
+    >>> executor = ProcessPoolExecutor(8, mp_context=workers.preload())
+    """
+    if method not in _CONFIGURED_CONTEXTS:
+        raise ValueError("Start method must be one of %s." % ", ".join(_CONFIGURED_CONTEXTS))
+    state = capture_state()
+    context = _CONFIGURED_CONTEXTS[method](state)
+    if method == "forkserver":
+        context.set_forkserver_preload([_LUMAPI_MODULE_NAME, __name__, *state["modules"]])
+        _start_forkserver(state)
+    return context
@@ -24,6 +24,7 @@
 import pytest
 
 import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core import mock
 
 
 @pytest.fixture(scope="module")
@@ -68,3 +69,53 @@ def setup_fdtd_with_groups():
     yield fdtd
     print("\n--> Teardown")
     fdtd.close()
+
+
+class _FakeInteropApi:
+    """Stand-in for the interop library that reports whether a fake session is open."""
+
+    def appOpened(self, handle):  # noqa: N802
+        """Return whether the fake session is alive."""
+        return handle.alive
+
+
+class FakeSession:
+    """Minimal stand-in for a Lumerical session that records evaluated scripts."""
+
+    started = []
+
+    def __init__(self, hide=False, **kwargs):
+        self.alive = True
+        self.scripts = []
+        self.handle = lumapi.LumApiSession(_FakeInteropApi(), self)
+        FakeSession.started.append(self)
+
+    def eval(self, code):
+        """Record the script, or raise if the session was closed."""
+        if not self.alive:
+            raise lumapi.LumApiError("Error validating the connection")
+        self.scripts.append(code)
+
+    def close(self):
+        """Mark the session as closed."""
+        self.alive = False
+
+
+@pytest.fixture
+def fake_fdtd(monkeypatch):
+    """Replace the FDTD session class with a fake session that does not start a product."""
+    FakeSession.started = []
+    monkeypatch.setattr(lumapi, "FDTD", FakeSession)
+    return FakeSession
+
+
+@pytest.fixture
+def mock_fdtd():
+    """Start an FDTD session on the mock engine, which does not need a Lumerical installation."""
+    mock.enable()
+    try:
+        session = lumapi.FDTD(hide=True)
+    finally:
+        mock.disable()
+    yield session
+    session.close()
@@ -0,0 +1,178 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'aio' module 'AsyncLumerical' object.
+
+- test 01: Test 'AsyncLumerical' runs all calls of a session on one worker thread
+- test 02: Test 'AsyncLumerical' overlaps calls to different sessions
+- test 03: Test 'AsyncLumerical' times out and cancels queued calls
+- test 04: Test 'AsyncLumerical' 'start' opens a session and closes it on exit
+- test 05: Test 'AsyncLumerical' rejects calls after it is closed
+- test 06: Test 'AsyncLumerical' 'start' closes a session that starts after the timeout
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ansys.lumerical.core import aio
+
+
+class _SlowSession:
+    """Session stand-in whose 'run' blocks the calling thread."""
+
+    def __init__(self, duration=0.0):
+        self.duration = duration
+        self.threads = set()
+        self.variables = {}
+        self.closed = False
+
+    def run(self):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.duration)
+
+    def putv(self, varname, value):
+        self.threads.add(threading.get_ident())
+        self.variables[varname] = value
+
+    def getv(self, varname):
+        self.threads.add(threading.get_ident())
+        return self.variables[varname]
+
+    def getresult(self, name, result):
+        return "%s.%s" % (name, result)
+
+    def addrect(self, **kwargs):
+        self.threads.add(threading.get_ident())
+        return kwargs
+
+    def close(self):
+        self.closed = True
+
+
+class TestAsyncLumerical:
+    """Test the 'aio' module 'AsyncLumerical' object."""
+
+    def test_worker_thread(self):
+        """Test 01: Test 'AsyncLumerical' runs all calls of a session on one worker thread."""
+        session = _SlowSession()
+
+        async def main():
+            async with aio.AsyncLumerical(session) as fdtd:
+                await fdtd.putv("a", 1.0)
+                await fdtd.run()
+                assert await fdtd.addrect(x=1.0) == {"x": 1.0}
+                assert await fdtd.getresult("monitor", "T") == "monitor.T"
+                return await fdtd.getv("a")
+
+        assert asyncio.run(main()) == 1.0
+        assert len(session.threads) == 1
+        assert threading.get_ident() not in session.threads
+        assert session.closed
+
+    def test_concurrent_sessions(self):
+        """Test 02: Test 'AsyncLumerical' overlaps calls to different sessions."""
+        sessions = [_SlowSession(0.2) for _ in range(4)]
+
+        async def main():
+            wrappers = [aio.AsyncLumerical(session) for session in sessions]
+            await asyncio.gather(*(wrapper.run() for wrapper in wrappers))
+            await asyncio.gather(*(wrapper.close() for wrapper in wrappers))
+
+        start = time.perf_counter()
+        asyncio.run(main())
+
+        assert time.perf_counter() - start < 0.6
+        assert len(set.union(*(session.threads for session in sessions))) == 4
+
+    def test_timeout(self):
+        """Test 03: Test 'AsyncLumerical' times out and cancels queued calls."""
+        session = _SlowSession(0.2)
+
+        async def main():
+            fdtd = aio.AsyncLumerical(session)
+            with pytest.raises(TimeoutError):
+                await fdtd.run(timeout=0.05)
+            queued = asyncio.ensure_future(fdtd.putv("a", 1.0))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            await fdtd.close()
+
+        asyncio.run(main())
+
+        assert session.variables == {}
+        assert session.closed
+
+    def test_start(self, fake_fdtd):
+        """Test 04: Test 'AsyncLumerical' 'start' opens a session and closes it on exit."""
+
+        async def main():
+            async with await aio.AsyncLumerical.start("fdtd") as fdtd:
+                await fdtd.eval("addrect;")
+                return fdtd.session
+
+        session = asyncio.run(main())
+
+        assert fake_fdtd.started == [session]
+        assert session.scripts == ["addrect;"]
+        assert not session.alive
+
+    def test_closed(self):
+        """Test 05: Test 'AsyncLumerical' rejects calls after it is closed."""
+
+        async def main():
+            fdtd = aio.AsyncLumerical(_SlowSession())
+            await fdtd.close()
+            assert fdtd.closed
+            with pytest.raises(RuntimeError, match="closed"):
+                await fdtd.getv("a")
+
+        asyncio.run(main())
+
+    def test_start_timeout(self, fake_fdtd, monkeypatch):
+        """Test 06: Test 'AsyncLumerical' 'start' closes a session that starts after the timeout."""
+        started = threading.Event()
+        original_init = fake_fdtd.__init__
+
+        def slow_init(self, *args, **kwargs):
+            time.sleep(0.2)
+            original_init(self, *args, **kwargs)
+            started.set()
+
+        monkeypatch.setattr(fake_fdtd, "__init__", slow_init)
+
+        async def main():
+            with pytest.raises(TimeoutError):
+                await aio.AsyncLumerical.start("fdtd", timeout=0.05)
+
+        asyncio.run(main())
+
+        assert started.wait(1.0)
+        deadline = time.perf_counter() + 1.0
+        while fake_fdtd.started[0].alive and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        assert len(fake_fdtd.started) == 1
+        assert not fake_fdtd.started[0].alive
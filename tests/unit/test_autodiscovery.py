@@ -0,0 +1,156 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the discovery of Lumerical installations.
+
+- test 01: Test 'find_lumerical_installs' lists supported installations, newest first
+- test 02: Test 'find_lumerical_installs' reuses the cached installations
+- test 03: Test 'find_lumerical_installs' searches again when the directories change
+- test 04: Test 'get_lumerical_install' selects an installation by version
+- test 05: Test 'locate_lumerical_install' returns the newest installation
+"""
+
+import os
+
+import pytest
+
+from ansys.lumerical.core import autodiscovery
+
+
+def _install(root, name, api_python=True, binaries=()):
+    """Create the directory layout of an installation."""
+    install_dir = root / name
+    (install_dir / "bin").mkdir(parents=True)
+    if api_python:
+        (install_dir / "api" / "python").mkdir(parents=True)
+    for binary in binaries:
+        (install_dir / "bin" / binary).write_text("")
+    return install_dir
+
+
+def _touch(path, offset):
+    """Move the modification time of a path, so that the change is visible on coarse file systems."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset))
+
+
+@pytest.fixture
+def install_root(monkeypatch, tmp_path):
+    """Search for installations in a temporary directory and cache them in another one."""
+    root = tmp_path / "lumerical"
+    root.mkdir()
+    monkeypatch.setattr(autodiscovery, "_search_roots", lambda: [[str(root), ""]])
+    monkeypatch.setattr(autodiscovery.platform, "system", lambda: "Linux")
+    monkeypatch.setenv("PYLUMERICAL_CACHE_DIR", str(tmp_path / "cache"))
+    return root
+
+
+def _count_scans(monkeypatch):
+    """Count the searches of the installation directories."""
+    scans = []
+    scan_installs = autodiscovery._scan_installs
+    monkeypatch.setattr(autodiscovery, "_scan_installs", lambda roots: scans.append(roots) or scan_installs(roots))
+    return scans
+
+
+class TestAutodiscovery:
+    """Test the discovery of Lumerical installations."""
+
+    def test_find_installs(self, install_root):
+        """Test 01: Test 'find_lumerical_installs' lists supported installations, newest first."""
+        _install(install_root, "v241", binaries=["fdtd-solutions", "interconnect"])
+        _install(install_root, "v252", binaries=["mode-solutions"])
+        _install(install_root, "v212")
+        _install(install_root, "v251", api_python=False)
+        (install_root / "readme.txt").write_text("")
+
+        installs = autodiscovery.find_lumerical_installs()
+
+        assert [install.version for install in installs] == [(25, 2), (24, 1)]
+        assert installs[0].name == "v252"
+        assert installs[0].release == "2025 R2"
+        assert installs[1].path == str(install_root / "v241")
+        assert installs[1].api_python_path == str((install_root / "v241" / "api" / "python").resolve())
+        assert installs[1].binaries == {
+            "fdtd": str(install_root / "v241" / "bin" / "fdtd-solutions"),
+            "interconnect": str(install_root / "v241" / "bin" / "interconnect"),
+        }
+
+    def test_cache_hit(self, install_root, monkeypatch, tmp_path):
+        """Test 02: Test 'find_lumerical_installs' reuses the cached installations."""
+        _install(install_root, "v252")
+        scans = _count_scans(monkeypatch)
+
+        first = autodiscovery.find_lumerical_installs()
+        second = autodiscovery.find_lumerical_installs()
+
+        assert len(scans) == 1
+        assert first == second
+        assert (tmp_path / "cache" / "installs.json").is_file()
+
+        autodiscovery.find_lumerical_installs(refresh=True)
+        assert len(scans) == 2
+
+        (tmp_path / "cache" / "installs.json").write_text("{not json")
+        assert autodiscovery.find_lumerical_installs() == first
+        assert len(scans) == 3
+
+    def test_cache_invalidation(self, install_root, monkeypatch):
+        """Test 03: Test 'find_lumerical_installs' searches again when the directories change."""
+        install_dir = _install(install_root, "v242")
+        scans = _count_scans(monkeypatch)
+        autodiscovery.find_lumerical_installs()
+
+        _install(install_root, "v252")
+        _touch(install_root, 10**9)
+        assert [install.name for install in autodiscovery.find_lumerical_installs()] == ["v252", "v242"]
+        assert len(scans) == 2
+
+        (install_dir / "api" / "python").rmdir()
+        (install_dir / "api").rmdir()
+        _touch(install_dir, 10**9)
+        assert [install.name for install in autodiscovery.find_lumerical_installs()] == ["v252"]
+        assert len(scans) == 3
+
+    def test_get_install(self, install_root):
+        """Test 04: Test 'get_lumerical_install' selects an installation by version."""
+        _install(install_root, "v242")
+        _install(install_root, "v252")
+
+        assert autodiscovery.get_lumerical_install().name == "v252"
+        for version in ("v242", "242", "2024 R2", "2024R2", "24.2", (24, 2), (2024, 2)):
+            assert autodiscovery.get_lumerical_install(version).name == "v242"
+        assert autodiscovery.get_lumerical_install("2023 R1") is None
+        with pytest.raises(ValueError, match="Invalid Lumerical version"):
+            autodiscovery.get_lumerical_install("latest")
+
+    def test_locate_install(self, install_root, monkeypatch):
+        """Test 05: Test 'locate_lumerical_install' returns the newest installation."""
+        monkeypatch.delenv("LUMERICAL_HOME", raising=False)
+        monkeypatch.delenv("PYLUMERICAL_MOCK_ENGINE", raising=False)
+        assert autodiscovery.locate_lumerical_install() is None
+
+        _install(install_root, "v242")
+        _install(install_root, "v252")
+        _touch(install_root, 10**9)
+
+        assert autodiscovery.locate_lumerical_install() == str(install_root / "v252")
@@ -0,0 +1,330 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'caching' module.
+
+- test 01: Test 'CachedSimObjectResults' transfers each result only once
+- test 02: Test 'CachedSimObjectResults' is invalidated by 'run' and 'switchtolayout'
+- test 03: Test 'CachedSimObjectResults' 'prefetch' loads several results in one transfer
+- test 04: Test 'CachedSimObjectResults' raises for unknown results and rejects writes
+- test 05: Test 'cache_results' against a Lumerical session
+- test 06: Test 'CachedSimObject' shares property names between objects of the same type
+- test 07: Test 'CachedSimObject' caches property values and writes them through
+- test 08: Test 'CachedSimObject' values are invalidated by mutating commands only
+- test 09: Test 'enable_property_cache' with 'strict' reads every value from the session
+- test 10: Test 'enable_property_cache' against a Lumerical session
+- test 11: Test 'CachedSimObjectResults' 'prefetch' loads results of objects whose names contain quotes
+- test 12: Test 'CachedSimObject' reads objects whose names contain quotes
+"""
+
+import re
+
+import numpy as np
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core import caching
+
+
+class _FakeScriptInteropApi:
+    """Stand-in for the interop library that forwards scripts to a fake session."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def appOpened(self, handle):  # noqa: N802
+        return True
+
+    def appEvalScript(self, handle, code):  # noqa: N802
+        self.session.evaluate(code.decode())
+        return 0
+
+
+class _FakeObjectSession:
+    """Session stand-in with a single monitor whose results change on every run."""
+
+    def __init__(self):
+        self.handle = lumapi.LumApiSession(_FakeScriptInteropApi(self), object())
+        self.workspace = {}
+        self.runs = 0
+        self.getresult_calls = []
+        self.scripts = []
+
+    def _result(self, name):
+        return {"x": np.arange(3.0)[:, None] + self.runs, "T": np.ones((5, 1)) * self.runs, "E field": {"E": np.zeros((3, 3))}}[name]
+
+    def evaluate(self, code):
+        self.scripts.append(code)
+        for statement in code.strip().split("\n"):
+            cell = re.fullmatch(r"(\w+) = cell\((\d+)\);", statement)
+            result = re.fullmatch(r'(\w+)\{(\d+)\} = getresult\("(.+)", "(.+)"\);', statement)
+            if cell:
+                self.workspace[cell.group(1)] = [None] * int(cell.group(2))
+            elif result:
+                self.workspace[result.group(1)][int(result.group(2)) - 1] = self._result(result.group(4))
+            elif statement.startswith("clear("):
+                self.workspace.pop(statement[len("clear(") : -2])
+
+    def getnamednumber(self, name):
+        return 1
+
+    def getnamed(self, name, *args):
+        return "name\nx\ny"
+
+    def getresult(self, name, result=None):
+        self.getresult_calls.append(result)
+        if result is None:
+            return "x\nT\nE field"
+        return self._result(result)
+
+    def getv(self, varname):
+        return self.workspace[varname]
+
+    def eval(self, code):
+        self.scripts.append(code)
+
+    def run(self):
+        self.runs += 1
+
+    def switchtolayout(self):
+        pass
+
+
+class _FakeTreeSession(_FakeObjectSession):
+    """Session stand-in with a flat tree of rectangles and a group."""
+
+    def __init__(self, count):
+        super().__init__()
+        self.objects = {"::model::rect%d" % i: {"type": "Rectangle", "x": float(i), "x span": 1.0} for i in range(count)}
+        self.objects["::model::group"] = {"type": "Structure Group", "x": 0.0, "radius": 2.0}
+        self.getnamed_calls = []
+
+    def evaluate(self, code):
+        self.scripts.append(code)
+        for statement in code.strip().split("\n"):
+            cell = re.fullmatch(r"(\w+) = cell\(2\);", statement)
+            number = re.fullmatch(r'(\w+)\{1\} = getnamednumber\("(.+)"\);', statement)
+            type_name = re.fullmatch(r'if\((\w+)\{1\} >= 1\)\{ \w+\{2\} = getnamed\("(.+)", "type", 1\); \}', statement)
+            if cell:
+                self.workspace[cell.group(1)] = [0.0, ""]
+            elif number:
+                self.workspace[number.group(1)][0] = float(number.group(2) in self.objects)
+            elif type_name and self.workspace[type_name.group(1)][0] >= 1:
+                self.workspace[type_name.group(1)][1] = self.objects[type_name.group(2)]["type"]
+            elif statement.startswith("clear("):
+                self.workspace.pop(statement[len("clear(") : -2])
+
+    def getnamed(self, name, prop=None, index=1):
+        self.getnamed_calls.append(prop)
+        if prop is None:
+            return "\n".join(self.objects[name])
+        return self.objects[name][prop]
+
+    def setnamed(self, name, prop, value, index=1):
+        self.objects[name][prop] = float(value)
+
+    def set(self, prop, value):
+        for properties in self.objects.values():
+            properties[prop] = value
+
+    def groupscope(self, scope=None):
+        return "::model"
+
+    def getObjectById(self, id):  # noqa: N802
+        return lumapi.SimObject(self, id)
+
+    def getAllSelectedObjects(self):  # noqa: N802
+        return [self.getObjectById(id) for id in self.objects]
+
+
+class TestCaching:
+    """Test the 'caching' module."""
+
+    def test_results_cached(self):
+        """Test 01: Test 'CachedSimObjectResults' transfers each result only once."""
+        session = _FakeObjectSession()
+        monitor = lumapi.SimObject(session, "::model::monitor")
+        results = caching.cache_results(monitor)
+
+        assert monitor.results is results
+        for _ in range(3):
+            np.testing.assert_array_equal(results.x, np.arange(3.0)[:, None])
+            assert results.E_field is results["E field"]
+
+        assert session.getresult_calls == [None, "x", "E field"]
+        assert {"x", "T", "E field"} <= set(dir(results))
+
+    def test_results_invalidated(self):
+        """Test 02: Test 'CachedSimObjectResults' is invalidated by 'run' and 'switchtolayout'."""
+        session = _FakeObjectSession()
+        results = caching.cache_results(lumapi.SimObject(session, "::model::monitor"))
+
+        assert results.T[0, 0] == 0
+        session.run()
+        assert results.T[0, 0] == 1
+        assert results.T[0, 0] == 1
+        session.switchtolayout()
+        assert results.T[0, 0] == 1
+        session.eval("x = 1;")
+        results.T
+
+        assert session.getresult_calls == [None, "T", None, "T", None, "T", None, "T"]
+
+    def test_prefetch(self):
+        """Test 03: Test 'CachedSimObjectResults' 'prefetch' loads several results in one transfer."""
+        session = _FakeObjectSession()
+        results = caching.cache_results(lumapi.SimObject(session, "::model::monitor"))
+
+        results.prefetch(["x", "E_field"])
+        results.x, results.E_field
+        results.prefetch()
+
+        assert session.getresult_calls == [None]
+        assert len(session.scripts) == 4
+        assert session.scripts[0].count("getresult") == 2
+        assert session.scripts[2].count("getresult") == 1
+        assert 'getresult("::model::monitor", "T")' in session.scripts[2]
+        assert session.workspace == {}
+        np.testing.assert_array_equal(results.T, np.zeros((5, 1)))
+
+    def test_results_errors(self):
+        """Test 04: Test 'CachedSimObjectResults' raises for unknown results and rejects writes."""
+        session = _FakeObjectSession()
+        results = caching.cache_results(lumapi.SimObject(session, "::model::monitor"))
+
+        with pytest.raises(AttributeError, match="'SimObjectResults' object has no attribute 'xx'"):
+            results.xx
+        with pytest.raises(AttributeError, match="has no attribute 'xx'"):
+            results.prefetch(["xx"])
+        with pytest.raises(lumapi.LumApiError, match="Attribute 'x' can not be set"):
+            results.x = 1
+
+    @pytest.mark.skipif(not lumapi.InteropPaths.LUMERICALINSTALLDIR, reason="Requires a Lumerical installation")
+    def test_session_results(self, setup_fdtd_with_addfdtd):
+        """Test 05: Test 'cache_results' against a Lumerical session."""
+        results = caching.cache_results(setup_fdtd_with_addfdtd.getObjectBySelection())
+
+        results.prefetch(["x", "y"])
+
+        assert isinstance(results.x, np.ndarray)
+        assert results.x is results.x
+        assert "status" in dir(results)
+
+    def test_shared_schema(self):
+        """Test 06: Test 'CachedSimObject' shares property names between objects of the same type."""
+        session = _FakeTreeSession(5)
+        caching.enable_property_cache(session)
+
+        objects = session.getAllSelectedObjects()
+
+        assert all(isinstance(obj, caching.CachedSimObject) for obj in objects)
+        assert "x span" in dir(objects[3])
+        assert "radius" in dir(objects[-1])
+        assert session.getnamed_calls == [None, None]
+        assert len(session.scripts) == 2 * len(objects)
+        with pytest.raises(lumapi.LumApiError, match="not found"):
+            session.getObjectById("missing")
+
+    def test_property_values(self):
+        """Test 07: Test 'CachedSimObject' caches property values and writes them through."""
+        session = _FakeTreeSession(2)
+        caching.enable_property_cache(session)
+        rect = session.getObjectById("rect1")
+
+        assert rect.x == 1.0
+        assert rect["x"] == 1.0
+        assert rect.x_span == 1.0
+        rect.x_span = 3
+        assert rect.x_span == 3
+        assert session.objects["::model::rect1"]["x span"] == 3.0
+
+        assert session.getnamed_calls == [None, "x", "x span"]
+        with pytest.raises(AttributeError, match="has no attribute"):
+            rect.radius
+
+    def test_property_invalidation(self):
+        """Test 08: Test 'CachedSimObject' values are invalidated by mutating commands only."""
+        session = _FakeTreeSession(2)
+        caching.enable_property_cache(session)
+        rect = session.getObjectById("rect0")
+
+        assert rect.x == 0.0
+        session.groupscope("::model")
+        session.getnamed("::model::rect1", "x")
+        assert rect.x == 0.0
+        session.set("x", 5.0)
+        assert rect.x == 5.0
+        session.run()
+        assert rect.x == 5.0
+
+        assert session.getnamed_calls == [None, "x", "x", "x", "x"]
+
+    def test_strict(self):
+        """Test 09: Test 'enable_property_cache' with 'strict' reads every value from the session."""
+        session = _FakeTreeSession(2)
+        caching.enable_property_cache(session, strict=True)
+        rect = session.getObjectById("rect0")
+
+        rect.x, rect.x
+        session.objects["::model::rect0"]["x"] = 2.0
+
+        assert rect.x == 2.0
+        assert session.getnamed_calls == [None, "x", "x", "x"]
+
+    @pytest.mark.skipif(not lumapi.InteropPaths.LUMERICALINSTALLDIR, reason="Requires a Lumerical installation")
+    def test_session_property_cache(self, setup_fdtd):
+        """Test 10: Test 'enable_property_cache' against a Lumerical session."""
+        caching.enable_property_cache(setup_fdtd)
+        setup_fdtd.addrect(name="rect_a", x=1e-6)
+        setup_fdtd.addrect(name="rect_b", x=2e-6)
+
+        rect_a = setup_fdtd.getObjectById("rect_a")
+        rect_b = setup_fdtd.getObjectById("rect_b")
+
+        assert isinstance(rect_a, caching.CachedSimObject)
+        assert dir(rect_a) == dir(rect_b)
+        assert rect_b.x == 2e-6
+        rect_b.x = 3e-6
+        setup_fdtd.setnamed("rect_a", "x", 4e-6)
+        assert rect_a.x == 4e-6
+        assert rect_b.x == 3e-6
+
+    def test_prefetch_quoted_name(self, mock_fdtd):
+        """Test 11: Test 'CachedSimObjectResults' 'prefetch' loads results of objects whose names contain quotes."""
+        mock_fdtd.addfdtd()
+        mock_fdtd.addpower(name='it\'s "p"', frequency_points=5.0)
+        mock_fdtd.run()
+        results = caching.cache_results(mock_fdtd.getObjectById('::model::it\'s "p"'))
+
+        results.prefetch(["T"])
+
+        np.testing.assert_array_equal(results.T["T"], mock_fdtd.getresult('it\'s "p"', "T")["T"])
+
+    def test_property_cache_quoted_name(self, mock_fdtd):
+        """Test 12: Test 'CachedSimObject' reads objects whose names contain quotes."""
+        caching.enable_property_cache(mock_fdtd)
+        mock_fdtd.addrect(name='it\'s "r"', x_span=2e-6)
+
+        rect = mock_fdtd.getObjectById('::model::it\'s "r"')
+
+        assert isinstance(rect, caching.CachedSimObject)
+        assert rect.x_span == pytest.approx(2e-6)
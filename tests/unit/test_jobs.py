@@ -0,0 +1,163 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'jobs' module 'run_async' function and 'RunJob' object.
+
+- test 01: Test 'run_async' runs in the background and reports progress from the log file
+- test 02: Test 'RunJob' calls done callbacks with the job
+- test 03: Test 'RunJob' re-raises the error of a failed simulation
+- test 04: Test 'RunJob' 'terminate' closes the session and stops the simulation
+- test 05: Test 'run_async' against a Lumerical session
+- test 06: Test 'RunJob' 'terminate' raises if the simulation does not stop within the timeout
+"""
+
+import threading
+
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core import jobs
+
+
+class _LoggingSession:
+    """Session stand-in whose 'run' writes FDTD-style progress lines until it is released."""
+
+    def __init__(self, tmp_path, error=None):
+        self.filename = tmp_path / "project.fsp"
+        self.error = error
+        self.release = threading.Event()
+        self.logged = threading.Event()
+        self.closed = False
+
+    def currentfilename(self):
+        return str(self.filename)
+
+    def run(self, *args):
+        log = "Running simulation\n10.5% complete. Max time remaining: 2 mins.\n42% complete. Max time remaining: 1 min.\n"
+        self.filename.with_name("project_p0.log").write_text(log)
+        self.logged.set()
+        self.release.wait(5)
+        if self.closed:
+            raise AttributeError("'NoneType' object has no attribute 'iapi'")
+        if self.error:
+            raise self.error
+        return args
+
+    def close(self):
+        self.closed = True
+        self.release.set()
+
+
+class _StuckSession(_LoggingSession):
+    """Session stand-in whose 'run' does not return when the session is closed."""
+
+    def close(self):
+        self.closed = True
+
+
+class TestRunJob:
+    """Test the 'jobs' module 'run_async' function and 'RunJob' object."""
+
+    def test_progress(self, tmp_path):
+        """Test 01: Test 'run_async' runs in the background and reports progress from the log file."""
+        session = _LoggingSession(tmp_path)
+
+        job = jobs.run_async(session, "FDTD")
+        assert session.logged.wait(5)
+
+        assert not job.done()
+        assert job.progress() == 0.42
+        assert not job.wait(timeout=0.01)
+        with pytest.raises(TimeoutError):
+            job.result(timeout=0.01)
+
+        session.release.set()
+
+        assert job.wait(timeout=5)
+        assert job.result() == ("FDTD",)
+        assert job.progress() == 1.0
+
+    def test_callbacks(self, tmp_path):
+        """Test 02: Test 'RunJob' calls done callbacks with the job."""
+        session = _LoggingSession(tmp_path)
+        finished = []
+
+        job = jobs.run_async(session, log_file=tmp_path / "missing.log")
+        job.add_done_callback(finished.append)
+
+        assert job.progress() is None
+        session.release.set()
+        job.wait()
+        job.add_done_callback(finished.append)
+
+        assert finished == [job, job]
+
+    def test_failure(self, tmp_path):
+        """Test 03: Test 'RunJob' re-raises the error of a failed simulation."""
+        session = _LoggingSession(tmp_path, error=lumapi.LumApiError("in run, no simulation region"))
+        session.release.set()
+
+        job = jobs.run_async(session)
+
+        assert job.wait(timeout=5)
+        with pytest.raises(lumapi.LumApiError, match="no simulation region"):
+            job.result()
+        assert job.progress() == 0.42
+
+    def test_terminate(self, tmp_path):
+        """Test 04: Test 'RunJob' 'terminate' closes the session and stops the simulation."""
+        session = _LoggingSession(tmp_path)
+
+        job = jobs.run_async(session)
+        job.terminate()
+
+        assert session.closed
+        assert job.done()
+        with pytest.raises(lumapi.LumApiError, match="terminated"):
+            job.result()
+
+    @pytest.mark.skipif(not lumapi.InteropPaths.LUMERICALINSTALLDIR, reason="Requires a Lumerical installation")
+    def test_session_run_async(self, setup_fdtd, tmp_path):
+        """Test 05: Test 'run_async' against a Lumerical session."""
+        setup_fdtd.addfdtd(dimension="2D", x_span=1e-6, y_span=1e-6)
+        setup_fdtd.save(str(tmp_path / "run_async.fsp"))
+
+        job = jobs.run_async(setup_fdtd)
+
+        assert job.wait(timeout=600)
+        job.result()
+        assert job.progress() == 1.0
+
+    def test_terminate_timeout(self, tmp_path):
+        """Test 06: Test 'RunJob' 'terminate' raises if the simulation does not stop within the timeout."""
+        session = _StuckSession(tmp_path)
+
+        job = jobs.run_async(session)
+        with pytest.raises(TimeoutError, match="did not stop"):
+            job.terminate(timeout=0.01)
+
+        assert session.closed
+        assert not job.done()
+        session.release.set()
+        assert job.wait(timeout=5)
+        with pytest.raises(lumapi.LumApiError, match="terminated"):
+            job.result()
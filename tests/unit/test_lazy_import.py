@@ -0,0 +1,112 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the lazy import of the 'ansys.lumerical.core' package.
+
+- test 01: Test importing the package defers lumapi and autodiscovery
+- test 02: Test the first access to a session class bootstraps the environment
+- test 03: Test importing lumapi after the package bootstraps the environment
+- test 04: Test the package bootstraps at import when lumapi is already imported
+- test 05: Test the package lists and resolves its lazily loaded names
+- test 06: Test the bootstrap loads the mock engine only when it is requested
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import ansys.lumerical.core as lumcore
+
+
+def _run(code):
+    """Run Python code with the mock engine in a new interpreter and return its standard output."""
+    environment = dict(os.environ, PYLUMERICAL_MOCK_ENGINE="1")
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, env=environment).stdout.split()
+
+
+class TestLazyImport:
+    """Test the lazy import of the 'ansys.lumerical.core' package."""
+
+    def test_import_is_lazy(self):
+        """Test 01: Test importing the package defers lumapi and autodiscovery."""
+        output = _run(
+            "import sys, ansys.lumerical.core as c; print(c._bootstrapped, 'ansys.api.lumerical.lumapi' in sys.modules, 'numpy' in sys.modules)"
+        )
+
+        assert output == ["False", "False", "False"]
+
+    def test_session_class_bootstraps(self):
+        """Test 02: Test the first access to a session class bootstraps the environment."""
+        output = _run("import ansys.lumerical.core as c; c.FDTD; print(c._bootstrapped, c.InteropPaths.LUMERICALINSTALLDIR)")
+
+        assert output == ["True", "mock://lumerical"]
+
+    def test_lumapi_import_bootstraps(self):
+        """Test 03: Test importing lumapi after the package bootstraps the environment."""
+        output = _run(
+            "import ansys.lumerical.core as c\n"
+            "import lumapi\n"
+            "import ansys.api.lumerical.lumapi as api\n"
+            "print(c._bootstrapped, lumapi is api, api.InteropPaths.LUMERICALINSTALLDIR)"
+        )
+
+        assert output == ["True", "True", "mock://lumerical"]
+
+        output = _run("import ansys.lumerical.core.transfer, ansys.api.lumerical.lumapi as api; print(api.InteropPaths.LUMERICALINSTALLDIR)")
+        assert output == ["mock://lumerical"]
+
+    def test_lumapi_imported_first(self):
+        """Test 04: Test the package bootstraps at import when lumapi is already imported."""
+        output = _run(
+            "import ansys.api.lumerical.lumapi as api\n"
+            "api.InteropPaths.setLumericalInstallPath('mock://lumerical')\n"
+            "import ansys.lumerical.core as c\n"
+            "print(c._bootstrapped, api.InteropPaths.LUMERICALINSTALLDIR)"
+        )
+
+        assert output == ["True", "mock://lumerical"]
+
+    def test_lazy_names(self):
+        """Test 05: Test the package lists and resolves its lazily loaded names."""
+        names = dir(lumcore)
+
+        assert {"FDTD", "SessionPool", "batch", "transfer", "autodiscovery"} <= set(names)
+        assert set(lumcore.__all__) <= set(names)
+        assert lumcore.SessionPool.__module__ == "ansys.lumerical.core.pool"
+        assert lumcore.transfer.__name__ == "ansys.lumerical.core.transfer"
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            lumcore.missing
+
+    def test_mock_engine_not_requested(self):
+        """Test 06: Test the bootstrap loads the mock engine only when it is requested."""
+        code = (
+            "import sys, ansys.lumerical.core as c\n"
+            "c.FDTD\n"
+            "print(c._bootstrapped, 'ansys.lumerical.core.mock' in sys.modules, c.FDTD.__module__ == c._lumapi().initLib.__module__)"
+        )
+        environment = {name: value for name, value in os.environ.items() if name != "PYLUMERICAL_MOCK_ENGINE"}
+        output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, env=environment).stdout.split()
+
+        assert output == ["True", "False", "True"]
+        assert _run("import sys, ansys.lumerical.core as c; c.FDTD; print('ansys.lumerical.core.mock' in sys.modules)") == ["True"]
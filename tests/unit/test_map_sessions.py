@@ -0,0 +1,184 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'map_sessions' function.
+
+- test 01: Test 'map_sessions' returns results in parameter order
+- test 02: Test 'map_sessions' runs calls concurrently on separate sessions
+- test 03: Test 'map_sessions' retries a call on a fresh session after a lost connection
+- test 04: Test 'map_sessions' does not retry errors from live sessions
+- test 05: Test 'map_sessions' reuses a caller-provided pool without closing it
+- test 06: Test 'map_sessions' rejects unknown executors
+- test 07: Test 'map_sessions' opens the sessions of worker processes on the selected version
+- test 08: Test 'map_sessions' rejects another version in the current process
+- test 09: Test 'map_versions' runs the parameters on each version
+- test 10: Test 'map_sessions' closes the sessions of worker processes when they exit
+"""
+
+import multiprocessing
+import threading
+
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core import SessionPool, autodiscovery, map_sessions, map_versions
+
+
+def _install_dir(session, x):
+    """Return the installation that the worker process is configured for."""
+    return lumapi.InteropPaths.LUMERICALINSTALLDIR, x
+
+
+def _inherited(session, x):
+    """Return whether the worker process inherited the module state of the test process."""
+    return hasattr(lumapi, "_parent_marker")
+
+
+def _identity(session, x):
+    """Return the parameter."""
+    return x
+
+
+@pytest.fixture
+def versions(monkeypatch, tmp_path):
+    """Register two installations that do not exist on disk, on which spawned workers use the mock engine."""
+    monkeypatch.setenv("PYLUMERICAL_MOCK_ENGINE", "1")
+    monkeypatch.setattr(lumapi, "_parent_marker", True, raising=False)
+    installs = [autodiscovery.LumericalInstall(tmp_path / name, version) for name, version in (("v252", (25, 2)), ("v251", (25, 1)))]
+    monkeypatch.setattr(autodiscovery, "find_lumerical_installs", lambda refresh=False: installs)
+    return installs
+
+
+class TestMapSessions:
+    """Test the 'map_sessions' function."""
+
+    def test_results_in_order(self, fake_fdtd):
+        """Test 01: Test 'map_sessions' returns results in parameter order."""
+        results = map_sessions(lambda session, x: x * x, range(10), workers=3)
+
+        assert results == [x * x for x in range(10)]
+        assert len(fake_fdtd.started) == 3
+        assert not any(session.alive for session in fake_fdtd.started)
+
+    def test_concurrent_sessions(self, fake_fdtd):
+        """Test 02: Test 'map_sessions' runs calls concurrently on separate sessions."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def job(session, _):
+            barrier.wait()
+            return id(session)
+
+        session_ids = map_sessions(job, range(2), workers=2)
+
+        assert len(set(session_ids)) == 2
+
+    def test_retry_on_lost_connection(self, fake_fdtd):
+        """Test 03: Test 'map_sessions' retries a call on a fresh session after a lost connection."""
+        attempts = []
+
+        def job(session, x):
+            attempts.append(session)
+            if len(attempts) == 1:
+                session.alive = False
+                raise lumapi.LumApiError("Error validating the connection")
+            return x
+
+        assert map_sessions(job, [7]) == [7]
+        assert len(attempts) == 2
+        assert attempts[0] is not attempts[1]
+
+    def test_no_retry_on_script_error(self, fake_fdtd):
+        """Test 04: Test 'map_sessions' does not retry errors from live sessions."""
+        attempts = []
+
+        def job(session, x):
+            attempts.append(x)
+            raise lumapi.LumApiError("in set, the requested property was not found")
+
+        with pytest.raises(lumapi.LumApiError, match="property was not found"):
+            map_sessions(job, [1])
+
+        assert attempts == [1]
+
+    def test_shared_pool(self, fake_fdtd):
+        """Test 05: Test 'map_sessions' reuses a caller-provided pool without closing it."""
+        with SessionPool("fdtd", size=2) as pool:
+            map_sessions(lambda session, x: x, range(4), workers=2, pool=pool)
+            map_sessions(lambda session, x: x, range(4), workers=2, pool=pool)
+
+            assert not pool.closed
+
+        assert len(fake_fdtd.started) == 2
+
+    def test_unknown_executor(self):
+        """Test 06: Test 'map_sessions' rejects unknown executors."""
+        with pytest.raises(ValueError, match="Executor must be one of"):
+            map_sessions(lambda session, x: x, [1], executor="cluster")
+
+    def test_process_version(self, versions):
+        """Test 07: Test 'map_sessions' opens the sessions of worker processes on the selected version."""
+        install_dir = lumapi.InteropPaths.LUMERICALINSTALLDIR
+
+        results = map_sessions(_install_dir, range(3), workers=2, executor="process", version="2025 R1")
+
+        assert results == [(str(versions[1].path), x) for x in range(3)]
+        assert map_sessions(_inherited, [1], executor="process", version="v251") == [False]
+        assert lumapi.InteropPaths.LUMERICALINSTALLDIR == install_dir
+
+    def test_thread_version(self, fake_fdtd, versions):
+        """Test 08: Test 'map_sessions' rejects another version in the current process."""
+        with pytest.raises(ValueError, match="executor='process'"):
+            map_sessions(_install_dir, [1], version="v251")
+        with pytest.raises(ValueError, match="not installed"):
+            map_sessions(_install_dir, [1], executor="process", version="v241")
+
+        assert not fake_fdtd.started
+
+    def test_map_versions(self, versions):
+        """Test 09: Test 'map_versions' runs the parameters on each version."""
+        results = map_versions(_install_dir, range(2), ["v251", versions[0]])
+
+        assert results == {
+            "v251": [(str(versions[1].path), 0), (str(versions[1].path), 1)],
+            versions[0]: [(str(versions[0].path), 0), (str(versions[0].path), 1)],
+        }
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="Worker processes must inherit the patched session class.")
+    def test_process_close(self, fake_fdtd, monkeypatch, tmp_path):
+        """Test 10: Test 'map_sessions' closes the sessions of worker processes when they exit."""
+        log = tmp_path / "close.log"
+
+        class LoggedSession(fake_fdtd):
+            def __init__(self, hide=False, log=None):
+                super().__init__(hide=hide)
+                self.log = log
+
+            def close(self):
+                super().close()
+                with self.log.open("a") as log:
+                    log.write("closed\n")
+
+        monkeypatch.setattr(lumapi, "FDTD", LoggedSession)
+
+        assert map_sessions(_identity, range(4), workers=2, executor="process", log=log) == list(range(4))
+
+        assert log.read_text().splitlines() == ["closed", "closed"]
@@ -0,0 +1,182 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'mock' module.
+
+- test 01: Test 'enable' and 'disable' select the mock engine for new sessions
+- test 02: Test the environment variable selects the mock engine during autodiscovery
+- test 03: Test 'putv' and 'getv' round-trip values through the mock engine
+- test 04: Test the mock engine evaluates control flow, indexing and datasets
+- test 05: Test the mock engine reports script errors like Lumerical
+- test 06: Test 'SimObject' reads and writes properties of mock objects
+- test 07: Test 'run' fills monitor results and switches to analysis mode
+- test 08: Test 'save' and 'load' restore the object tree
+- test 09: Test the mock engine drops trailing singleton dimensions like Lumerical
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core import autodiscovery, mock
+
+
+class TestMock:
+    """Test the 'mock' module."""
+
+    def test_enable_disable(self, monkeypatch):
+        """Test 01: Test 'enable' and 'disable' select the mock engine for new sessions."""
+        monkeypatch.delenv(mock.ENVIRONMENT_VARIABLE, raising=False)
+        install_path = lumapi.InteropPaths.LUMERICALINSTALLDIR
+
+        mock.enable()
+        try:
+            assert mock.is_enabled()
+            assert lumapi.InteropPaths.LUMERICALINSTALLDIR == mock.MOCK_INSTALL_PATH
+            assert isinstance(lumapi.initLib(None), mock.MockInteropLibrary)
+        finally:
+            mock.disable()
+
+        assert lumapi.InteropPaths.LUMERICALINSTALLDIR == install_path
+        assert mock.is_enabled() == (install_path == mock.MOCK_INSTALL_PATH)
+
+    def test_environment_variable(self, monkeypatch):
+        """Test 02: Test the environment variable selects the mock engine during autodiscovery."""
+        monkeypatch.setenv(mock.ENVIRONMENT_VARIABLE, "1")
+
+        assert mock.is_enabled()
+        assert autodiscovery.locate_lumerical_install() == mock.MOCK_INSTALL_PATH
+
+        monkeypatch.setenv(mock.ENVIRONMENT_VARIABLE, "0")
+        assert autodiscovery.locate_lumerical_install() != mock.MOCK_INSTALL_PATH
+
+    def test_putv_getv(self, mock_fdtd):
+        """Test 03: Test 'putv' and 'getv' round-trip values through the mock engine."""
+        values = {
+            "number": 1.5,
+            "text": "hello",
+            "matrix": np.arange(12.0).reshape(3, 4),
+            "complex": np.array([[1 + 2j], [3 - 4j]]),
+            "cell": ["a", 2.0],
+            "struct": {"a": 1.0, "b": "c"},
+        }
+        for name, value in values.items():
+            mock_fdtd.putv(name, value)
+
+        assert mock_fdtd.getv("number") == 1.5
+        assert mock_fdtd.getv("text") == "hello"
+        np.testing.assert_array_equal(mock_fdtd.getv("matrix"), values["matrix"])
+        np.testing.assert_array_equal(mock_fdtd.getv("complex"), values["complex"])
+        assert mock_fdtd.getv("cell") == ["a", 2.0]
+        assert mock_fdtd.getv("struct") == {"a": 1.0, "b": "c"}
+
+    def test_script(self, mock_fdtd):
+        """Test 04: Test the mock engine evaluates control flow, indexing and datasets."""
+        mock_fdtd.eval(
+            "total = 0;\n"
+            "for(i = 1:10) { if(mod(i, 2) == 0) { total = total + i; } }\n"
+            "m = matrix(2, 3);\n"
+            "m(2, :) = [1, 2, 3];\n"
+            "words = splitstring('a,b,c', ',');\n"
+            "ds = rectilineardataset('E', linspace(0, 1, 3), 0, 0);\n"
+            "ds.addparameter('lambda', [1.5e-6, 1.6e-6]);\n"
+            "ds.addattribute('E', ones(3, 2));"
+        )
+
+        assert mock_fdtd.getv("total") == 30.0
+        np.testing.assert_array_equal(mock_fdtd.getv("m"), [[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]])
+        assert mock_fdtd.getv("words") == ["a", "b", "c"]
+        dataset = mock_fdtd.getv("ds")
+        assert dataset["E"].shape == (3, 1, 1, 2)
+        np.testing.assert_array_equal(dataset["lambda"], [[1.5e-6], [1.6e-6]])
+
+    def test_errors(self, mock_fdtd):
+        """Test 05: Test the mock engine reports script errors like Lumerical."""
+        with pytest.raises(lumapi.LumApiError, match="Failed to evaluate code"):
+            mock_fdtd.eval("x = undefined_variable;")
+        with pytest.raises(lumapi.LumApiError, match="no simulation region was found"):
+            mock_fdtd.run()
+
+        mock_fdtd.eval("try { select('missing'); getid; } catch(message);")
+        assert "no items are currently selected" in mock_fdtd.getv("message")
+
+    def test_sim_object(self, mock_fdtd):
+        """Test 06: Test 'SimObject' reads and writes properties of mock objects."""
+        rect = mock_fdtd.addrect(properties=OrderedDict([("name", "slab"), ("x span", 2e-6)]), index=3.5)
+
+        assert isinstance(rect, lumapi.SimObject)
+        assert rect["x span"] == 2e-6
+        assert rect["x max"] == pytest.approx(1e-6)
+        rect["x min"] = -2e-6
+        assert mock_fdtd.getnamed("slab", "x span") == pytest.approx(3e-6)
+        assert mock_fdtd.getnamed("slab", "index") == 3.5
+        with pytest.raises(lumapi.LumApiError, match="not found"):
+            mock_fdtd.setnamed("slab", "no such property", 1.0)
+
+    def test_run(self, mock_fdtd):
+        """Test 07: Test 'run' fills monitor results and switches to analysis mode."""
+        mock_fdtd.addfdtd()
+        mock_fdtd.addrect(name="slab", index=2.0, z_span=1e-6, x_span=10e-6, y_span=10e-6)
+        monitor = mock_fdtd.addpower(name="T", frequency_points=7.0)
+
+        mock_fdtd.run()
+
+        assert mock_fdtd.layoutmode() == 0.0
+        transmission = mock_fdtd.getresult("T", "T")
+        assert transmission["T"].shape == (7,)
+        assert np.all((transmission["T"] >= 0.0) & (transmission["T"] <= 1.0))
+        np.testing.assert_array_equal(monitor.results.T["T"], transmission["T"])
+        with pytest.raises(lumapi.LumApiError, match="analysis mode"):
+            mock_fdtd.addrect()
+
+        mock_fdtd.switchtolayout()
+        assert mock_fdtd.haveresult("T") == 0.0
+
+    def test_save_load(self, mock_fdtd, tmp_path):
+        """Test 08: Test 'save' and 'load' restore the object tree."""
+        mock_fdtd.addrect(name="slab", x=1e-6)
+        mock_fdtd.addcircle(name="disk", radius=2e-6)
+        mock_fdtd.save(str(tmp_path / "project"))
+
+        assert (tmp_path / "project.fsp").is_file()
+
+        mock_fdtd.newproject()
+        assert mock_fdtd.getnamednumber("slab") == 0.0
+        mock_fdtd.load(str(tmp_path / "project.fsp"))
+
+        assert mock_fdtd.getnamed("slab", "x") == 1e-6
+        assert mock_fdtd.getnamed("disk", "radius") == 2e-6
+
+    def test_trailing_singletons(self, mock_fdtd):
+        """Test 09: Test the mock engine drops trailing singleton dimensions like Lumerical."""
+        mock_fdtd.eval(
+            "a = size(randmatrix(2, 3, 1)); b = randmatrix(2, 3, 4); c = size(b(:, :, 2)); d = matrix(2, 3, 1, 1);"
+            "d(:, :, 1, 1) = 1; e = size(d); f = size(matrix(1, 1, 3));"
+        )
+
+        assert mock_fdtd.getv("a").tolist() == [[2.0, 3.0]]
+        assert mock_fdtd.getv("c").tolist() == [[2.0, 3.0]]
+        assert mock_fdtd.getv("e").tolist() == [[2.0, 3.0]]
+        assert mock_fdtd.getv("f").tolist() == [[1.0, 1.0, 3.0]]
+        assert mock_fdtd.getv("b").shape == (2, 3, 4)
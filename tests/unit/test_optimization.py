@@ -0,0 +1,179 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'optimization' module.
+
+- test 01: Test 'EvaluationCache' returns stored results for parameters within the tolerance
+- test 02: Test 'EvaluationCache' persists evaluations to disk
+- test 03: Test 'memoize' replaces the method of a single instance
+- test 04: Test 'fom_and_gradient' runs forward and adjoint simulations of all terms concurrently
+- test 05: Test 'fom_and_gradient' skips adjoint simulations when no gradient is requested
+- test 06: Test 'evaluate_batch' evaluates candidates concurrently and skips cached ones
+- test 07: Test 'batch_objective' drives a vectorized population optimizer
+"""
+
+import threading
+
+import numpy as np
+from scipy.optimize import differential_evolution
+
+from ansys.lumerical.core import SessionPool
+from ansys.lumerical.core.optimization import AdjointTerm, EvaluationCache, batch_objective, evaluate_batch, fom_and_gradient, memoize
+
+
+class _Problem:
+    """Stand-in for an optimization project that counts its simulations."""
+
+    def __init__(self):
+        self.simulations = []
+
+    def evaluate(self, params, label=None):
+        self.simulations.append(np.array(params))
+        return float(np.sum(np.square(params))), {"gradient": 2.0 * np.asarray(params), "label": label}
+
+
+def _port_term(port, calls, barrier=None):
+    """Return a term whose simulations record the session they ran on."""
+
+    def simulation(kind):
+        def run(session, params):
+            calls.append((kind, port, session))
+            if barrier is not None:
+                barrier.wait()
+            return port * np.asarray(params)
+
+        return run
+
+    def combine(params, forward, adjoint):
+        return float(forward.sum()), None if adjoint is None else forward * adjoint
+
+    return AdjointTerm(simulation("forward"), simulation("adjoint"), combine)
+
+
+class TestOptimization:
+    """Test the 'optimization' module."""
+
+    def test_tolerance(self):
+        """Test 01: Test 'EvaluationCache' returns stored results for parameters within the tolerance."""
+        problem = _Problem()
+        evaluate = EvaluationCache(atol=1e-9).wrap(problem.evaluate)
+
+        fom, extra = evaluate([1.0, 2.0])
+        assert evaluate([1.0, 2.0 + 1e-12]) == (fom, extra)
+        assert evaluate(np.array([[1.0], [2.0]]))[0] == fom
+        evaluate([1.0, 2.1])
+        evaluate([1.0, 2.0, 0.0])
+
+        assert len(problem.simulations) == 3
+        assert (evaluate.cache.hits, evaluate.cache.misses) == (2, 3)
+        assert evaluate.__name__ == "evaluate"
+        assert EvaluationCache().lookup([1.0], default="missing") == "missing"
+
+    def test_persistence(self, tmp_path):
+        """Test 02: Test 'EvaluationCache' persists evaluations to disk."""
+        problem = _Problem()
+        evaluate = EvaluationCache(tmp_path).wrap(problem.evaluate)
+        evaluate([0.5, 0.25], label="first")
+        evaluate([0.5, 0.5])
+
+        restarted = EvaluationCache(tmp_path)
+        fom, extra = restarted.lookup([0.5, 0.25])
+
+        assert len(restarted) == 2
+        assert fom == 0.3125
+        np.testing.assert_array_equal(extra["gradient"], [1.0, 0.5])
+        assert extra["label"] == "first"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_memoize(self):
+        """Test 03: Test 'memoize' replaces the method of a single instance."""
+        problem, other = _Problem(), _Problem()
+
+        cache = memoize(problem, "evaluate")
+        problem.evaluate([1.0])
+        problem.evaluate([1.0])
+        other.evaluate([1.0])
+
+        assert cache.hits == 1
+        assert len(problem.simulations) == 1
+        assert problem.evaluate.cache is cache
+        assert not hasattr(other.evaluate, "cache")
+
+    def test_parallel_terms(self, fake_fdtd):
+        """Test 04: Test 'fom_and_gradient' runs forward and adjoint simulations of all terms concurrently."""
+        calls = []
+        barrier = threading.Barrier(4, timeout=5)
+        terms = [_port_term(1.0, calls, barrier), _port_term(2.0, calls, barrier)]
+
+        with SessionPool("fdtd", size=4) as pool:
+            fom, gradient = fom_and_gradient(pool, terms, [1.0, 2.0])
+
+        assert fom == 9.0
+        np.testing.assert_array_equal(gradient, [5.0, 20.0])
+        assert sorted((kind, port) for kind, port, _ in calls) == [("adjoint", 1.0), ("adjoint", 2.0), ("forward", 1.0), ("forward", 2.0)]
+        assert len({id(session) for _, _, session in calls}) == 4
+
+    def test_forward_only(self, fake_fdtd):
+        """Test 05: Test 'fom_and_gradient' skips adjoint simulations when no gradient is requested."""
+        calls = []
+
+        with SessionPool("fdtd", size=2) as pool:
+            fom, gradient = fom_and_gradient(pool, [_port_term(1.0, calls), _port_term(3.0, calls)], [0.5], gradient=False)
+
+        assert (fom, gradient) == (2.0, None)
+        assert [kind for kind, _, _ in calls] == ["forward", "forward"]
+
+    def test_evaluate_batch(self, fake_fdtd):
+        """Test 06: Test 'evaluate_batch' evaluates candidates concurrently and skips cached ones."""
+        barrier = threading.Barrier(3, timeout=5)
+        sessions = []
+
+        def loss(session, params):
+            sessions.append(session)
+            barrier.wait()
+            return float(np.sum(params))
+
+        cache = EvaluationCache()
+        cache.store([0.0, 0.0], -1.0)
+        with SessionPool("fdtd", size=3) as pool:
+            results = evaluate_batch(pool, loss, [[1.0, 2.0], [0.0, 0.0], [3.0, 4.0], [5.0, 6.0]], cache=cache)
+
+        assert results == [3.0, -1.0, 7.0, 11.0]
+        assert len({id(session) for session in sessions}) == 3
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert cache.lookup([5.0, 6.0]) == 11.0
+
+    def test_batch_objective(self, fake_fdtd):
+        """Test 07: Test 'batch_objective' drives a vectorized population optimizer."""
+        evaluations = []
+
+        def loss(session, params):
+            evaluations.append(params)
+            return float(np.sum((params - 0.25) ** 2))
+
+        with SessionPool("fdtd", size=4) as pool:
+            objective = batch_objective(pool, loss)
+            assert objective(np.array([0.25, 0.25])) == 0.0
+            result = differential_evolution(objective, [(0.0, 1.0)] * 2, vectorized=True, updating="deferred", maxiter=20, seed=1, polish=False)
+
+        assert result.fun < 1e-3
+        assert len(evaluations) > result.nfev + 1
@@ -0,0 +1,134 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'profiling' module.
+
+- test 01: Test 'Profiler' records calls, transferred bytes and translation time
+- test 02: Test 'Profiler' nests the calls made by other calls
+- test 03: Test 'Profiler' records errors and re-raises them
+- test 04: Test 'Profiler' exports Chrome traces and OpenTelemetry spans
+- test 05: Test 'Profiler' restores the session and lumapi once closed
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core.profiling import Profiler
+
+
+class TestProfiling:
+    """Test the 'profiling' module."""
+
+    def test_record_calls(self, mock_fdtd):
+        """Test 01: Test 'Profiler' records calls, transferred bytes and translation time."""
+        values = np.ones((100, 100))
+        with Profiler(mock_fdtd) as profiler:
+            mock_fdtd.putv("a", values)
+            mock_fdtd.getv("a")
+            mock_fdtd.eval("b = 1;")
+            mock_fdtd.eval("c = 2;")
+
+        stats = profiler.stats()
+        assert stats["eval"].count == 2
+        assert stats["putv"].bytes_sent >= values.nbytes
+        assert stats["getv"].bytes_received == values.nbytes
+        assert stats["getv"].translation_time > 0
+        assert stats["putv"].translation_time > 0
+        assert all(span.session == "FDTD-1" for span in profiler.spans)
+        summary = profiler.summary()
+        assert summary.splitlines()[0].startswith("Call")
+        assert "putv" in summary and "getv" in summary
+
+    def test_nested_calls(self, mock_fdtd):
+        """Test 02: Test 'Profiler' nests the calls made by other calls."""
+        with Profiler(mock_fdtd) as profiler:
+            rect = mock_fdtd.addrect(name="slab")
+            rect.x = 1e-6
+
+        spans = {span.name: span for span in profiler.spans}
+        assert spans["addrect"].parent_id is None
+        assert spans["getid"].parent_id == spans["addrect"].span_id
+        assert spans["setnamed"].parent_id is None
+        assert spans["addrect"].duration >= spans["getid"].duration
+
+    def test_errors(self, mock_fdtd):
+        """Test 03: Test 'Profiler' records errors and re-raises them."""
+        with Profiler(mock_fdtd) as profiler:
+            with pytest.raises(lumapi.LumApiError):
+                mock_fdtd.getnamed("missing", "x")
+
+        (span,) = profiler.spans
+        assert "missing" in span.error
+        assert profiler.stats()["getnamed"].errors == 1
+
+    def test_export(self, mock_fdtd, tmp_path):
+        """Test 04: Test 'Profiler' exports Chrome traces and OpenTelemetry spans."""
+        with Profiler(mock_fdtd) as profiler:
+            mock_fdtd.putv("a", np.ones(10))
+            mock_fdtd.addrect()
+
+        profiler.save_chrome_trace(tmp_path / "trace.json")
+        trace = json.loads((tmp_path / "trace.json").read_text())
+        calls = [event for event in trace["traceEvents"] if event["cat"] == "lumerical"]
+        assert [event["name"] for event in calls][:3] == ["putv", "addrect", "getid"]
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in trace["traceEvents"])
+        assert any(event["cat"] == "translation" for event in trace["traceEvents"])
+
+        spans = profiler.otel_spans()
+        assert len({span["traceId"] for span in spans}) == 1
+        by_name = {span["name"]: span for span in spans}
+        assert by_name["getid"]["parentSpanId"] == by_name["addrect"]["spanId"]
+        assert by_name["putv"]["parentSpanId"] == ""
+        assert all(int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"]) for span in spans)
+        putv = by_name["putv"]
+        assert sorted(putv) == sorted(
+            ["traceId", "spanId", "parentSpanId", "name", "kind", "startTimeUnixNano", "endTimeUnixNano", "attributes", "status"]
+        )
+        assert (len(putv["traceId"]), len(putv["spanId"]), putv["kind"], putv["status"]) == (32, 16, 3, {"code": 1})
+        attributes = {attribute["key"]: attribute["value"] for attribute in putv["attributes"]}
+        assert sorted(attributes) == sorted(
+            ["lumerical.session", "lumerical.bytes_sent", "lumerical.bytes_received", "lumerical.translation_time_ns", "thread.id"]
+        )
+        assert int(attributes["lumerical.bytes_sent"]["intValue"]) >= 80
+        assert list(attributes["lumerical.session"]) == ["stringValue"]
+        json.dumps(spans)
+
+    def test_close(self, mock_fdtd):
+        """Test 05: Test 'Profiler' restores the session and lumapi once closed."""
+        pack_matrix = lumapi.packMatrix
+        profiler = Profiler(mock_fdtd)
+        mock_fdtd.eval("a = 1;")
+        assert profiler.spans == []
+
+        profiler.start()
+        assert lumapi.packMatrix is not pack_matrix
+        mock_fdtd.eval("a = 1;")
+        profiler.close()
+        mock_fdtd.eval("a = 2;")
+
+        assert len(profiler.spans) == 1
+        assert lumapi.packMatrix is pack_matrix
+        assert "eval" not in vars(mock_fdtd)
+        assert mock_fdtd.getv("a") == 2.0
@@ -0,0 +1,182 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'result_cache' module 'ResultCache' object.
+
+- test 01: Test 'ResultCache' runs a simulation once for identical projects
+- test 02: Test 'ResultCache' keys depend on the project, the results, and the run arguments
+- test 03: Test 'ResultCache' stores datasets, cells, and scalars
+- test 04: Test 'ResultCache' evicts the least recently used entries
+- test 05: Test 'ResultCache' against a Lumerical session
+- test 06: Test 'ResultCache' hashes a temporary copy of the project and keeps the project file
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core.result_cache import ResultCache
+
+
+class _ProjectSession:
+    """Session stand-in whose saved project contains its properties."""
+
+    def __init__(self, width=1.0):
+        self.width = width
+        self.filename = ""
+        self.runs = 0
+
+    def currentfilename(self):
+        return self.filename
+
+    def save(self, filename):
+        self.filename = filename
+        Path(filename).write_text("width=%r" % self.width)
+
+    def run(self, *args):
+        self.runs += 1
+
+    def getresult(self, name, result):
+        transmission = np.linspace(0.0, self.width, 201)[:, None]
+        return {"lambda": np.linspace(1.5e-6, 1.6e-6, 201)[:, None], result: transmission, "Lumerical_dataset": {"parameters": [["lambda"]]}}
+
+
+def _dataset(size):
+    return {"x": np.random.default_rng(size).random((size, 1))}
+
+
+class TestResultCache:
+    """Test the 'result_cache' module 'ResultCache' object."""
+
+    def test_hit(self, tmp_path):
+        """Test 01: Test 'ResultCache' runs a simulation once for identical projects."""
+        cache = ResultCache(tmp_path / "cache")
+        session = _ProjectSession(width=0.5)
+        session.filename = str(tmp_path / "project.fsp")
+
+        first = cache.run(session, [("output", "T")])
+        second = cache.run(session, [("output", "T")])
+
+        assert session.runs == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(cache) == 1
+        assert list(second) == [("output", "T")]
+        np.testing.assert_array_equal(second["output", "T"]["T"], first["output", "T"]["T"])
+        assert second["output", "T"]["Lumerical_dataset"] == {"parameters": [["lambda"]]}
+
+    def test_key(self, tmp_path):
+        """Test 02: Test 'ResultCache' keys depend on the project, the results, and the run arguments."""
+        cache = ResultCache(tmp_path)
+        session = _ProjectSession()
+        session.filename = str(tmp_path / "project.fsp")
+
+        key = cache.key(session, [("output", "T")])
+
+        assert cache.key(session, [("output", "T")]) == key
+        assert cache.key(session, [("output", "R")]) != key
+        assert cache.key(session, [("output", "T")], extra="FDTD") != key
+        session.width = 2.0
+        assert cache.key(session, [("output", "T")]) != key
+        assert cache.get(key) is None
+
+        cache.run(session, [("output", "T")])
+        cache.run(session, [("output", "T")], "FDTD")
+        assert session.runs == 2
+
+        unknown = ResultCache(tmp_path)
+        with pytest.raises(lumapi.LumApiError, match="Cannot determine the project file type"):
+            unknown.key(_ProjectSession(), [("output", "T")])
+
+    def test_payloads(self, tmp_path):
+        """Test 03: Test 'ResultCache' stores datasets, cells, and scalars."""
+        cache = ResultCache(tmp_path)
+        results = {
+            ("monitor", "E"): {"E": np.ones((2, 3, 1, 4, 3), dtype=complex), "Lumerical_dataset": {"attributes": ["E"], "parameters": [["x"]]}},
+            ("model", "cell"): [1.5, "text", [np.arange(3.0)]],
+            ("model", "value"): np.float64(2.5),
+        }
+
+        cache.put("key", results)
+        cached = cache.get("key")
+
+        assert cached["monitor", "E"]["E"].dtype == complex
+        np.testing.assert_array_equal(cached["monitor", "E"]["E"], results["monitor", "E"]["E"])
+        assert cached["monitor", "E"]["Lumerical_dataset"] == results["monitor", "E"]["Lumerical_dataset"]
+        assert cached["model", "cell"][:2] == [1.5, "text"]
+        np.testing.assert_array_equal(cached["model", "cell"][2][0], np.arange(3.0))
+        assert cached["model", "value"] == 2.5
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_eviction(self, tmp_path):
+        """Test 04: Test 'ResultCache' evicts the least recently used entries."""
+        cache = ResultCache(tmp_path, max_entries=2)
+        cache.put("a", {("m", "x"): _dataset(10)})
+        cache.put("b", {("m", "x"): _dataset(10)})
+        os.utime(tmp_path / "a.npz", (0, 0))
+        os.utime(tmp_path / "b.npz", (1, 1))
+        assert cache.get("a") is not None
+
+        cache.put("c", {("m", "x"): _dataset(10)})
+
+        assert sorted(entry.stem for entry in tmp_path.glob("*.npz")) == ["a", "c"]
+
+        limited = ResultCache(tmp_path, max_bytes=cache.size)
+        limited.put("d", {("m", "x"): _dataset(10000)})
+        assert limited.size <= cache.size
+        limited.clear()
+        assert len(limited) == 0
+
+    @pytest.mark.skipif(not lumapi.InteropPaths.LUMERICALINSTALLDIR, reason="Requires a Lumerical installation")
+    def test_session_result_cache(self, setup_fdtd_with_addfdtd, tmp_path):
+        """Test 05: Test 'ResultCache' against a Lumerical session."""
+        setup_fdtd_with_addfdtd.addpower(name="monitor")
+        cache = ResultCache(tmp_path)
+
+        first = cache.run(setup_fdtd_with_addfdtd, [("monitor", "T")])
+        setup_fdtd_with_addfdtd.switchtolayout()
+        second = cache.run(setup_fdtd_with_addfdtd, [("monitor", "T")])
+
+        assert cache.hits == 1
+        np.testing.assert_array_equal(second["monitor", "T"]["T"], first["monitor", "T"]["T"])
+
+    def test_project_copy(self, tmp_path):
+        """Test 06: Test 'ResultCache' hashes a temporary copy of the project and keeps the project file."""
+        cache = ResultCache(tmp_path / "cache")
+        session = _ProjectSession(width=0.5)
+        session.save(str(tmp_path / "project.fsp"))
+        os.utime(tmp_path / "project.fsp", (0, 0))
+        session.width = 0.7
+
+        cache.key(session, [("output", "T")])
+        cache.run(session, [("output", "T")])
+        cache.run(session, [("output", "T")])
+
+        assert (tmp_path / "project.fsp").read_text() == "width=0.5"
+        assert (tmp_path / "project.fsp").stat().st_mtime == 0
+        assert not Path(session.filename).exists()
+        assert (session.runs, cache.hits) == (1, 1)
+        assert [entry.suffix for entry in cache.directory.iterdir()] == [".npz"]
+        cache.clear()
+        assert not any(cache.directory.iterdir())
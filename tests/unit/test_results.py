@@ -0,0 +1,324 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'results' module functions.
+
+- test 01: Test 'getresult_mmap' streams dataset attributes to memory-mapped files in chunks
+- test 02: Test 'getresult_mmap' stores complex attributes
+- test 03: Test 'getresult_mmap' returns results that are not datasets unchanged
+- test 04: Test 'getresult_mmap' raises when the result cannot be found
+- test 05: Test 'getresult_mmap' against a Lumerical session
+- test 06: Test 'to_arrow' has one row per point and parameter value, over the attribute buffers
+- test 07: Test 'to_arrow' converts matrix datasets with complex attributes
+- test 08: Test 'to_arrow' converts the cell attributes of unstructured datasets
+- test 09: Test 'getresult' returns monitor results as dictionaries or Arrow tables
+- test 10: Test 'getresult_mmap' keeps interdependent parameters in one group
+- test 11: Test 'getresult_mmap' streams vector results in chunks smaller than one component
+- test 12: Test 'getresult_mmap' reads results of objects whose names contain quotes
+- test 13: Test 'getresult' reads results of objects whose names contain quotes
+"""
+
+import re
+
+import numpy as np
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core import results, transfer
+
+
+class _FakeResultSession:
+    """Session stand-in that interprets the scripts generated by 'getresult_mmap'."""
+
+    def __init__(self, result, axes=None, parameters=None):
+        self.result = result
+        self.axes = axes or {}
+        self.parameters = parameters or {}
+        self.workspace = {}
+        self.chunk_sizes = []
+
+    def _evaluate(self, expression):
+        match = re.fullmatch(r'getattribute\((\w+), "(.+)"\)', expression)
+        if match:
+            return self.result[match.group(2)]
+        match = re.fullmatch(r'getparameter\((\w+), "(\w+)"\)', expression)
+        if match:
+            return self.parameters[match.group(2)]
+        match = re.fullmatch(r"(size|length)\((.+)\)", expression)
+        if match:
+            value = np.shape(self._evaluate(match.group(2)))
+            return np.array([value], dtype=float) if match.group(1) == "size" else float(value[0])
+        match = re.fullmatch(r"(\w+)\.(\w)", expression)
+        if match:
+            return self.axes[match.group(2)]
+        match = re.fullmatch(r"(\w+)\((\d+):(\d+)\)", expression)
+        matrix = self.workspace[match.group(1)]
+        return matrix.ravel(order="F")[int(match.group(2)) - 1 : int(match.group(3))].reshape(-1, 1)
+
+    def eval(self, code):
+        if code.startswith("clear("):
+            for name in re.findall(r"\w+", code[len("clear(") :]):
+                self.workspace.pop(name, None)
+            return
+        match = re.search(r'(\w+) = getresult\("(\w+)", "(\w+)"\)', code)
+        if match:
+            info = match.group(1) + "_info"
+            if match.group(3) != "E":
+                self.workspace[info] = [0.0, "", "", 0.0, "Error: prompt line 2: result not found", 0.0]
+            elif isinstance(self.result, dict):
+                attributes = "\n".join(self.result)
+                parameters = "\n".join(list(self.axes) + list(self.parameters))
+                self.workspace[info] = [1.0, attributes, parameters, float(bool(self.axes)), "", 0.0]
+            else:
+                self.workspace[info] = [0.0, "", "", 0.0, "", 0.0]
+                self.workspace[match.group(1)] = self.result
+            return
+        for statement in filter(None, code.split("\n")):
+            name, expression = statement.rstrip(";").split(" = ")
+            match = re.fullmatch(r"(\w+)\{(\d+)\}", name)
+            if match:
+                self.workspace[match.group(1)][int(match.group(2)) - 1] = self._evaluate(expression)
+            elif expression.startswith("cell("):
+                self.workspace[name] = [0.0] * int(expression[5:-1])
+            elif expression.startswith("size("):
+                self.workspace[name] = np.array([self.workspace[expression[5:-1]].shape], dtype=float)
+            else:
+                self.workspace[name] = self._evaluate(expression)
+
+    def getv(self, varname):
+        return self.workspace[varname]
+
+
+def _fake_transfer_getv(session, varname, out=None):
+    """Read a fake session variable the same way as 'transfer.getv'."""
+    value = np.asarray(session.workspace[varname])
+    while value.ndim > 2 and value.shape[-1] == 1:
+        value = value[..., 0]
+    session.chunk_sizes.append(value.nbytes)
+    if out is None:
+        return np.asfortranarray(value)
+    np.copyto(out, value)
+    return out
+
+
+@pytest.fixture
+def fake_transfer(monkeypatch):
+    """Read matrices from the fake session instead of the interop library."""
+    monkeypatch.setattr(results.transfer, "getv", _fake_transfer_getv)
+
+
+class TestResults:
+    """Test the 'results' module 'getresult_mmap' function."""
+
+    def test_stream_real_dataset(self, fake_transfer, tmp_path):
+        """Test 01: Test 'getresult_mmap' streams dataset attributes to memory-mapped files in chunks."""
+        field = np.random.rand(4, 5, 6, 10)
+        axes = {"x": np.linspace(0, 1, 4)[:, None], "y": np.linspace(0, 1, 5)[:, None], "z": np.linspace(0, 1, 6)[:, None]}
+        session = _FakeResultSession({"E": field}, axes=axes, parameters={"f": np.arange(10.0)[:, None]})
+
+        dataset = results.getresult_mmap(session, "monitor", "E", path=tmp_path, chunk_bytes=4 * 5 * 6 * 16 * 3)
+
+        assert dataset["Lumerical_dataset"] == {"attributes": ["E"], "parameters": [["f"]], "geometry": "rectilinear"}
+        assert isinstance(dataset["E"], np.memmap)
+        assert dataset["E"].flags.f_contiguous
+        np.testing.assert_array_equal(dataset["E"], field)
+        np.testing.assert_array_equal(dataset["x"], axes["x"])
+        np.testing.assert_array_equal(dataset["f"], np.arange(10.0)[:, None])
+        assert (tmp_path / "E.npy").exists()
+        assert max(session.chunk_sizes) <= 4 * 5 * 6 * 8 * 3
+        assert session.workspace == {}
+
+    def test_stream_complex_dataset(self, fake_transfer, tmp_path):
+        """Test 02: Test 'getresult_mmap' stores complex attributes."""
+        field = np.random.rand(3, 7) + 1j * np.random.rand(3, 7)
+        session = _FakeResultSession({"E": field, "E index": np.ones((3, 7))})
+
+        dataset = results.getresult_mmap(session, "monitor", "E", path=tmp_path, chunk_bytes=3 * 16 * 2)
+
+        assert "geometry" not in dataset["Lumerical_dataset"]
+        assert dataset["E"].dtype == complex
+        np.testing.assert_array_equal(dataset["E"], field)
+        np.testing.assert_array_equal(dataset["E index"], 1.0)
+        assert (tmp_path / "E_index.npy").exists()
+
+    def test_non_dataset_result(self, fake_transfer, tmp_path):
+        """Test 03: Test 'getresult_mmap' returns results that are not datasets unchanged."""
+        session = _FakeResultSession(np.array([[1.0, 2.0]]))
+
+        result = results.getresult_mmap(session, "monitor", "E", path=tmp_path)
+
+        np.testing.assert_array_equal(result, [[1.0, 2.0]])
+        assert not any(tmp_path.iterdir())
+
+    def test_missing_result(self, fake_transfer, tmp_path):
+        """Test 04: Test 'getresult_mmap' raises when the result cannot be found."""
+        session = _FakeResultSession({"E": np.ones((2, 2))})
+
+        with pytest.raises(lumapi.LumApiError, match="result not found"):
+            results.getresult_mmap(session, "monitor", "H", path=tmp_path)
+
+    @pytest.mark.skipif(not lumapi.InteropPaths.LUMERICALINSTALLDIR, reason="Requires a Lumerical installation")
+    def test_session_dataset(self, setup_fdtd, tmp_path):
+        """Test 05: Test 'getresult_mmap' against a Lumerical session."""
+        setup_fdtd.addfdtd(dimension="2D", x_span=1e-6, y_span=1e-6)
+        setup_fdtd.addpower(name="monitor", monitor_type="2D Z-normal", x_span=1e-6, y_span=1e-6)
+        setup_fdtd.run()
+
+        expected = setup_fdtd.getresult("monitor", "E")
+        dataset = results.getresult_mmap(setup_fdtd, "monitor", "E", path=tmp_path, chunk_bytes=2**16)
+
+        assert dataset["Lumerical_dataset"]["attributes"] == expected["Lumerical_dataset"]["attributes"]
+        np.testing.assert_allclose(np.reshape(dataset["E"], expected["E"].shape), expected["E"])
+        np.testing.assert_allclose(dataset["x"], expected["x"])
+
+    def test_to_arrow_rectilinear(self, mock_fdtd):
+        """Test 06: Test 'to_arrow' has one row per point and parameter value, over the attribute buffers."""
+        pytest.importorskip("pyarrow")
+        mock_fdtd.eval(
+            'dataset = rectilineardataset(1:4, 1:5, 1:6); dataset.addparameter("f", 1:2);'
+            'dataset.addattribute("E", randmatrix(4, 5, 6, 2), randmatrix(4, 5, 6, 2), randmatrix(4, 5, 6, 2));'
+            'dataset.addattribute("index", randmatrix(4, 5, 6, 2));'
+        )
+        dataset = transfer.getv(mock_fdtd, "dataset")
+
+        table = results.to_arrow(dataset)
+
+        assert table.column_names == ["x", "y", "z", "f", "E_0", "E_1", "E_2", "index"]
+        assert table.num_rows == 4 * 5 * 6 * 2
+        row = 2 + 4 * 3 + 20 * 4 + 120 * 1
+        assert table["x"][row].as_py() == 3.0 and table["y"][row].as_py() == 4.0 and table["z"][row].as_py() == 5.0
+        assert table["f"][row].as_py() == 2.0
+        assert table["E_1"][row].as_py() == dataset["E"][2, 3, 4, 1, 1]
+        np.testing.assert_array_equal(table["index"].to_numpy(), dataset["index"].ravel(order="F"))
+        buffer = np.frombuffer(table["index"].chunks[0].buffers()[1], dtype=np.float64)
+        assert np.shares_memory(buffer, dataset["index"])
+        assert table.schema.metadata[b"Lumerical_dataset"]
+
+    def test_to_arrow_matrix(self, mock_fdtd):
+        """Test 07: Test 'to_arrow' converts matrix datasets with complex attributes."""
+        pytest.importorskip("pyarrow")
+        mock_fdtd.eval(
+            'dataset = matrixdataset("S"); dataset.addparameter("lambda", [1; 2; 3], "f", [6; 5; 4]);'
+            'dataset.addattribute("S", [1, 2; 3, 4; 5, 6] + 1i);'
+        )
+
+        table = results.to_arrow(mock_fdtd.getv("dataset"))
+
+        assert table.column_names == ["lambda", "f", "S_0", "S_1"]
+        assert table["f"].to_pylist() == [6.0, 5.0, 4.0]
+        assert table["S_1"].to_pylist() == [[2.0, 1.0], [4.0, 1.0], [6.0, 1.0]]
+        with pytest.raises(lumapi.LumApiError, match="not a dataset"):
+            results.to_arrow({"S": np.ones(3)})
+
+    def test_to_arrow_cells(self, mock_fdtd):
+        """Test 08: Test 'to_arrow' converts the cell attributes of unstructured datasets."""
+        pytest.importorskip("pyarrow")
+        mock_fdtd.eval(
+            "x = linspace(0, 1, 13); C = zeros(12, 2); C(:, 1) = 1:12; C(:, 2) = 2:13;"
+            'dataset = unstructureddataset(x, x, x, C); dataset.addattribute("T", randmatrix(13));'
+            'dataset.addattribute("volume", randmatrix(12, 2));'
+        )
+        dataset = transfer.getv(mock_fdtd, "dataset")
+
+        points = results.to_arrow(dataset)
+        cells = results.to_arrow(dataset, cells=True)
+
+        assert points.column_names == ["x", "y", "z", "T"] and points.num_rows == 13
+        assert cells.column_names == ["volume_0", "volume_1"] and cells.num_rows == 12
+        np.testing.assert_array_equal(cells["volume_1"].to_numpy(), dataset["volume"][:, 1])
+
+    def test_getresult(self, mock_fdtd):
+        """Test 09: Test 'getresult' returns monitor results as dictionaries or Arrow tables."""
+        mock_fdtd.addfdtd()
+        mock_fdtd.addpower(name="monitor", frequency_points=5.0)
+        mock_fdtd.run()
+
+        transmission = results.getresult(mock_fdtd, "monitor", "T")
+        np.testing.assert_array_equal(transmission["T"], mock_fdtd.getresult("monitor", "T")["T"])
+        with pytest.raises(ValueError, match="Format must be one of"):
+            results.getresult(mock_fdtd, "monitor", "T", format="parquet")
+
+        pytest.importorskip("pyarrow")
+        table = results.getresult(mock_fdtd, "monitor", "T", format="arrow")
+        assert table.column_names == ["lambda", "f", "T"]
+        np.testing.assert_array_equal(table["T"].to_numpy(), transmission["T"])
+
+    def test_interdependent_parameters(self, mock_fdtd, tmp_path):
+        """Test 10: Test 'getresult_mmap' keeps interdependent parameters in one group."""
+        mock_fdtd.addfdtd()
+        mock_fdtd.addprofile(name="m")
+        mock_fdtd.addpower(name="p", frequency_points=5.0)
+        mock_fdtd.run()
+
+        field = results.getresult_mmap(mock_fdtd, "m", "E", path=tmp_path / "E")
+        transmission = results.getresult_mmap(mock_fdtd, "p", "T", path=tmp_path / "T")
+
+        expected = mock_fdtd.getresult("m", "E")
+        assert field["Lumerical_dataset"] == {"geometry": "rectilinear", "parameters": [["lambda", "f"]], "attributes": ["E"]}
+        assert transmission["Lumerical_dataset"] == {"parameters": [["lambda", "f"]], "attributes": ["T"]}
+        np.testing.assert_array_equal(np.reshape(field["E"], expected["E"].shape, order="F"), expected["E"])
+
+        pytest.importorskip("pyarrow")
+        table = results.to_arrow(field)
+        assert table.equals(results.to_arrow(expected))
+        assert results.to_arrow(transmission).column_names == ["lambda", "f", "T"]
+
+    def test_chunks_within_component(self, mock_fdtd, tmp_path, monkeypatch):
+        """Test 11: Test 'getresult_mmap' streams vector results in chunks smaller than one component."""
+        mock_fdtd.addfdtd()
+        mock_fdtd.addprofile(name="m")
+        mock_fdtd.run()
+        chunk_sizes = []
+        getv = transfer.getv
+
+        def recording_getv(session, varname, out=None):
+            value = getv(session, varname, out=out)
+            chunk_sizes.append(np.asarray(value).nbytes)
+            return value
+
+        monkeypatch.setattr(results.transfer, "getv", recording_getv)
+        field = results.getresult_mmap(mock_fdtd, "m", "E", path=tmp_path, chunk_bytes=4800)
+
+        expected = mock_fdtd.getresult("m", "E")["E"]
+        np.testing.assert_array_equal(np.reshape(field["E"], expected.shape, order="F"), expected)
+        assert field["E"].flags.f_contiguous
+        assert len(chunk_sizes) > 3 and max(chunk_sizes) <= 4800
+
+    def test_quoted_object_name(self, mock_fdtd, tmp_path):
+        """Test 12: Test 'getresult_mmap' reads results of objects whose names contain quotes."""
+        mock_fdtd.addfdtd()
+        mock_fdtd.addpower(name='it\'s "p"', frequency_points=5.0)
+        mock_fdtd.run()
+
+        transmission = results.getresult_mmap(mock_fdtd, 'it\'s "p"', "T", path=tmp_path)
+
+        np.testing.assert_array_equal(np.ravel(transmission["T"]), np.ravel(mock_fdtd.getresult('it\'s "p"', "T")["T"]))
+
+    def test_getresult_quoted_object_name(self, mock_fdtd):
+        """Test 13: Test 'getresult' reads results of objects whose names contain quotes."""
+        mock_fdtd.addfdtd()
+        mock_fdtd.addpower(name='it\'s "p"', frequency_points=5.0)
+        mock_fdtd.run()
+
+        transmission = results.getresult(mock_fdtd, 'it\'s "p"', "T")
+
+        np.testing.assert_array_equal(transmission["T"], mock_fdtd.getresult('it\'s "p"', "T")["T"])
@@ -0,0 +1,136 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'batch' function and 'ScriptBatch' object.
+
+- test 01: Test 'ScriptBatch' generates one script that refers to one transferred cell array
+- test 02: Test 'ScriptBatch' flushes with a single transfer and a single evaluation
+- test 03: Test 'ScriptBatch' reports the failing call in the raised LumApiError
+- test 04: Test 'ScriptBatch' discards recorded calls when the with block raises
+- test 05: Test 'ScriptBatch' applies batched calls in a Lumerical session
+- test 06: Test 'ScriptBatch' passes property names that contain quotes to the session
+"""
+
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core import batch
+
+
+class _RecordingSession:
+    """Session stand-in that records transfers and evaluated code."""
+
+    def __init__(self, result=None):
+        self.calls = []
+        self._result = result
+
+    def putv(self, name, value):
+        self.calls.append(("putv", name, value))
+
+    def eval(self, code):
+        self.calls.append(("eval", code))
+
+    def getv(self, name):
+        self.calls.append(("getv", name))
+        return self._result
+
+
+class TestScriptBatch:
+    """Test the 'batch' function and 'ScriptBatch' object."""
+
+    def test_generated_script(self):
+        """Test 01: Test 'ScriptBatch' generates one script that refers to one transferred cell array."""
+        b = batch(_RecordingSession())
+        b.addrect(name="pillar", x_span=1e-6)
+        b.setnamed("RCWA", "x span", 2e-6)
+
+        code = b.script()
+        vin = b._vin
+
+        assert len(b) == 2
+        assert "addrect;" in code
+        assert 'set("x span", %s{2});' % vin in code
+        assert 'set("x_span", %s{2});' % vin in code
+        assert "setnamed(%s{3}, %s{4}, %s{5});" % (vin, vin, vin) in code
+        assert b._values == ["pillar", 1e-6, "RCWA", "x span", 2e-6]
+
+    def test_single_round_trip(self):
+        """Test 02: Test 'ScriptBatch' flushes with a single transfer and a single evaluation."""
+        session = _RecordingSession(result=[1.0, "", 20.0, 0.0, 0.0])
+
+        with batch(session) as b:
+            for i in range(20):
+                b.setnamed("pillar", "radius", i * 1e-9)
+
+        kinds = [call[0] for call in session.calls]
+        assert kinds == ["putv", "eval", "getv", "eval"]
+        assert len(session.calls[0][2]) == 60
+        assert len(b) == 0
+
+    def test_error_reports_failed_call(self):
+        """Test 03: Test 'ScriptBatch' reports the failing call in the raised LumApiError."""
+        session = _RecordingSession(result=[0.0, "Error: prompt line 9: in set, the requested property was not found", 1.0, 0.0, 0.0])
+
+        with pytest.raises(lumapi.LumApiError) as ex_info:
+            with batch(session) as b:
+                b.addrect()
+                b.set("not a property", 1)
+
+        assert "in set, the requested property was not found" in str(ex_info.value)
+        assert "batched call 2: set" in str(ex_info.value)
+        assert "prompt line" not in str(ex_info.value)
+
+    def test_discard_on_exception(self):
+        """Test 04: Test 'ScriptBatch' discards recorded calls when the with block raises."""
+        session = _RecordingSession()
+
+        with pytest.raises(RuntimeError):
+            with batch(session) as b:
+                b.addrect()
+                raise RuntimeError("abort")
+
+        assert session.calls == []
+        assert len(b) == 0
+
+    @pytest.mark.skipif(not lumapi.InteropPaths.LUMERICALINSTALLDIR, reason="Requires a Lumerical installation")
+    def test_batch_in_session(self, setup_fdtd):
+        """Test 05: Test 'ScriptBatch' applies batched calls in a Lumerical session."""
+        setup_fdtd.switchtolayout()
+        setup_fdtd.deleteall()
+
+        with batch(setup_fdtd) as b:
+            b.addrect(name="batched_rect", x_span=2e-6)
+            b.setnamed("batched_rect", "y span", 3e-6)
+
+        assert setup_fdtd.getnamed("batched_rect", "x span") == pytest.approx(2e-6)
+        assert setup_fdtd.getnamed("batched_rect", "y span") == pytest.approx(3e-6)
+
+    def test_quoted_property_names(self, mock_fdtd):
+        """Test 06: Test 'ScriptBatch' passes property names that contain quotes to the session."""
+        with pytest.raises(lumapi.LumApiError) as ex_info:
+            with batch(mock_fdtd) as b:
+                b.addrect(name='rect "a"', properties={"x span": 2e-6})
+                b.addrect(properties={'it\'s "quoted"': 1})
+
+        assert "property 'it's \"quoted\"' was not found" in ex_info.value.args[0]
+        assert "batched call 2: addrect" in str(ex_info.value)
+        assert mock_fdtd.getnamed('rect "a"', "x span") == pytest.approx(2e-6)
@@ -0,0 +1,107 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'SessionPool' object.
+
+- test 01: Test 'SessionPool' pre-starts sessions and reuses them across leases
+- test 02: Test 'SessionPool' resets sessions when they are returned
+- test 03: Test 'SessionPool' replaces sessions that fail the health check
+- test 04: Test 'SessionPool' discards sessions whose connection is lost inside a lease
+- test 05: Test 'SessionPool' times out when all sessions are leased
+- test 06: Test 'SessionPool' closes idle and returned sessions
+- test 07: Test 'SessionPool' rejects unknown products
+"""
+
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core import SessionPool
+
+
+class TestSessionPool:
+    """Test the 'SessionPool' object."""
+
+    def test_prestart_and_reuse(self, fake_fdtd):
+        """Test 01: Test 'SessionPool' pre-starts sessions and reuses them across leases."""
+        with SessionPool("fdtd", size=2) as pool:
+            assert len(fake_fdtd.started) == 2
+            for _ in range(5):
+                with pool.session() as session:
+                    assert session in fake_fdtd.started
+
+        assert len(fake_fdtd.started) == 2
+
+    def test_reset_on_release(self, fake_fdtd):
+        """Test 02: Test 'SessionPool' resets sessions when they are returned."""
+        with SessionPool("fdtd", reset_script="deleteall;") as pool:
+            with pool.session() as session:
+                pass
+
+        assert session.scripts == ["deleteall;"]
+
+    def test_health_check_replaces_dead_session(self, fake_fdtd):
+        """Test 03: Test 'SessionPool' replaces sessions that fail the health check."""
+        with SessionPool("fdtd", size=1) as pool:
+            fake_fdtd.started[0].alive = False
+            with pool.session() as session:
+                assert session.alive
+
+        assert len(fake_fdtd.started) == 2
+
+    def test_discard_on_lost_connection(self, fake_fdtd):
+        """Test 04: Test 'SessionPool' discards sessions whose connection is lost inside a lease."""
+        with SessionPool("fdtd", size=1) as pool:
+            with pytest.raises(lumapi.LumApiError):
+                with pool.session() as session:
+                    session.alive = False
+                    session.eval("run;")
+
+            assert len(pool) == 0
+            with pool.session() as replacement:
+                assert replacement is not session
+
+    def test_timeout_when_exhausted(self, fake_fdtd):
+        """Test 05: Test 'SessionPool' times out when all sessions are leased."""
+        with SessionPool("fdtd", size=1) as pool:
+            with pool.session():
+                with pytest.raises(TimeoutError):
+                    pool.acquire(timeout=0.01)
+
+    def test_close(self, fake_fdtd):
+        """Test 06: Test 'SessionPool' closes idle and returned sessions."""
+        pool = SessionPool("fdtd", size=2)
+        leased = pool.acquire()
+        pool.close()
+
+        assert pool.closed
+        assert [s.alive for s in fake_fdtd.started].count(False) == 1
+
+        pool.release(leased)
+
+        assert not leased.alive
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.acquire()
+
+    def test_unknown_product(self):
+        """Test 07: Test 'SessionPool' rejects unknown products."""
+        with pytest.raises(lumapi.LumApiError, match="is not available"):
+            SessionPool("optics")
@@ -0,0 +1,362 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'transfer' module functions.
+
+- test 01: Test 'putv' and 'getv' a C-ordered real 2D array
+- test 02: Test 'putv' and 'getv' an integer 3D array
+- test 03: Test 'putv' and 'getv' a complex array
+- test 04: Test 'getv' fills and returns a caller-provided output array
+- test 05: Test 'getv' raises on an output array with the wrong shape
+- test 06: Test 'getv' raises when reading a non-matrix into an output array
+- test 07: Test 'putv' and 'getv' against a Lumerical session
+- test 08: Test 'getv_slice' returns the same block as NumPy indexing
+- test 09: Test 'getv_slice' indexes a dataset attribute
+- test 10: Test 'getv_slice' rejects indices that are out of bounds
+- test 11: Test 'iter_chunks' splits a variable along an axis
+- test 12: Test 'getv_slice' and 'iter_chunks' against a Lumerical session
+- test 13: Test 'getv' translates datasets like the 'getv' method of a session
+- test 14: Test 'putv' and 'getv' round-trip datasets
+- test 15: Test 'putv' rejects attributes that do not match the dataset metadata
+- test 16: Test 'getv_slice' indexes dataset attributes whose names contain quotes
+"""
+
+from ctypes import POINTER, c_double, c_ulonglong, cast, memmove
+import re
+
+import numpy as np
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core import transfer
+
+
+class _FakeMatrixInteropApi:
+    """Stand-in for the interop library that stores variables in memory.
+
+    Complex matrices are stored interleaved, which is enough to check that data
+    round-trips through the pack and unpack entry points.
+    """
+
+    def __init__(self):
+        self.variables = {}
+        self._buffers = []
+
+    def appOpened(self, handle):  # noqa: N802
+        return True
+
+    def _allocate(self, mode, dim, dims):
+        shape = [int(dims[i]) for i in range(dim.value)]
+        data = np.zeros(max(int(np.prod(shape)), 1) * (1 if mode == 1 else 2))
+        dimlst = (c_ulonglong * len(shape))(*shape)
+        value = lumapi.Any()
+        value.type = 2
+        value.val.matrixVal.mode = mode
+        value.val.matrixVal.dim = len(shape)
+        value.val.matrixVal.dimlst = cast(dimlst, POINTER(c_ulonglong))
+        value.val.matrixVal.data = data.ctypes.data_as(POINTER(c_double))
+        self._buffers.extend([data, dimlst, value])
+        return POINTER(lumapi.Any)(value)
+
+    def allocateLumMatrix(self, dim, dims):  # noqa: N802
+        return self._allocate(1, dim, dims)
+
+    def allocateComplexLumMatrix(self, dim, dims):  # noqa: N802
+        return self._allocate(2, dim, dims)
+
+    def allocateLumDouble(self, value):  # noqa: N802
+        any_value = lumapi.Any()
+        any_value.type = 1
+        any_value.val.doubleVal = value
+        self._buffers.append(any_value)
+        return POINTER(lumapi.Any)(any_value)
+
+    def memmovePackComplexLumMatrix(self, dest, src, n):  # noqa: N802
+        memmove(dest, src, 16 * n)
+
+    def memmoveUnpackComplexLumMatrix(self, dest, src, n):  # noqa: N802
+        memmove(dest, src, 16 * n)
+
+    def appPutVar(self, handle, name, value):  # noqa: N802
+        self.variables[name] = value
+        return 0
+
+    def appGetVar(self, handle, name, ref):  # noqa: N802
+        if name not in self.variables:
+            return -1
+        ref._obj.contents = self.variables[name].contents
+        return 0
+
+    def freeAny(self, value):  # noqa: N802
+        pass
+
+
+class _FakeSession:
+    """Session stand-in backed by ``_FakeMatrixInteropApi``."""
+
+    def __init__(self):
+        self.iapi = _FakeMatrixInteropApi()
+        self.handle = lumapi.LumApiSession(self.iapi, object())
+
+    def putv(self, varname, value):
+        lumapi.putDouble(self.handle, varname, value)
+
+
+class _FakeScriptSession(_FakeSession):
+    """Session stand-in that also evaluates the indexing scripts generated by 'getv_slice'."""
+
+    def __init__(self, **variables):
+        super().__init__()
+        self.variables = variables
+        self.blocks = []
+
+    @staticmethod
+    def _script_index(index):
+        items = []
+        for part in index.split(", "):
+            bounds = [int(n) for n in part.split(":") if n]
+            if not bounds:
+                items.append(slice(None))
+            elif len(bounds) == 1:
+                items.append(slice(bounds[0] - 1, bounds[0]))
+            elif len(bounds) == 2:
+                items.append(slice(bounds[0] - 1, bounds[1]))
+            else:
+                items.append(slice(bounds[0] - 1, bounds[2], bounds[1]))
+        return tuple(items)
+
+    def eval(self, code):
+        for statement in code.split("\n"):
+            if statement.startswith("clear("):
+                for name in re.findall(r"\w+", statement[len("clear(") :]):
+                    self.variables.pop(name)
+                continue
+            name, expression = statement.rstrip(";").split(" = ")
+            size = re.fullmatch(r"size\((\w+)\)", expression)
+            attribute = re.fullmatch(r'getattribute\((\w+), "(\w+)"\)', expression)
+            if size:
+                value = np.array([self.variables[size.group(1)].shape], dtype=float)
+            elif attribute:
+                value = self.variables[attribute.group(1)][attribute.group(2)]
+            else:
+                matrix, index = re.fullmatch(r"(\w+)\((.*)\)", expression).groups()
+                value = self.variables[matrix][self._script_index(index)]
+                while value.ndim > 2 and value.shape[-1] == 1:
+                    value = value[..., 0]
+                self.blocks.append(value.shape)
+            self.variables[name] = value
+            transfer.putv(self, name, value)
+
+
+_DATASET_SCRIPTS = {
+    "matrix": 'dataset = matrixdataset("T"); dataset.addparameter("f", 1:4); dataset.addattribute("T", randmatrix(4));'
+    'dataset.addattribute("S", randmatrix(4, 3) + 1i * randmatrix(4, 3));',
+    "rectilinear": 'dataset = rectilineardataset(1:4, 1:5, 1:6); dataset.addparameter("f", 1:2);'
+    'dataset.addattribute("E", randmatrix(4, 5, 6, 2), randmatrix(4, 5, 6, 2), randmatrix(4, 5, 6, 2));'
+    'dataset.addattribute("index", randmatrix(4, 5, 6, 2) + 1i);',
+    "unstructured": "x = linspace(0, 1, 13); C = zeros(12, 2); C(:, 1) = 1:12; C(:, 2) = 2:13;"
+    'dataset = unstructureddataset(x, x, x, C); dataset.addattribute("T", randmatrix(13));'
+    'dataset.addattribute("E", randmatrix(13, 3)); dataset.addattribute("volume", randmatrix(12));',
+}
+"""Scripts that create a dataset of each geometry with scalar, vector, real, and complex attributes."""
+
+
+class TestTransfer:
+    """Test the 'transfer' module functions."""
+
+    def test_real_c_ordered_array(self):
+        """Test 01: Test 'putv' and 'getv' a C-ordered real 2D array."""
+        session = _FakeSession()
+        value = np.arange(12.0).reshape(3, 4)
+
+        transfer.putv(session, "A", value)
+        result = transfer.getv(session, "A")
+
+        assert result.flags.f_contiguous
+        np.testing.assert_array_equal(result, value)
+
+    def test_integer_array(self):
+        """Test 02: Test 'putv' and 'getv' an integer 3D array."""
+        session = _FakeSession()
+        value = np.arange(24).reshape(2, 3, 4)[:, ::-1, :]
+
+        transfer.putv(session, "B", value)
+        result = transfer.getv(session, "B")
+
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, value)
+
+    def test_complex_array(self):
+        """Test 03: Test 'putv' and 'getv' a complex array."""
+        session = _FakeSession()
+        value = (np.arange(6) + 1j * np.arange(6, 12)).reshape(2, 3)
+
+        transfer.putv(session, "C", value)
+
+        np.testing.assert_array_equal(transfer.getv(session, "C"), value)
+
+    def test_getv_out(self):
+        """Test 04: Test 'getv' fills and returns a caller-provided output array."""
+        session = _FakeSession()
+        out = np.empty((3, 4), dtype=complex, order="F")
+        for scale in (1.0, 2.0):
+            transfer.putv(session, "D", scale * np.ones((3, 4)))
+            result = transfer.getv(session, "D", out=out)
+
+            assert result is out
+            np.testing.assert_array_equal(out, scale)
+
+    def test_getv_out_wrong_shape(self):
+        """Test 05: Test 'getv' raises on an output array with the wrong shape."""
+        session = _FakeSession()
+        transfer.putv(session, "E", np.ones((3, 4)))
+
+        with pytest.raises(ValueError, match="shape"):
+            transfer.getv(session, "E", out=np.empty((4, 3)))
+
+    def test_getv_out_non_matrix(self):
+        """Test 06: Test 'getv' raises when reading a non-matrix into an output array."""
+        session = _FakeSession()
+        transfer.putv(session, "F", 3.5)
+
+        assert transfer.getv(session, "F") == 3.5
+        with pytest.raises(lumapi.LumApiError, match="is not a matrix"):
+            transfer.getv(session, "F", out=np.empty(1))
+
+    @pytest.mark.skipif(not lumapi.InteropPaths.LUMERICALINSTALLDIR, reason="Requires a Lumerical installation")
+    def test_session_round_trip(self, setup_fdtd):
+        """Test 07: Test 'putv' and 'getv' against a Lumerical session."""
+        real_value = np.random.rand(5, 6, 7)
+        complex_value = real_value + 1j * np.random.rand(5, 6, 7)
+
+        transfer.putv(setup_fdtd, "real_value", real_value)
+        transfer.putv(setup_fdtd, "complex_value", complex_value)
+
+        np.testing.assert_array_equal(transfer.getv(setup_fdtd, "real_value"), real_value)
+        np.testing.assert_array_equal(setup_fdtd.getv("complex_value"), complex_value)
+        out = np.empty((5, 6, 7), dtype=complex, order="F")
+        np.testing.assert_array_equal(transfer.getv(setup_fdtd, "complex_value", out=out), complex_value)
+
+    def test_getv_slice(self):
+        """Test 08: Test 'getv_slice' returns the same block as NumPy indexing."""
+        value = np.random.rand(4, 5, 6)
+        session = _FakeScriptSession(E=value)
+
+        for index in (np.s_[:, :, 3], np.s_[1:3, ::2, -1], np.s_[2], np.s_[..., 1:4], np.s_[-1, 0, :]):
+            np.testing.assert_array_equal(transfer.getv_slice(session, "E", index), value[index])
+
+        assert list(session.variables) == ["E"]
+
+    def test_getv_slice_attribute(self):
+        """Test 09: Test 'getv_slice' indexes a dataset attribute."""
+        value = np.random.rand(3, 4, 5) + 1j * np.random.rand(3, 4, 5)
+        session = _FakeScriptSession(E_data={"E": value})
+
+        result = transfer.getv_slice(session, "E_data", np.s_[:, 1, :], attribute="E")
+
+        np.testing.assert_array_equal(result, value[:, 1, :])
+        assert list(session.variables) == ["E_data"]
+
+    def test_getv_slice_out_of_bounds(self):
+        """Test 10: Test 'getv_slice' rejects indices that are out of bounds."""
+        session = _FakeScriptSession(E=np.ones((3, 4)))
+
+        with pytest.raises(IndexError, match="out of bounds"):
+            transfer.getv_slice(session, "E", np.s_[:, 4])
+        with pytest.raises(IndexError, match="Too many indices"):
+            transfer.getv_slice(session, "E", np.s_[0, 0, 0])
+        assert list(session.variables) == ["E"]
+
+    def test_iter_chunks(self):
+        """Test 11: Test 'iter_chunks' splits a variable along an axis."""
+        value = np.random.rand(4, 5, 7)
+        session = _FakeScriptSession(E=value)
+
+        chunks = list(transfer.iter_chunks(session, "E", axis=2, chunk=3))
+
+        assert [chunk.shape for chunk in chunks] == [(4, 5, 3), (4, 5, 3), (4, 5, 1)]
+        assert session.blocks == [(4, 5, 3), (4, 5, 3), (4, 5)]
+        np.testing.assert_array_equal(np.concatenate(chunks, axis=2), value)
+        np.testing.assert_array_equal(np.concatenate(list(transfer.iter_chunks(session, "E", axis=0)), axis=0), value)
+        assert list(session.variables) == ["E"]
+
+    @pytest.mark.skipif(not lumapi.InteropPaths.LUMERICALINSTALLDIR, reason="Requires a Lumerical installation")
+    def test_session_slices(self, setup_fdtd):
+        """Test 12: Test 'getv_slice' and 'iter_chunks' against a Lumerical session."""
+        value = np.random.rand(4, 5, 6)
+        setup_fdtd.putv("value", value)
+        setup_fdtd.eval("dataset = rectilineardataset(1:4, 1:5, 1:6);")
+        setup_fdtd.eval('dataset.addattribute("value", value);')
+
+        np.testing.assert_array_equal(transfer.getv_slice(setup_fdtd, "value", np.s_[:, 2, 1:4]), value[:, 2, 1:4])
+        np.testing.assert_array_equal(transfer.getv_slice(setup_fdtd, "dataset", np.s_[..., 5], attribute="value"), value[..., 5])
+        np.testing.assert_array_equal(np.concatenate(list(transfer.iter_chunks(setup_fdtd, "value", chunk=4)), axis=-1), value)
+
+    @pytest.mark.parametrize("geometry", list(_DATASET_SCRIPTS))
+    def test_getv_dataset(self, mock_fdtd, geometry):
+        """Test 13: Test 'getv' translates datasets like the 'getv' method of a session."""
+        mock_fdtd.eval(_DATASET_SCRIPTS[geometry])
+
+        expected = mock_fdtd.getv("dataset")
+        dataset = transfer.getv(mock_fdtd, "dataset")
+
+        assert dataset.keys() == expected.keys()
+        assert dataset["Lumerical_dataset"] == expected["Lumerical_dataset"]
+        attributes = dataset["Lumerical_dataset"]["attributes"] + dataset["Lumerical_dataset"].get("cell_attributes", [])
+        for name in attributes:
+            assert dataset[name].shape == expected[name].shape
+            np.testing.assert_array_equal(dataset[name], expected[name])
+        # All attributes are views of one buffer.
+        buffer = dataset[attributes[0]]
+        while buffer.base is not None:
+            buffer = buffer.base
+        assert all(np.shares_memory(dataset[name], buffer) for name in attributes)
+
+    @pytest.mark.parametrize("geometry", list(_DATASET_SCRIPTS))
+    def test_putv_dataset(self, mock_fdtd, geometry):
+        """Test 14: Test 'putv' and 'getv' round-trip datasets."""
+        mock_fdtd.eval(_DATASET_SCRIPTS[geometry])
+        dataset = mock_fdtd.getv("dataset")
+
+        transfer.putv(mock_fdtd, "copy", dataset)
+
+        result = mock_fdtd.getv("copy")
+        assert result.keys() == dataset.keys()
+        for name, value in dataset.items():
+            np.testing.assert_array_equal(result[name], value)
+
+    def test_putv_dataset_mismatch(self, mock_fdtd):
+        """Test 15: Test 'putv' rejects attributes that do not match the dataset metadata."""
+        mock_fdtd.eval(_DATASET_SCRIPTS["rectilinear"])
+        dataset = mock_fdtd.getv("dataset")
+
+        with pytest.raises(lumapi.LumApiError, match="attribute data shape"):
+            transfer.putv(mock_fdtd, "copy", dict(dataset, E=np.ones(3)))
+        with pytest.raises(lumapi.LumApiError, match="available attributes"):
+            transfer.putv(mock_fdtd, "copy", {key: value for key, value in dataset.items() if key != "E"})
+
+    def test_getv_slice_quoted_attribute(self, mock_fdtd):
+        """Test 16: Test 'getv_slice' indexes dataset attributes whose names contain quotes."""
+        mock_fdtd.eval('dataset = matrixdataset("T"); dataset.addparameter("f", 1:4); dataset.addattribute("it\'s " + \'"T"\', randmatrix(4, 3));')
+        value = mock_fdtd.getv("dataset")['it\'s "T"']
+
+        np.testing.assert_array_equal(transfer.getv_slice(mock_fdtd, "dataset", np.s_[1:3, 2], attribute='it\'s "T"'), value[1:3, 2])
@@ -0,0 +1,294 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the 'tree' module.
+
+- test 01: Test 'snapshot' returns columns for IDs, types, and properties in one round-trip
+- test 02: Test 'snapshot' marks missing properties
+- test 03: Test 'snapshot' raises when the tree cannot be read
+- test 04: Test 'snapshot' against a Lumerical session
+- test 05: Test 'add_many' adds objects from table columns in one round-trip
+- test 06: Test 'add_many' accepts structured arrays and reports the failing object
+- test 07: Test 'add_many' rejects invalid types and tables
+- test 08: Test 'add_many' against a Lumerical session
+- test 09: Test 'snapshot' numbers objects with the same name and visits groups by type
+- test 10: Test 'snapshot' keeps the values of a property cache
+- test 11: Test 'add_many' passes property names that contain quotes to the session
+- test 12: Test 'snapshot' passes root and property names that contain quotes to the session
+"""
+
+import re
+
+import numpy as np
+import pytest
+
+import ansys.api.lumerical.lumapi as lumapi
+from ansys.lumerical.core import caching, tree
+
+
+class _FakeScriptInteropApi:
+    """Stand-in for the interop library that forwards scripts to a fake session."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def appOpened(self, handle):  # noqa: N802
+        return True
+
+    def appEvalScript(self, handle, code):  # noqa: N802
+        self.session.evaluate(code.decode())
+        return 0
+
+
+class _FakeTreeSession:
+    """Session stand-in that answers the 'snapshot' script from a dictionary of objects."""
+
+    def __init__(self, objects, error=""):
+        self.handle = lumapi.LumApiSession(_FakeScriptInteropApi(self), object())
+        self.objects = objects
+        self.error = error
+        self.workspace = {}
+        self.scripts = []
+
+    def evaluate(self, code):
+        self.scripts.append(code)
+        if code.startswith("clear("):
+            for name in re.findall(r"\w+", code[len("clear(") :]):
+                self.workspace.pop(name, None)
+            return
+        vname = code.split(" ", 1)[0]
+        properties = re.findall(r'try\{ \w+\{\w+\} = get\("(.+)", \w+\)', code)
+        columns = [[self.objects[id].get(name, tree._NULL) for id in self.objects] for name in properties]
+        if self.objects and not self.error:
+            types = [properties["type"] for properties in self.objects.values()]
+            self.workspace[vname] = [list(self.objects), types, columns or [], ""]
+        else:
+            self.workspace[vname] = [0.0, 0.0, 0.0, self.error]
+
+    def getv(self, varname):
+        return self.workspace[varname]
+
+
+class _FakeBuildSession:
+    """Session stand-in that runs the 'add_many' script on a dictionary of objects."""
+
+    def __init__(self):
+        self.objects = []
+        self.workspace = {}
+        self.calls = []
+
+    def putv(self, varname, value):
+        self.calls.append("putv")
+        self.workspace[varname] = value
+
+    def eval(self, code):
+        self.calls.append("eval")
+        if code.startswith("clear("):
+            for name in re.findall(r"\w+", code[len("clear(") :]):
+                self.workspace.pop(name)
+            return
+        vname = code.split(" ", 1)[0]
+        kind = re.search(r"^    add(\w+);$", code, re.MULTILINE).group(1)
+        columns = dict(re.findall(r"(\w+) = \w+_in\{(\d+)\};", code))
+        setters = re.findall(r'set\("(.+)", (\w+)[{(]', code)
+        group = re.search(r"addtogroup\((\w+)\{", code)
+        count = int(re.search(r"matrix\((\d+)\)", code).group(1))
+        ids, numbers, error, index = [0.0] * count, np.zeros((count, 1)), "", 0.0
+        for i in range(count):
+            index = float(i + 1)
+            row = {name: self.workspace[vname + "_in"][int(columns[column]) - 1][i] for name, column in setters}
+            if "bad" in row.get("material", ""):
+                error = "Error: prompt line 9: in set, the material could not be found"
+                break
+            parent = self.workspace[vname + "_in"][int(columns[group.group(1)]) - 1][i] if group else ""
+            scope = "::model::" + parent if parent else "::model"
+            row["id"] = "%s::%s" % (scope, row.get("name", kind))
+            self.objects.append(row)
+            ids[i] = row["id"]
+            numbers[i] = [obj["id"] for obj in self.objects].count(row["id"])
+        self.workspace.update({vname: [ids, numbers, error, index], vname + "_i": 0, vname + "_ids": 0, vname + "_numbers": 0})
+        self.workspace.update({name: 0 for name in columns})
+
+    def getv(self, varname):
+        self.calls.append("getv")
+        return self.workspace[varname]
+
+
+class TestTree:
+    """Test the 'tree' module."""
+
+    def test_snapshot(self):
+        """Test 01: Test 'snapshot' returns columns for IDs, types, and properties in one round-trip."""
+        objects = {
+            "::model::lattice": {"type": "Structure Group", "x": 0.0},
+            "::model::lattice::sphere1": {"type": "Sphere", "x": 1e-6, "material": "Si (Silicon) - Palik"},
+            "::model::lattice::sphere2": {"type": "Sphere", "x": 2e-6, "material": "Si (Silicon) - Palik"},
+        }
+        session = _FakeTreeSession(objects)
+
+        result = tree.snapshot(session, "::model", ["x", "material", "x"])
+
+        assert list(result) == ["id", "type", "x", "material"]
+        assert list(result["id"]) == [id + "#1" for id in objects]
+        assert list(result["type"]) == ["Structure Group", "Sphere", "Sphere"]
+        assert result["x"].dtype == float
+        np.testing.assert_array_equal(result["x"], [0.0, 1e-6, 2e-6])
+        assert len(session.scripts) == 2
+        assert session.workspace == {}
+
+    def test_snapshot_missing_properties(self):
+        """Test 02: Test 'snapshot' marks missing properties."""
+        objects = {"::model::group": {"type": "Structure Group"}, "::model::circle": {"type": "Circle", "radius": 1e-7, "material": "etch"}}
+        session = _FakeTreeSession(objects)
+
+        result = tree.snapshot(session, properties=["radius", "material"])
+
+        np.testing.assert_array_equal(result["radius"], [np.nan, 1e-7])
+        assert result["material"].dtype == object
+        assert list(result["material"]) == [None, "etch"]
+
+        empty = tree.snapshot(_FakeTreeSession({}), properties=["radius"])
+        assert empty["id"].shape == (0,)
+        assert empty["radius"].shape == (0,)
+
+    def test_snapshot_error(self):
+        """Test 03: Test 'snapshot' raises when the tree cannot be read."""
+        session = _FakeTreeSession({}, error="Error: prompt line 12: in groupscope, the group could not be found")
+
+        with pytest.raises(lumapi.LumApiError, match="in groupscope, the group could not be found"):
+            tree.snapshot(session, "::model::missing")
+        assert session.workspace == {}
+
+    @pytest.mark.skipif(not lumapi.InteropPaths.LUMERICALINSTALLDIR, reason="Requires a Lumerical installation")
+    def test_session_snapshot(self, setup_fdtd_with_groups):
+        """Test 04: Test 'snapshot' against a Lumerical session."""
+        setup_fdtd_with_groups.select("assembly_grp")
+
+        result = tree.snapshot(setup_fdtd_with_groups, "::model", ["x", "radius"])
+
+        assert "::model::assembly_grp::circle#1" in result["id"]
+        index = list(result["id"]).index("::model::assembly_grp::circle#1")
+        assert result["type"][index] == "Circle"
+        assert result["radius"][index] > 0
+        assert setup_fdtd_with_groups.getid() == "::model::assembly_grp"
+
+    def test_add_many(self):
+        """Test 05: Test 'add_many' adds objects from table columns in one round-trip."""
+        session = _FakeBuildSession()
+        table = {"x": np.arange(4) * 1e-6, "radius": np.full(4, 1e-7), "z_max": 1e-6, "material": "etch", "group": ["", "", "lens", "lens"]}
+
+        ids = tree.add_many(session, "circle", table)
+
+        assert [(id.name, id.index) for id in ids] == [
+            ("::model::circle", 1),
+            ("::model::circle", 2),
+            ("::model::lens::circle", 1),
+            ("::model::lens::circle", 2),
+        ]
+        assert session.objects[1] == {"x": 1e-6, "radius": 1e-7, "z max": 1e-6, "material": "etch", "id": "::model::circle"}
+        assert session.calls == ["putv", "eval", "getv", "eval"]
+        assert session.workspace == {}
+        assert tree.add_many(session, "circle", {"x": []}) == []
+
+    def test_add_many_structured_array(self):
+        """Test 06: Test 'add_many' accepts structured arrays and reports the failing object."""
+        session = _FakeBuildSession()
+        table = np.array([(0.0, "Si"), (1.0, "bad"), (2.0, "Si")], dtype=[("x", float), ("material", "U8")])
+
+        with pytest.raises(lumapi.LumApiError, match=r"in set, the material could not be found \(object 2\)"):
+            tree.add_many(session, "rect", table)
+        assert len(session.objects) == 1
+        assert session.workspace == {}
+
+    def test_add_many_invalid(self):
+        """Test 07: Test 'add_many' rejects invalid types and tables."""
+        session = _FakeBuildSession()
+
+        with pytest.raises(ValueError, match="not a valid object type"):
+            tree.add_many(session, "circle; deleteall", {"x": [0.0]})
+        with pytest.raises(ValueError, match="same length"):
+            tree.add_many(session, "circle", {"x": [0.0, 1.0], "y": [0.0, 1.0, 2.0]})
+        with pytest.raises(ValueError, match="one-dimensional"):
+            tree.add_many(session, "circle", {"x": np.zeros((2, 2))})
+        assert session.calls == []
+
+    @pytest.mark.skipif(not lumapi.InteropPaths.LUMERICALINSTALLDIR, reason="Requires a Lumerical installation")
+    def test_session_add_many(self, setup_fdtd):
+        """Test 08: Test 'add_many' against a Lumerical session."""
+        setup_fdtd.addstructuregroup(name="pillars")
+
+        ids = tree.add_many(setup_fdtd, "circle", {"name": "pillar", "x": [0.0, 1e-6], "radius": 1e-7, "material": "etch", "group": "pillars"})
+
+        assert [(id.name, id.index) for id in ids] == [("::model::pillars::pillar", 1), ("::model::pillars::pillar", 2)]
+        assert setup_fdtd.getnamed("::model::pillars::pillar", "radius", 2) == 1e-7
+
+    def test_snapshot_duplicate_names(self, mock_fdtd):
+        """Test 09: Test 'snapshot' numbers objects with the same name and visits groups by type."""
+        mock_fdtd.addstructuregroup(name="pillars")
+        for radius in (1e-7, 2e-7):
+            mock_fdtd.addcircle(name="pillar", radius=radius)
+            mock_fdtd.addtogroup("pillars")
+        mock_fdtd.addrect(name="groups")
+        mock_fdtd.select("::model::pillars")
+
+        result = tree.snapshot(mock_fdtd, properties=["radius"])
+
+        assert list(result["id"]) == ["::model::pillars#1", "::model::groups#1", "::model::pillars::pillar#1", "::model::pillars::pillar#2"]
+        np.testing.assert_array_equal(result["radius"], [np.nan, np.nan, 1e-7, 2e-7])
+        assert [mock_fdtd.getObjectById(id).radius for id in result["id"][2:]] == [1e-7, 2e-7]
+        assert mock_fdtd.getid() == "::model::pillars"
+
+    def test_snapshot_property_cache(self, mock_fdtd, monkeypatch):
+        """Test 10: Test 'snapshot' keeps the values of a property cache."""
+        caching.enable_property_cache(mock_fdtd)
+        mock_fdtd.addcircle(name="pillar", radius=1e-7)
+        pillar = mock_fdtd.getObjectById("::model::pillar")
+        assert pillar.radius == 1e-7
+        getnamed_calls = []
+        getnamed = mock_fdtd.getnamed
+        monkeypatch.setattr(mock_fdtd, "getnamed", lambda *args: getnamed_calls.append(args) or getnamed(*args))
+
+        tree.snapshot(mock_fdtd, properties=["radius"])
+
+        assert pillar.radius == 1e-7
+        assert getnamed_calls == []
+
+    def test_add_many_quoted_property_names(self, mock_fdtd):
+        """Test 11: Test 'add_many' passes property names that contain quotes to the session."""
+        ids = tree.add_many(mock_fdtd, "rect", {"name": 'rect "a"', "x_span": [1e-6, 2e-6]})
+
+        assert [(id.name, id.index) for id in ids] == [('::model::rect "a"', 1), ('::model::rect "a"', 2)]
+        with pytest.raises(lumapi.LumApiError) as ex_info:
+            tree.add_many(mock_fdtd, "rect", {'it\'s "quoted"': [1.0]})
+        assert "property 'it's \"quoted\"' was not found" in ex_info.value.args[0]
+
+    def test_snapshot_quoted_names(self, mock_fdtd):
+        """Test 12: Test 'snapshot' passes root and property names that contain quotes to the session."""
+        mock_fdtd.addstructuregroup(name='lens "a"')
+        mock_fdtd.addcircle(name="it's", radius=1e-7)
+        mock_fdtd.addtogroup('lens "a"')
+
+        result = tree.snapshot(mock_fdtd, '::model::lens "a"', ["radius", 'x "span"'])
+
+        assert list(result["id"]) == ['::model::lens "a"::it\'s#1']
+        assert list(result["radius"]) == [1e-7]
+        assert np.isnan(result['x "span"']).all()
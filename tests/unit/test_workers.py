@@ -0,0 +1,110 @@
+# Copyright (C) 2025 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test the 'workers' module.
+
+- test 01: Test 'capture_state' records the installation and the bundled lumopt2 package
+- test 02: Test a process with an exported state bootstraps without searching for the installation
+- test 03: Test 'initialize' configures spawned pool workers from the state of the parent
+- test 04: Test 'preload' configures the workers of forkserver and spawn pools without changing the environment
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ansys.lumerical.core import workers
+
+
+def _run(code, **environment):
+    """Run Python code in a new interpreter and return its standard output."""
+    environment = dict({name: value for name, value in os.environ.items() if name != workers.STATE_VARIABLE}, **environment)
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, env=environment).stdout.split()
+
+
+@pytest.fixture
+def install_dir(tmp_path):
+    """Create an installation with a bundled lumopt2 package."""
+    lumopt2_dir = tmp_path / "v252" / "api" / "python" / "lumopt2"
+    lumopt2_dir.mkdir(parents=True)
+    (lumopt2_dir / "__init__.py").write_text("")
+    return tmp_path / "v252"
+
+
+class TestWorkers:
+    """Test the 'workers' module."""
+
+    def test_capture_state(self, install_dir):
+        """Test 01: Test 'capture_state' records the installation and the bundled lumopt2 package."""
+        state = workers.capture_state(str(install_dir))
+
+        assert state["install_dir"] == str(install_dir)
+        assert state["lumopt2_dir"] == str((install_dir / "api" / "python" / "lumopt2").resolve())
+        assert state["lumapi_alias"] is True
+        assert json.loads(json.dumps(state)) == state
+
+    def test_exported_state(self, install_dir):
+        """Test 02: Test a process with an exported state bootstraps without searching for the installation."""
+        state = workers.capture_state(str(install_dir))
+        output = _run(
+            "from ansys.lumerical.core import autodiscovery\n"
+            "autodiscovery.locate_lumerical_install = None\n"
+            "import lumapi, lumopt2\n"
+            "print(lumapi.InteropPaths.LUMERICALINSTALLDIR, lumopt2.__file__)",
+            **{workers.STATE_VARIABLE: json.dumps(state)},
+        )
+
+        assert output == [str(install_dir), str(install_dir.resolve() / "api" / "python" / "lumopt2" / "__init__.py")]
+
+    def test_initialize(self, install_dir):
+        """Test 03: Test 'initialize' configures spawned pool workers from the state of the parent."""
+        state = workers.capture_state(str(install_dir))
+        executor = ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn"), initializer=workers.initialize, initargs=(state,))
+        with executor:
+            worker_state = executor.submit(workers.capture_state).result()
+
+        assert worker_state["install_dir"] == state["install_dir"]
+        assert worker_state["lumopt2_dir"] == state["lumopt2_dir"]
+
+    @pytest.mark.parametrize("method", ["forkserver", "spawn"])
+    def test_preload(self, install_dir, method):
+        """Test 04: Test 'preload' configures the workers of forkserver and spawn pools without changing the environment."""
+        output = _run(
+            "from concurrent.futures import ProcessPoolExecutor\n"
+            "import os, subprocess, sys\n"
+            "import ansys.lumerical.core as c\n"
+            "from ansys.lumerical.core import workers\n"
+            f"c.InteropPaths.setLumericalInstallPath({str(install_dir)!r})\n"
+            "if __name__ == '__main__':\n"
+            f"    with ProcessPoolExecutor(1, mp_context=workers.preload({method!r})) as executor:\n"
+            "        print(executor.submit(workers.capture_state).result()['install_dir'])\n"
+            "    print(workers.STATE_VARIABLE in os.environ)\n"
+            "    print(subprocess.run([sys.executable, '-c', 'import os; print(%r in os.environ)' % workers.STATE_VARIABLE],"
+            " capture_output=True, text=True).stdout.strip())",
+            PYLUMERICAL_MOCK_ENGINE="1",
+        )
+
+        assert output == [str(install_dir), "False", "False"]